@@ -0,0 +1,4 @@
+"""Benchmark suite for FurlanG2P pipeline stages.
+
+Run ``python -m benchmarks.run --help`` from the repository root.
+"""
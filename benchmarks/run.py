@@ -0,0 +1,302 @@
+"""Standalone benchmark runner for the FurlanG2P pipeline stages.
+
+Each benchmark builds its inputs from a deterministic synthetic corpus, then
+times only the stage call itself. Results are printed as a table and can be
+written as JSON for tracking regressions across releases::
+
+    python -m benchmarks.run --size 20000 --repeat 5 --output bench.json
+    python -m benchmarks.run --stage lexicon --stage evaluator
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from furlan_g2p.__about__ import __version__
+from furlan_g2p.evaluation import BatchEvaluator, Evaluator
+from furlan_g2p.g2p.phonemizer import G2PPhonemizer
+from furlan_g2p.g2p.rules import PhonemeRules
+from furlan_g2p.lexicon import DialectAwareLexicon, LexiconBuilder, LexiconEntry
+from furlan_g2p.normalization.normalizer import Normalizer
+from furlan_g2p.phonology import StressAssigner, Syllabifier
+from furlan_g2p.tokenization.tokenizer import Tokenizer
+
+from .synthetic import synthetic_sentences, synthetic_words
+
+SCHEMA_VERSION = 1
+_DIALECTS = (None, "central", "western", "carnic")
+
+
+@dataclass(slots=True)
+class Corpus:
+    """Precomputed benchmark inputs derived from one synthetic word list."""
+
+    words: list[str]
+    sentences: list[str]
+    phonemes: list[list[str]]
+    entries: list[LexiconEntry]
+    predictions: list[tuple[str, str]]
+    gold: list[tuple[str, str]]
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Timings for one benchmark over all repetitions."""
+
+    name: str
+    items: int
+    repeat: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    max_s: float
+    items_per_s: float
+
+
+Setup = Callable[[Corpus], tuple[Callable[[], object], int]]
+"""Build a timed callable and the number of items it processes."""
+
+
+def build_corpus(size: int, seed: int) -> Corpus:
+    """Create benchmark inputs with ``size`` words.
+
+    Roughly half of the words get lexicon entries (spread over the dialects,
+    some with alternatives), so lookups exercise both hits and misses.
+    Predictions differ from gold on about a third of the words.
+    """
+
+    words = synthetic_words(size, seed=seed)
+    sentences = synthetic_sentences(max(1, size // 8), seed=seed + 1)
+    rules = PhonemeRules()
+    phonemes = [rules.apply(word) for word in words]
+
+    entries: list[LexiconEntry] = []
+    predictions: list[tuple[str, str]] = []
+    gold: list[tuple[str, str]] = []
+    for index, (word, segments) in enumerate(zip(words, phonemes, strict=True)):
+        ipa = "ˈ" + "".join(segments)
+        if index % 2 == 0:
+            dialect = _DIALECTS[(index // 2) % len(_DIALECTS)]
+            alternatives = [ipa.replace("e", "ɛ")] if index % 6 == 0 else []
+            entries.append(
+                LexiconEntry(
+                    lemma=word,
+                    ipa=ipa,
+                    dialect=dialect,
+                    source="synthetic",
+                    confidence=0.9,
+                    alternatives=alternatives,
+                )
+            )
+        predicted = ipa if index % 3 else "".join(segments[::-1])
+        predictions.append((word, predicted))
+        gold.append((word, ipa))
+    return Corpus(words, sentences, phonemes, entries, predictions, gold)
+
+
+def _normalizer(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    normalizer = Normalizer()
+    return lambda: [normalizer.normalize(text) for text in corpus.sentences], len(corpus.sentences)
+
+
+def _tokenizer(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    tokenizer = Tokenizer()
+    normalizer = Normalizer()
+    texts = [normalizer.normalize(text) for text in corpus.sentences]
+
+    def run() -> object:
+        return [
+            tokenizer.split_words(sentence)
+            for text in texts
+            for sentence in tokenizer.split_sentences(text)
+        ]
+
+    return run, len(texts)
+
+
+def _phonemizer(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    phonemizer = G2PPhonemizer(lexicon=DialectAwareLexicon(corpus.entries))
+    return lambda: phonemizer.to_phonemes(corpus.words, dialect="central"), len(corpus.words)
+
+
+def _rules(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    rules = PhonemeRules()
+    return lambda: [rules.apply(word) for word in corpus.words], len(corpus.words)
+
+
+def _syllabifier(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    syllabifier = Syllabifier()
+    return lambda: syllabifier.syllabify_many(corpus.phonemes), len(corpus.phonemes)
+
+
+def _stress(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    batch = Syllabifier().syllabify_many(corpus.phonemes)
+    stress = StressAssigner()
+    return lambda: stress.assign_stress_batch(batch), len(corpus.phonemes)
+
+
+def _lexicon_construct(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    return lambda: DialectAwareLexicon(corpus.entries), len(corpus.entries)
+
+
+def _lexicon_lookup(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    lexicon = DialectAwareLexicon(corpus.entries)
+    queries = [(word, _DIALECTS[index % len(_DIALECTS)]) for index, word in enumerate(corpus.words)]
+
+    def run() -> object:
+        return [lexicon.lookup(word, dialect=dialect) for word, dialect in queries]
+
+    return run, len(queries)
+
+
+def _builder_merge(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    # Every entry is merged twice so half of the merges hit existing keys.
+    entries = corpus.entries + corpus.entries
+
+    def run() -> object:
+        builder = LexiconBuilder()
+        for entry in entries:
+            builder.merge_entry(entry)
+        return builder.build()
+
+    return run, len(entries)
+
+
+def _evaluator(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    evaluator = Evaluator()
+    return lambda: evaluator.evaluate(corpus.predictions, corpus.gold), len(corpus.gold)
+
+
+def _batch_evaluator(corpus: Corpus) -> tuple[Callable[[], object], int]:
+    evaluator = BatchEvaluator()
+    return lambda: evaluator.evaluate(corpus.predictions, corpus.gold), len(corpus.gold)
+
+
+BENCHMARKS: dict[str, Setup] = {
+    "normalizer.normalize": _normalizer,
+    "tokenizer.split": _tokenizer,
+    "phonemizer.to_phonemes": _phonemizer,
+    "rules.apply": _rules,
+    "syllabifier.syllabify_many": _syllabifier,
+    "stress.assign_stress_batch": _stress,
+    "lexicon.construct": _lexicon_construct,
+    "lexicon.lookup": _lexicon_lookup,
+    "builder.merge": _builder_merge,
+    "evaluator.evaluate": _evaluator,
+    "evaluator.batch_evaluate": _batch_evaluator,
+}
+
+
+def run_benchmark(name: str, corpus: Corpus, repeat: int) -> BenchmarkResult:
+    """Time benchmark ``name`` ``repeat`` times.
+
+    Setup runs before every repetition so per-instance caches start cold.
+    """
+
+    timings: list[float] = []
+    items = 0
+    for _ in range(repeat):
+        func, items = BENCHMARKS[name](corpus)
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return BenchmarkResult(
+        name=name,
+        items=items,
+        repeat=repeat,
+        min_s=best,
+        median_s=statistics.median(timings),
+        mean_s=statistics.fmean(timings),
+        max_s=max(timings),
+        items_per_s=items / best if best > 0 else float("inf"),
+    )
+
+
+def select_benchmarks(patterns: list[str] | None) -> list[str]:
+    """Return benchmark names matching any substring in ``patterns``."""
+
+    if not patterns:
+        return list(BENCHMARKS)
+    selected = [name for name in BENCHMARKS if any(pattern in name for pattern in patterns)]
+    if not selected:
+        raise ValueError(f"No benchmark matches {patterns}; available: {', '.join(BENCHMARKS)}")
+    return selected
+
+
+def build_report(
+    results: list[BenchmarkResult], size: int, seed: int, repeat: int
+) -> dict[str, object]:
+    """Assemble the JSON report with environment metadata."""
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "package_version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "size": size,
+        "seed": seed,
+        "repeat": repeat,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the selected benchmarks and print/write the results."""
+
+    parser = argparse.ArgumentParser(description="Benchmark FurlanG2P pipeline stages")
+    parser.add_argument("--size", type=int, default=10_000, help="Synthetic word count")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic corpus seed")
+    parser.add_argument(
+        "--stage",
+        dest="stages",
+        action="append",
+        help="Only run benchmarks whose name contains this text (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON results here")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+    if args.size < 1 or args.repeat < 1:
+        parser.error("--size and --repeat must be positive")
+    try:
+        names = select_benchmarks(args.stages)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    corpus = build_corpus(args.size, args.seed)
+    results: list[BenchmarkResult] = []
+    for name in names:
+        result = run_benchmark(name, corpus, args.repeat)
+        results.append(result)
+        print(
+            f"{name:<28} {result.items:>9} items  min {result.min_s * 1e3:10.2f} ms  "
+            f"median {result.median_s * 1e3:10.2f} ms  {result.items_per_s:14,.0f} items/s",
+            file=sys.stderr,
+        )
+
+    report = build_report(results, size=args.size, seed=args.seed, repeat=args.repeat)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
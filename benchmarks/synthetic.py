@@ -0,0 +1,395 @@
+"""Deterministic synthetic Friulian data for benchmarks and scale tests.
+
+Everything here is driven by an explicit seed, so the same arguments always
+produce byte-identical output. Words are assembled from Friulian orthographic
+syllables (``cj``, ``gj``, circumflex long vowels, ...) and transcribed with
+the project's own rules, syllabifier and stress assigner, so generated lexica
+load cleanly into :class:`~furlan_g2p.lexicon.DialectAwareLexicon`.
+
+Command line usage::
+
+    python -m benchmarks.synthetic words --count 100000 --out words.txt
+    python -m benchmarks.synthetic lexicon --count 2000000 --format jsonl --out lex.jsonl
+    python -m benchmarks.synthetic metadata --count 50000 --out metadata.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import random
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from furlan_g2p.g2p.rules import PhonemeRules
+from furlan_g2p.lexicon import LexiconEntry
+from furlan_g2p.normalization.normalizer import Normalizer
+from furlan_g2p.phonology import StressAssigner, Syllabifier
+
+_ONSETS = [
+    "", "", "", "b", "c", "cj", "ch", "d", "f", "g", "gj", "gh", "j", "l", "m", "n", "p",
+    "r", "s", "t", "v", "z", "fr", "tr", "pr", "gr", "bl", "sc", "str", "ç",
+]  # fmt: skip
+_NUCLEI = [
+    "a", "a", "e", "e", "i", "i", "o", "u", "â", "ê", "î", "ô", "û", "ie", "ue", "à",
+    "è", "ì", "ò", "ù", "ai", "ei", "oi", "au",
+]  # fmt: skip
+_CODAS = ["", "", "", "", "n", "l", "r", "s", "t"]
+
+# Words per rules/syllabification batch when transcribing large lexica.
+_TRANSCRIBE_CHUNK = 4096
+
+DIALECTS = ("central", "western", "carnic")
+
+
+@dataclass(frozen=True, slots=True)
+class LexiconProfile:
+    """Shape of a generated lexicon.
+
+    Attributes:
+        dialect_rates: Probability that a lemma also gets a dialect-specific
+            entry, per dialect. Every lemma always has a universal entry.
+        alternative_weights: Relative weights for 0, 1, 2, ... alternatives.
+        min_confidence: Lower bound of the uniform confidence distribution.
+        source: Source tag written on every entry.
+    """
+
+    dialect_rates: dict[str, float] = field(
+        default_factory=lambda: {"central": 0.10, "western": 0.25, "carnic": 0.15}
+    )
+    alternative_weights: tuple[float, ...] = (0.75, 0.2, 0.05)
+    min_confidence: float = 0.6
+    source: str = "synthetic"
+
+
+def synthetic_word(rng: random.Random) -> str:
+    """Return one pseudo-Friulian word of one to four syllables."""
+
+    syllables = rng.choices((1, 2, 3, 4), weights=(3, 5, 3, 1))[0]
+    return "".join(
+        rng.choice(_ONSETS) + rng.choice(_NUCLEI) + rng.choice(_CODAS) for _ in range(syllables)
+    )
+
+
+def synthetic_words(count: int, seed: int = 0) -> list[str]:
+    """Return ``count`` pseudo-Friulian words (duplicates allowed)."""
+
+    rng = random.Random(seed)
+    return [synthetic_word(rng) for _ in range(count)]
+
+
+def iter_vocabulary(seed: int = 0) -> Iterator[str]:
+    """Yield distinct pseudo-Friulian words forever, in rank order."""
+
+    rng = random.Random(seed)
+    seen: set[str] = set()
+    while True:
+        word = synthetic_word(rng)
+        if word not in seen:
+            seen.add(word)
+            yield word
+
+
+def vocabulary(count: int, seed: int = 0) -> list[str]:
+    """Return ``count`` distinct words; index 0 is the most frequent rank."""
+
+    return list(itertools.islice(iter_vocabulary(seed), count))
+
+
+def zipf_cumulative_weights(size: int, exponent: float = 1.07) -> list[float]:
+    """Cumulative Zipf weights ``1 / rank**exponent`` for ranks ``1..size``."""
+
+    return list(itertools.accumulate(1.0 / rank**exponent for rank in range(1, size + 1)))
+
+
+def zipf_tokens(
+    count: int,
+    words: Sequence[str],
+    seed: int = 0,
+    exponent: float = 1.07,
+) -> list[str]:
+    """Sample ``count`` tokens from ``words`` with Zipfian rank frequencies."""
+
+    rng = random.Random(seed)
+    return rng.choices(words, cum_weights=zipf_cumulative_weights(len(words), exponent), k=count)
+
+
+def synthetic_sentences(
+    count: int,
+    seed: int = 0,
+    max_words: int = 12,
+    vocabulary_size: int = 5000,
+    exponent: float = 1.07,
+) -> list[str]:
+    """Return ``count`` sentences with Zipfian word frequencies.
+
+    Sentences are capitalized, end in punctuation and occasionally contain a
+    number, so they exercise the normalizer as real metadata would.
+    """
+
+    rng = random.Random(seed)
+    words = vocabulary(vocabulary_size, seed=seed)
+    cum_weights = zipf_cumulative_weights(len(words), exponent)
+    sentences: list[str] = []
+    for _ in range(count):
+        tokens = rng.choices(words, cum_weights=cum_weights, k=rng.randint(3, max_words))
+        if rng.random() < 0.2:
+            tokens.insert(rng.randrange(len(tokens)), str(rng.randint(1, 2000)))
+        sentence = " ".join(tokens)
+        sentences.append(sentence[:1].upper() + sentence[1:] + rng.choice(".?!"))
+    return sentences
+
+
+def _dialect_variant(ipa: str, dialect: str) -> str:
+    """Derive a plausible dialect-specific pronunciation from ``ipa``."""
+
+    if dialect == "western":
+        # Western varieties keep long stressed vowels where central shortens.
+        index = ipa.find("ˈ")
+        for pos in range(index + 1, len(ipa)):
+            if ipa[pos] in "aeiouɛɔ":
+                if not ipa.startswith("ː", pos + 1):
+                    return ipa[: pos + 1] + "ː" + ipa[pos + 1 :]
+                break
+        return ipa + "ː" if not ipa.endswith("ː") else ipa
+    if dialect == "carnic" and ipa.endswith("e"):
+        return ipa[:-1] + "o"
+    return ipa.replace("e", "ɛ", 1) if "e" in ipa else ipa.replace("o", "ɔ", 1)
+
+
+def transcribe(words: Sequence[str]) -> list[str]:
+    """Return stress-marked IPA for ``words`` using the project's own rules."""
+
+    rules = PhonemeRules()
+    syllabifier = Syllabifier()
+    stress = StressAssigner()
+    ipa: list[str] = []
+    for start in range(0, len(words), _TRANSCRIBE_CHUNK):
+        chunk = words[start : start + _TRANSCRIBE_CHUNK]
+        batch = syllabifier.syllabify_many([rules.apply(word) for word in chunk])
+        ipa.extend("".join(phonemes) for phonemes in stress.flatten_stressed(batch))
+    return ipa
+
+
+def iter_lexicon_entries(
+    count: int,
+    seed: int = 0,
+    profile: LexiconProfile | None = None,
+) -> Iterator[LexiconEntry]:
+    """Yield exactly ``count`` lexicon entries.
+
+    Lemmas are distinct and carry their frequency rank. Each lemma has one
+    universal entry, optionally followed by dialect-specific entries as set
+    by ``profile``.
+    """
+
+    profile = profile or LexiconProfile()
+    rng = random.Random(seed + 1)
+    alternative_counts = range(len(profile.alternative_weights))
+    words = iter_vocabulary(seed)
+    produced = 0
+    rank = 0
+    while produced < count:
+        chunk = list(itertools.islice(words, min(_TRANSCRIBE_CHUNK, count - produced)))
+        for word, ipa in zip(chunk, transcribe(chunk), strict=True):
+            rank += 1
+            pronunciations: list[tuple[str | None, str]] = [(None, ipa)]
+            pronunciations.extend(
+                (dialect, _dialect_variant(ipa, dialect))
+                for dialect, rate in profile.dialect_rates.items()
+                if rng.random() < rate
+            )
+            for dialect, primary in pronunciations:
+                if produced >= count:
+                    return
+                n_alternatives = rng.choices(alternative_counts, profile.alternative_weights)[0]
+                alternatives = dict.fromkeys(
+                    _dialect_variant(primary, DIALECTS[(rank + i) % len(DIALECTS)])
+                    for i in range(n_alternatives)
+                )
+                yield LexiconEntry(
+                    lemma=word,
+                    ipa=primary,
+                    dialect=dialect,
+                    source=profile.source,
+                    confidence=round(rng.uniform(profile.min_confidence, 1.0), 3),
+                    frequency=rank,
+                    alternatives=[alt for alt in alternatives if alt != primary],
+                )
+                produced += 1
+
+
+def write_lexicon(
+    path: Path,
+    count: int,
+    seed: int = 0,
+    format: str = "tsv",
+    profile: LexiconProfile | None = None,
+) -> int:
+    """Stream a generated lexicon to ``path`` without holding it in memory.
+
+    Args:
+        path: Output file.
+        count: Number of entries to write.
+        seed: Generator seed.
+        format: ``"tsv"`` (extended 7-column layout) or ``"jsonl"``.
+        profile: Dialect/alternative distribution.
+
+    Returns:
+        Number of entries written.
+
+    Raises:
+        ValueError: If ``format`` is not supported.
+    """
+
+    if format not in {"tsv", "jsonl"}:
+        raise ValueError(f"Unsupported lexicon format: {format}")
+    written = 0
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle, delimiter="\t", lineterminator="\n")
+        if format == "tsv":
+            writer.writerow(
+                ["lemma", "ipa", "dialect", "source", "confidence", "frequency", "alternatives"]
+            )
+        for entry in iter_lexicon_entries(count, seed=seed, profile=profile):
+            if format == "tsv":
+                writer.writerow(
+                    [
+                        entry.lemma,
+                        entry.ipa,
+                        entry.dialect or "",
+                        entry.source,
+                        str(entry.confidence),
+                        str(entry.frequency),
+                        json.dumps(entry.alternatives, ensure_ascii=False),
+                    ]
+                )
+            else:
+                record = {
+                    "lemma": entry.lemma,
+                    "ipa": entry.ipa,
+                    "dialect": entry.dialect,
+                    "source": entry.source,
+                    "confidence": entry.confidence,
+                    "frequency": entry.frequency,
+                    "alternatives": entry.alternatives,
+                }
+                handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+            written += 1
+    return written
+
+
+def write_wordlist(path: Path, count: int, seed: int = 0, with_counts: bool = False) -> int:
+    """Write ``count`` distinct words in frequency-rank order.
+
+    With ``with_counts`` each line is ``word<TAB>count`` using Zipfian counts
+    scaled so the rank-1 word occurs one million times; otherwise the file is
+    a plain one-word-per-line list as read by ``furlang2p coverage``.
+    """
+
+    with path.open("w", encoding="utf-8") as handle:
+        for rank, word in enumerate(itertools.islice(iter_vocabulary(seed), count), start=1):
+            if with_counts:
+                handle.write(f"{word}\t{max(1, round(1_000_000 / rank**1.07))}\n")
+            else:
+                handle.write(word + "\n")
+    return count
+
+
+def write_metadata(
+    path: Path,
+    count: int,
+    seed: int = 0,
+    vocabulary_size: int = 20_000,
+    dialect_column: bool = False,
+    delimiter: str = "|",
+) -> int:
+    """Write an LJSpeech-style ``id|text|normalized_text`` metadata file.
+
+    Args:
+        path: Output CSV.
+        count: Number of utterances.
+        seed: Generator seed.
+        vocabulary_size: Distinct words sampled with Zipfian frequencies.
+        dialect_column: Append a fourth column with a dialect tag (usable
+            with ``process_csv(dialect_column=3)``).
+        delimiter: Column delimiter.
+
+    Returns:
+        Number of rows written.
+    """
+
+    normalizer = Normalizer()
+    rng = random.Random(seed + 2)
+    sentences = synthetic_sentences(count, seed=seed, vocabulary_size=vocabulary_size)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(
+            handle, delimiter=delimiter, quoting=csv.QUOTE_NONE, lineterminator="\n"
+        )
+        for index, text in enumerate(sentences, start=1):
+            row = [f"FUR{seed:03d}-{index:07d}", text, normalizer.normalize(text)]
+            if dialect_column:
+                row.append(rng.choice(DIALECTS))
+            writer.writerow(row)
+    return count
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+
+    parser = argparse.ArgumentParser(description="Generate synthetic Friulian data")
+    sub = parser.add_subparsers(dest="kind", required=True)
+    for name, help_text in (
+        ("words", "Distinct words in frequency-rank order"),
+        ("lexicon", "Lexicon TSV/JSONL with dialect entries and alternatives"),
+        ("metadata", "LJSpeech-style metadata CSV with Zipfian token frequencies"),
+    ):
+        command = sub.add_parser(name, help=help_text)
+        command.add_argument("--count", type=int, required=True, help="Items to generate")
+        command.add_argument("--seed", type=int, default=0, help="Generator seed")
+        command.add_argument("--out", type=Path, required=True, help="Output path")
+    sub.choices["words"].add_argument("--with-counts", action="store_true")
+    sub.choices["lexicon"].add_argument("--format", choices=["tsv", "jsonl"], default="tsv")
+    sub.choices["metadata"].add_argument("--vocabulary", type=int, default=20_000)
+    sub.choices["metadata"].add_argument("--dialect-column", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.kind == "words":
+        written = write_wordlist(args.out, args.count, args.seed, with_counts=args.with_counts)
+    elif args.kind == "lexicon":
+        written = write_lexicon(args.out, args.count, args.seed, format=args.format)
+    else:
+        written = write_metadata(
+            args.out,
+            args.count,
+            args.seed,
+            vocabulary_size=args.vocabulary,
+            dialect_column=args.dialect_column,
+        )
+    print(f"Wrote {written} {args.kind} rows to {args.out}")
+    return 0
+
+
+__all__ = [
+    "DIALECTS",
+    "LexiconProfile",
+    "iter_lexicon_entries",
+    "iter_vocabulary",
+    "synthetic_sentences",
+    "synthetic_word",
+    "synthetic_words",
+    "transcribe",
+    "vocabulary",
+    "write_lexicon",
+    "write_metadata",
+    "write_wordlist",
+    "zipf_cumulative_weights",
+    "zipf_tokens",
+]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import click
@@ -15,16 +16,33 @@ from ..phonology import canonicalize_ipa
 from ..services.io_service import IOService
 from ..services.pipeline import PipelineService
 from ..tokenization.tokenizer import Tokenizer
+from .cache import cache as cache_group
 from .evaluate import coverage_command, evaluate_command
 from .lexicon import lexicon as lexicon_group
+from .options import (
+    cache_dir_option,
+    make_pipeline,
+    model_cache_option,
+    model_option,
+    open_word_cache,
+    threshold_option,
+    word_cache_option,
+)
+from .profiling import profile_command
 
 _NORMALIZER = Normalizer()
-_LEXICON = Lexicon.load_seed()
 _RULES = PhonemeRules()
 _TOKENIZER = Tokenizer()
 _IO = IOService()
 
 
+@lru_cache(maxsize=1)
+def _seed_lexicon() -> Lexicon:
+    """Load the seed lexicon on first use (loading may write a snapshot to the cache)."""
+
+    return Lexicon.load_seed()
+
+
 def _split_apostrophes(token: str) -> list[str]:
     """Split ``token`` on apostrophes while keeping them as separate elements."""
 
@@ -55,6 +73,7 @@ def cli() -> None:
 
 
 cli.add_command(lexicon_group)
+cli.add_command(cache_group)
 
 
 @cli.command("normalize")
@@ -109,8 +128,24 @@ def cmd_normalize(inp: str | None, out: str | None, fmt: str, text: tuple[str, .
     help="Output format.",
 )
 @click.option("--sep", default=" ", show_default=True, help="Phoneme separator for plain format.")
+@model_option
+@threshold_option
+@model_cache_option
+@word_cache_option
+@cache_dir_option
 @click.argument("text", nargs=-1)
-def cmd_g2p(inp: str | None, out: str | None, fmt: str, sep: str, text: tuple[str, ...]) -> None:
+def cmd_g2p(
+    inp: str | None,
+    out: str | None,
+    fmt: str,
+    sep: str,
+    model_path: str | None,
+    model_threshold: float,
+    model_cache: str | None,
+    word_cache: bool,
+    cache_dir: str | None,
+    text: tuple[str, ...],
+) -> None:
     """Convert ``text`` to a phoneme sequence."""
 
     if inp and text:
@@ -118,7 +153,12 @@ def cmd_g2p(inp: str | None, out: str | None, fmt: str, sep: str, text: tuple[st
     if not inp and not text:
         raise click.UsageError("No input provided")
 
-    service = PipelineService()
+    service = make_pipeline(
+        model_path,
+        model_threshold,
+        model_cache,
+        open_word_cache(cache_dir) if word_cache else None,
+    )
     raw = _IO.read_text(inp) if inp else " ".join(text)
     norm, phons = service.process_text(raw)
     out_data = (
@@ -136,12 +176,38 @@ def cmd_g2p(inp: str | None, out: str | None, fmt: str, sep: str, text: tuple[st
 @click.option("--in", "inp", required=True, help="Input metadata CSV (LJSpeech-like).")
 @click.option("--out", "out", required=True, help="Output CSV with phonemes added.")
 @click.option("--delim", "delim", default="|", show_default=True, help="CSV delimiter.")
-def cmd_phonemize_csv(inp: str, out: str, delim: str) -> None:
+@click.option(
+    "--two-pass",
+    is_flag=True,
+    default=False,
+    help="Collect the vocabulary first and phonemize each distinct word once.",
+)
+@model_option
+@threshold_option
+@model_cache_option
+@word_cache_option
+@cache_dir_option
+def cmd_phonemize_csv(
+    inp: str,
+    out: str,
+    delim: str,
+    two_pass: bool,
+    model_path: str | None,
+    model_threshold: float,
+    model_cache: str | None,
+    word_cache: bool,
+    cache_dir: str | None,
+) -> None:
     """Batch phonemize an LJSpeech-style CSV file."""
 
-    service = PipelineService()
+    service = make_pipeline(
+        model_path,
+        model_threshold,
+        model_cache,
+        open_word_cache(cache_dir) if word_cache else None,
+    )
     try:
-        service.process_csv(inp, out, delimiter=delim)
+        service.process_csv(inp, out, delimiter=delim, two_pass=two_pass)
     except FileNotFoundError as e:  # pragma: no cover - simple passthrough
         raise click.FileError(str(Path(e.filename))) from e
     except Exception as e:  # pragma: no cover - generic error
@@ -197,7 +263,7 @@ def cmd_ipa(
             raw_ipa = (
                 "".join(_RULES.apply(part))
                 if rules_only
-                else (_LEXICON.get(part) or "".join(_RULES.apply(part)))
+                else (_seed_lexicon().get(part) or "".join(_RULES.apply(part)))
             )
             ipa = canonicalize_ipa(raw_ipa)
             if with_slashes:
@@ -209,6 +275,7 @@ def cmd_ipa(
 
 cli.add_command(evaluate_command)
 cli.add_command(coverage_command)
+cli.add_command(profile_command)
 
 
 def main() -> None:  # pragma: no cover - small wrapper
@@ -0,0 +1,166 @@
+"""CLI commands for the persistent word cache."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import click
+
+from ..lexicon.snapshot import default_snapshot_dir
+from ..services.pipeline import PipelineService
+from .options import (
+    cache_dir_option,
+    make_pipeline,
+    model_cache_option,
+    model_option,
+    open_word_cache,
+    threshold_option,
+)
+
+# Words phonemized per call while warming the cache.
+_WARM_BATCH = 1000
+
+
+def _snapshot_files(cache_dir: str | None) -> list[Path]:
+    """Return the lexicon snapshot files under ``cache_dir`` (or the default directory)."""
+
+    directory = Path(cache_dir) / "lexicon" if cache_dir else default_snapshot_dir()
+    return sorted(directory.glob("*.snapshot")) if directory.is_dir() else []
+
+
+def _read_vocabulary(
+    service: PipelineService,
+    path: Path,
+    column: int | None,
+    delimiter: str,
+) -> list[str]:
+    """Return the distinct tokens of ``path`` in first-seen order.
+
+    Args:
+        service: Pipeline whose normalizer and tokenizer are applied.
+        path: Text file, one text (or CSV row) per line.
+        column: Zero-based column holding the text, or None for whole lines.
+        delimiter: Column delimiter used with ``column``.
+
+    Returns:
+        Distinct normalized tokens.
+    """
+
+    vocabulary: dict[str, None] = {}
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            text = line.rstrip("\n")
+            if column is not None:
+                fields = text.split(delimiter)
+                if len(fields) <= column:
+                    continue
+                text = fields[column]
+            norm = service.normalizer.normalize(text)
+            for sentence in service.tokenizer.split_sentences(norm):
+                vocabulary.update(dict.fromkeys(service.tokenizer.split_words(sentence)))
+    return list(vocabulary)
+
+
+@click.group(name="cache")
+def cache() -> None:
+    """Inspect, clear and pre-fill the persistent word cache and lexicon snapshots."""
+
+
+@cache.command("stats")
+@cache_dir_option
+@click.option("--json", "as_json", is_flag=True, help="Emit stats as JSON.")
+def cmd_cache_stats(cache_dir: str | None, as_json: bool) -> None:
+    """Print the number of cached words, lexicon snapshots and their sizes."""
+
+    word_cache = open_word_cache(cache_dir)
+    stats = word_cache.stats()
+    word_cache.close()
+    snapshots = _snapshot_files(cache_dir)
+    stats["lexicon_snapshots"] = len(snapshots)
+    stats["lexicon_snapshot_bytes"] = sum(path.stat().st_size for path in snapshots)
+    if as_json:
+        click.echo(json.dumps(stats, ensure_ascii=False, indent=2, sort_keys=True))
+        return
+    click.echo(f"Word cache: {stats['path']}")
+    click.echo(f"Entries: {stats['entries']}")
+    click.echo(f"Contexts: {stats['contexts']}")
+    click.echo(f"Size: {stats['size_bytes']} bytes")
+    click.echo(
+        f"Lexicon snapshots: {stats['lexicon_snapshots']} "
+        f"({stats['lexicon_snapshot_bytes']} bytes)"
+    )
+
+
+@cache.command("clear")
+@cache_dir_option
+def cmd_cache_clear(cache_dir: str | None) -> None:
+    """Delete every cached pronunciation and lexicon snapshot."""
+
+    word_cache = open_word_cache(cache_dir)
+    removed = word_cache.clear()
+    word_cache.close()
+    snapshots = _snapshot_files(cache_dir)
+    for path in snapshots:
+        path.unlink(missing_ok=True)
+    click.echo(f"Removed {removed} cached words from {word_cache.path}")
+    click.echo(f"Removed {len(snapshots)} lexicon snapshots")
+
+
+@cache.command("warm")
+@click.argument("input_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--column",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Zero-based column holding the text (e.g. 1 for LJSpeech metadata).",
+)
+@click.option("--delim", "delimiter", default="|", show_default=True, help="Column delimiter.")
+@click.option("--dialect", default=None, help="Dialect to resolve the words for.")
+@cache_dir_option
+@model_option
+@threshold_option
+@model_cache_option
+def cmd_cache_warm(
+    input_file: str,
+    column: int | None,
+    delimiter: str,
+    dialect: str | None,
+    cache_dir: str | None,
+    model_path: str | None,
+    model_threshold: float,
+    model_cache: str | None,
+) -> None:
+    """Resolve every word of INPUT_FILE once and store it in the word cache.
+
+    Use the same --model/--model-threshold/--dialect as the jobs that should
+    benefit: cache entries are keyed by lexicon, rules and model identity.
+    """
+
+    word_cache = open_word_cache(cache_dir)
+    service = make_pipeline(model_path, model_threshold, model_cache, word_cache)
+    words = _read_vocabulary(service, Path(input_file), column, delimiter)
+    active_dialect = dialect or service.default_dialect
+    phonemizer = service.phonemizer
+    known = word_cache.get_many(words, active_dialect, phonemizer.cache_context())
+    missing = [word for word in words if word not in known]
+    skipped = 0
+    for start in range(0, len(missing), _WARM_BATCH):
+        batch = missing[start : start + _WARM_BATCH]
+        try:
+            phonemizer.phonemize_words(batch, dialect=active_dialect)
+        except ValueError:
+            # One word the rules cannot convert fails the whole batch; retry singly.
+            for word in batch:
+                try:
+                    phonemizer.phonemize_words([word], dialect=active_dialect)
+                except ValueError:
+                    skipped += 1
+    word_cache.close()
+    click.echo(
+        f"Warmed {word_cache.path}: {len(words)} words "
+        f"({len(known)} already cached, {skipped} skipped)"
+    )
+
+
+__all__ = ["cache"]
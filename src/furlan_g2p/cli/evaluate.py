@@ -3,20 +3,36 @@
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, TypeVar
 
 import click
 
-from ..evaluation import EvaluationResult, Evaluator, WordResult
+from ..evaluation import BatchEvaluator, EvaluationResult, WordResult
 from ..g2p.lexicon import Lexicon
-from ..g2p.phonemizer import G2PPhonemizer
 from ..g2p.rules import PhonemeRules
+from ..lexicon.fallback import FallbackKey, FallbackTracker
 from ..services.pipeline import PipelineService
+from .options import make_lexicon_pipeline
 
 OutputFormat = Literal["text", "json"]
 CoverageStatus = Literal["lexicon", "rule_only", "oov"]
+PredictionOutcome = tuple[str, str | None]
+"""Predicted IPA plus an error message when prediction failed."""
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Upper bound on items per task sent to a worker process; large enough to
+# amortize pickling, small enough to keep all workers busy near the end.
+_MAX_CHUNK_SIZE = 2048
+
+# Per-process state built once by the pool initializers below.
+_WORKER_STATE: dict[str, Any] = {}
 
 
 @dataclass(frozen=True)
@@ -126,16 +142,6 @@ def _load_wordlist(path: Path) -> list[str]:
     return words
 
 
-def _build_pipeline(lexicon_path: Path | None) -> PipelineService:
-    """Construct a ``PipelineService`` with optional custom lexicon."""
-
-    if lexicon_path is None:
-        return PipelineService()
-    lexicon = Lexicon.load(lexicon_path)
-    phonemizer = G2PPhonemizer(lexicon=lexicon)
-    return PipelineService(phonemizer=phonemizer)
-
-
 def _build_lexicon(lexicon_path: Path | None) -> Lexicon:
     """Load the seed lexicon or a custom lexicon path."""
 
@@ -155,6 +161,116 @@ def _predict_ipa(
     return "".join(phonemes)
 
 
+def _predict_outcome(
+    service: PipelineService,
+    word: str,
+    dialect: str | None,
+) -> PredictionOutcome:
+    """Predict IPA for ``word``, capturing any failure as an error message."""
+
+    try:
+        return _predict_ipa(service, word, dialect=dialect), None
+    except Exception as exc:  # pragma: no cover - defensive CLI fallback
+        return "", str(exc)
+
+
+def _resolve_jobs(jobs: int) -> int:
+    """Return the worker count for ``--jobs`` (``0`` means one per CPU)."""
+
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+
+def _chunked(items: Sequence[_T], size: int) -> Iterator[list[_T]]:
+    """Yield consecutive slices of ``items`` with at most ``size`` elements."""
+
+    for start in range(0, len(items), size):
+        yield list(items[start : start + size])
+
+
+def _parallel_map(
+    func: Callable[[list[_T]], _R],
+    items: Sequence[_T],
+    jobs: int,
+    initializer: Callable[..., None],
+    initargs: tuple[Any, ...],
+) -> list[_R]:
+    """Apply ``func`` to chunks of ``items`` in a process pool.
+
+    Results are returned in input order regardless of which worker finished
+    first, so output is identical to a serial run.
+
+    Args:
+        func: Picklable function mapping a chunk to a chunk result.
+        items: Inputs to distribute.
+        jobs: Number of worker processes.
+        initializer: Called once per worker to build expensive state.
+        initargs: Arguments for ``initializer``.
+
+    Returns:
+        One result per chunk, in input order.
+    """
+
+    size = max(1, min(_MAX_CHUNK_SIZE, -(-len(items) // (jobs * 4))))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=initializer, initargs=initargs
+    ) as executor:
+        return list(executor.map(func, _chunked(items, size)))
+
+
+def _init_prediction_worker(lexicon_path: Path | None) -> None:
+    """Build the worker's pipeline once."""
+
+    _WORKER_STATE["service"] = make_lexicon_pipeline(lexicon_path)
+
+
+def _predict_chunk(
+    items: list[tuple[str, str | None]],
+) -> tuple[list[PredictionOutcome], dict[FallbackKey, int]]:
+    """Predict a chunk of ``(word, dialect)`` pairs inside a worker.
+
+    Returns the outcomes plus the chunk's universal-fallback counters so the
+    parent can report totals.
+    """
+
+    service: PipelineService = _WORKER_STATE["service"]
+    fallbacks = service.phonemizer.fallbacks
+    fallbacks.reset()
+    outcomes = [_predict_outcome(service, word, dialect) for word, dialect in items]
+    return outcomes, fallbacks.counts()
+
+
+def _predict_all(
+    items: Sequence[tuple[str, str | None]],
+    lexicon_path: Path | None,
+    jobs: int = 1,
+    service: PipelineService | None = None,
+) -> list[PredictionOutcome]:
+    """Predict IPA for ``(word, dialect)`` pairs, optionally in parallel.
+
+    Args:
+        items: Words with the dialect to use for each.
+        lexicon_path: Optional custom lexicon, rebuilt in every worker.
+        jobs: Number of worker processes; ``1`` runs in-process.
+        service: Pipeline to use for in-process prediction; worker fallback
+            counters are merged into its phonemizer's tracker.
+
+    Returns:
+        One ``(predicted, error)`` outcome per item, in input order.
+    """
+
+    if jobs <= 1 or len(items) <= 1:
+        active = service if service is not None else make_lexicon_pipeline(lexicon_path)
+        return [_predict_outcome(active, word, dialect) for word, dialect in items]
+    outcomes: list[PredictionOutcome] = []
+    for chunk_outcomes, fallback_counts in _parallel_map(
+        _predict_chunk, items, jobs, _init_prediction_worker, (lexicon_path,)
+    ):
+        outcomes.extend(chunk_outcomes)
+        if service is not None:
+            service.phonemizer.fallbacks.merge(fallback_counts)
+    return outcomes
+
+
 def _word_result_to_payload(result: WordResult) -> dict[str, object]:
     """Serialize a ``WordResult`` into a JSON-safe dictionary."""
 
@@ -173,6 +289,7 @@ def _build_evaluation_payload(
     dialect: str | None,
     failures: list[tuple[str, str]],
     include_details: bool,
+    fallbacks: FallbackTracker | None = None,
 ) -> dict[str, object]:
     """Build a JSON payload for evaluation output."""
 
@@ -190,6 +307,8 @@ def _build_evaluation_payload(
         ],
         "prediction_failures": [{"word": word, "error": error} for word, error in failures],
     }
+    if fallbacks is not None:
+        payload["universal_fallbacks"] = fallbacks.report()
     if include_details:
         payload["details"] = [_word_result_to_payload(detail) for detail in result.details]
     return payload
@@ -200,6 +319,7 @@ def _format_evaluation_text(
     show_errors: bool,
     include_details: bool,
     failures: list[tuple[str, str]],
+    fallbacks: FallbackTracker | None = None,
 ) -> str:
     """Render evaluation metrics in human-readable text."""
 
@@ -216,6 +336,8 @@ def _format_evaluation_text(
 
     if failures:
         lines.append(f"Prediction failures: {len(failures)}")
+    if fallbacks is not None and fallbacks.total:
+        lines.append(fallbacks.summary())
 
     if include_details:
         lines.append("Details:")
@@ -259,17 +381,50 @@ def _classify_word(
     return "rule_only" if rule_output else "oov"
 
 
+def _init_coverage_worker(lexicon_path: Path | None, dialect: str | None) -> None:
+    """Load the worker's lexicon and rules once."""
+
+    _WORKER_STATE["lexicon"] = _build_lexicon(lexicon_path)
+    _WORKER_STATE["rules"] = PhonemeRules()
+    _WORKER_STATE["dialect"] = dialect
+
+
+def _classify_chunk(words: list[str]) -> list[CoverageStatus]:
+    """Classify a chunk of words inside a worker."""
+
+    lexicon: Lexicon = _WORKER_STATE["lexicon"]
+    rules: PhonemeRules = _WORKER_STATE["rules"]
+    dialect: str | None = _WORKER_STATE["dialect"]
+    return [_classify_word(word, lexicon, rules, dialect) for word in words]
+
+
 def _analyze_coverage(
     words: list[str],
     lexicon: Lexicon,
     rules: PhonemeRules,
     dialect: str | None,
+    jobs: int = 1,
+    lexicon_path: Path | None = None,
 ) -> CoverageReport:
-    """Compute coverage classifications and aggregate counters."""
+    """Compute coverage classifications and aggregate counters.
+
+    With ``jobs > 1`` classification runs in a process pool whose workers
+    load ``lexicon_path`` themselves; records keep the wordlist order.
+    """
 
+    if jobs <= 1 or len(words) <= 1:
+        statuses = [_classify_word(word, lexicon, rules, dialect) for word in words]
+    else:
+        statuses = [
+            status
+            for chunk in _parallel_map(
+                _classify_chunk, words, jobs, _init_coverage_worker, (lexicon_path, dialect)
+            )
+            for status in chunk
+        ]
     records = [
-        CoverageRecord(word=word, status=_classify_word(word, lexicon, rules, dialect))
-        for word in words
+        CoverageRecord(word=word, status=status)
+        for word, status in zip(words, statuses, strict=True)
     ]
     lexicon_hits = sum(1 for item in records if item.status == "lexicon")
     rule_only_hits = sum(1 for item in records if item.status == "rule_only")
@@ -407,6 +562,15 @@ def _emit_output(content: str, output_path: Path | None) -> None:
     default=None,
     help="Custom lexicon TSV/JSONL path.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Worker processes (0 = one per CPU).",
+)
 def evaluate_command(
     gold_file: str,
     dialect: str | None,
@@ -414,6 +578,7 @@ def evaluate_command(
     fmt: OutputFormat,
     verbose: bool,
     lexicon_path: str | None,
+    jobs: int,
 ) -> None:
     """Evaluate G2P output against a gold TSV file."""
 
@@ -421,24 +586,28 @@ def evaluate_command(
     output_file_path = Path(output_path) if output_path is not None else None
     lexicon_file_path = Path(lexicon_path) if lexicon_path is not None else None
 
+    workers = _resolve_jobs(jobs)
     try:
         gold_entries = _load_gold_entries(gold_file_path)
-        service = _build_pipeline(lexicon_file_path)
-        evaluator = Evaluator()
+        service = make_lexicon_pipeline(lexicon_file_path)
+        evaluator = BatchEvaluator()
     except (OSError, ValueError) as exc:
         raise click.ClickException(str(exc)) from exc
 
+    outcomes = _predict_all(
+        [(entry.word, dialect or entry.dialect) for entry in gold_entries],
+        lexicon_path=lexicon_file_path,
+        jobs=workers,
+        service=service,
+    )
+
     predictions: list[tuple[str, str]] = []
     gold: list[tuple[str, str]] = []
     failures: list[tuple[str, str]] = []
 
-    for entry in gold_entries:
-        active_dialect = dialect or entry.dialect
-        try:
-            predicted = _predict_ipa(service, entry.word, dialect=active_dialect)
-        except Exception as exc:  # pragma: no cover - defensive CLI fallback
-            predicted = ""
-            failures.append((entry.word, str(exc)))
+    for entry, (predicted, error) in zip(gold_entries, outcomes, strict=True):
+        if error is not None:
+            failures.append((entry.word, error))
         predictions.append((entry.word, predicted))
         gold.append((entry.word, entry.ipa))
 
@@ -449,6 +618,7 @@ def evaluate_command(
         dialect=dialect,
         failures=failures,
         include_details=verbose,
+        fallbacks=service.phonemizer.fallbacks,
     )
     stdout_content = (
         _render_json(summary_payload)
@@ -458,6 +628,7 @@ def evaluate_command(
             show_errors=verbose,
             include_details=False,
             failures=failures,
+            fallbacks=service.phonemizer.fallbacks,
         )
     )
     click.echo(stdout_content)
@@ -469,6 +640,7 @@ def evaluate_command(
             dialect=dialect,
             failures=failures,
             include_details=True,
+            fallbacks=service.phonemizer.fallbacks,
         )
         detailed_content = (
             _render_json(detailed_payload)
@@ -478,6 +650,7 @@ def evaluate_command(
                 show_errors=True,
                 include_details=True,
                 failures=failures,
+                fallbacks=service.phonemizer.fallbacks,
             )
         )
         _emit_output(detailed_content, output_file_path)
@@ -521,6 +694,15 @@ def evaluate_command(
     default=False,
     help="Include OOV word list in output.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    "jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Worker processes (0 = one per CPU).",
+)
 def coverage_command(
     wordlist_file: str,
     lexicon_path: str | None,
@@ -528,6 +710,7 @@ def coverage_command(
     output_path: str | None,
     fmt: OutputFormat,
     show_oov: bool,
+    jobs: int,
 ) -> None:
     """Analyze lexicon/rule coverage for a wordlist."""
 
@@ -542,7 +725,14 @@ def coverage_command(
     except (OSError, ValueError) as exc:
         raise click.ClickException(str(exc)) from exc
 
-    report = _analyze_coverage(words=words, lexicon=lexicon, rules=rules, dialect=dialect)
+    report = _analyze_coverage(
+        words=words,
+        lexicon=lexicon,
+        rules=rules,
+        dialect=dialect,
+        jobs=_resolve_jobs(jobs),
+        lexicon_path=lexicon_file_path,
+    )
     summary_payload = _build_coverage_payload(
         report=report,
         wordlist_file=wordlist_file_path,
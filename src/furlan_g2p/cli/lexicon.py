@@ -10,6 +10,7 @@ import click
 from ..lexicon import (
     LexiconBuilder,
     LexiconEntry,
+    SqliteLexiconStore,
     ValidationIssue,
     detect_format,
     read_jsonl,
@@ -17,6 +18,7 @@ from ..lexicon import (
     write_jsonl,
     write_tsv,
 )
+from ..ml.joint_ngram import JointNgramModel
 
 _WARNING_ISSUE_KINDS: set[str] = {"duplicate_pronunciation"}
 
@@ -149,8 +151,15 @@ def _load_entries(path: Path) -> list[LexiconEntry]:
         return read_jsonl(path)
     if file_format == "tsv":
         return read_tsv(path, format="extended")
+    if file_format == "sqlite":
+        store = SqliteLexiconStore(path)
+        try:
+            return list(store)
+        finally:
+            store.close()
     raise click.ClickException(
-        f"Unsupported lexicon format for '{path}'. Use .tsv/.txt or .jsonl/.ndjson."
+        f"Unsupported lexicon format for '{path}'. "
+        "Use .tsv/.txt, .jsonl/.ndjson or .sqlite/.db."
     )
 
 
@@ -194,10 +203,10 @@ def lexicon() -> None:
     "--format",
     "-f",
     "output_format",
-    type=click.Choice(["tsv", "jsonl"], case_sensitive=False),
+    type=click.Choice(["tsv", "jsonl", "sqlite"], case_sensitive=False),
     default="jsonl",
     show_default=True,
-    help="Output lexicon format.",
+    help="Output lexicon format (sqlite is opened in place by lookups).",
 )
 @click.option(
     "--source-type",
@@ -244,7 +253,9 @@ def cmd_lexicon_build(
                 click.echo(f"Ingested {ingested} entries from {input_file}")
 
         validation_issues = builder.validate() if run_validation else []
-        export_format = "jsonl" if output_format.lower() == "jsonl" else "tsv_extended"
+        export_format = output_format.lower()
+        if export_format == "tsv":
+            export_format = "tsv_extended"
         builder.export(output_target, format=export_format)
 
         entries = builder.build()
@@ -411,6 +422,55 @@ def cmd_lexicon_export(
         raise click.ClickException(str(exc)) from exc
 
 
+@lexicon.command("train-model")
+@click.argument("input_file", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output_file", type=click.Path(dir_okay=False))
+@click.option(
+    "--order",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Graphone n-gram order.",
+)
+@click.option(
+    "--iterations",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="EM iterations for the grapheme-phoneme alignment.",
+)
+@click.option(
+    "--dialect",
+    type=str,
+    default=None,
+    help="Train on this dialect plus universal entries only.",
+)
+def cmd_lexicon_train_model(
+    input_file: str,
+    output_file: str,
+    order: int,
+    iterations: int,
+    dialect: str | None,
+) -> None:
+    """Train a joint n-gram exception model for out-of-lexicon words."""
+
+    try:
+        entries = _load_entries(Path(input_file))
+        dialect_value = dialect.strip().lower() if dialect else None
+        model = JointNgramModel.train(
+            entries, order=order, iterations=iterations, dialect=dialect_value
+        )
+        model.save(output_file)
+    except (TypeError, ValueError) as exc:
+        raise click.ClickException(str(exc)) from exc
+
+    info = model.get_model_info()
+    click.echo(
+        f"Trained order-{order} model on {info['words']} words "
+        f"({info['graphones']} graphones, {info['ngrams']} n-grams) -> {output_file}"
+    )
+
+
 @lexicon.command("validate")
 @click.argument("lexicon_file", type=click.Path(exists=True, dir_okay=False))
 @click.option("--strict", is_flag=True, help="Treat warnings as errors.")
@@ -0,0 +1,123 @@
+"""Pipeline options shared by several CLI commands."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+
+from ..g2p.lexicon import Lexicon
+from ..g2p.phonemizer import G2PPhonemizer
+from ..g2p.word_cache import WordCache
+from ..ml import CachedExceptionModel, IExceptionModel, JointNgramModel
+from ..services.pipeline import PipelineService
+
+
+def make_pipeline(
+    model_path: str | None,
+    threshold: float,
+    cache_path: str | None = None,
+    word_cache: WordCache | None = None,
+) -> PipelineService:
+    """Build a pipeline, optionally with a (cached) joint n-gram model for lexicon misses.
+
+    Args:
+        model_path: Joint n-gram model file, or None for lexicon + rules only.
+        threshold: Minimum accepted model confidence.
+        cache_path: Optional SQLite file caching model predictions.
+        word_cache: Optional persistent word cache for the phonemizer.
+
+    Returns:
+        Configured pipeline.
+
+    Raises:
+        click.UsageError: If ``cache_path`` is given without ``model_path``.
+    """
+
+    if model_path is None:
+        if cache_path is not None:
+            raise click.UsageError("--model-cache requires --model")
+        return PipelineService(word_cache=word_cache)
+    try:
+        model: IExceptionModel = JointNgramModel.load(model_path)
+    except ValueError as exc:
+        raise click.ClickException(f"Cannot load model {model_path}: {exc}") from exc
+    if cache_path is not None:
+        model = CachedExceptionModel(model, cache_path)
+    service = PipelineService(exception_model=model, word_cache=word_cache)
+    service.phonemizer.model_threshold = threshold
+    return service
+
+
+def make_lexicon_pipeline(lexicon_path: Path | None) -> PipelineService:
+    """Build a pipeline, optionally reading a custom lexicon instead of the seed.
+
+    Args:
+        lexicon_path: TSV, JSONL or SQLite lexicon, or None for the seed lexicon.
+
+    Returns:
+        Configured pipeline.
+    """
+
+    if lexicon_path is None:
+        return PipelineService()
+    return PipelineService(phonemizer=G2PPhonemizer(lexicon=Lexicon.load(lexicon_path)))
+
+
+def open_word_cache(cache_dir: str | None) -> WordCache:
+    """Open ``words.sqlite`` in ``cache_dir`` (or the default cache directory).
+
+    Args:
+        cache_dir: Cache directory, or None for ``default_cache_dir()``.
+
+    Returns:
+        Word cache (the file is created on first use).
+    """
+
+    return WordCache(Path(cache_dir) / "words.sqlite" if cache_dir else None)
+
+
+model_option = click.option(
+    "--model",
+    "model_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Joint n-gram model (lexicon train-model) for out-of-lexicon words.",
+)
+threshold_option = click.option(
+    "--model-threshold",
+    type=click.FloatRange(min=0.0, max=1.0),
+    default=0.5,
+    show_default=True,
+    help="Minimum model confidence; less confident words use the rules.",
+)
+model_cache_option = click.option(
+    "--model-cache",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="SQLite file caching --model predictions across runs.",
+)
+word_cache_option = click.option(
+    "--word-cache",
+    is_flag=True,
+    default=False,
+    help="Reuse and store resolved pronunciations in the persistent word cache.",
+)
+cache_dir_option = click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Cache directory [default: $FURLAN_G2P_CACHE_DIR or ~/.cache/furlan_g2p].",
+)
+
+
+__all__ = [
+    "cache_dir_option",
+    "make_lexicon_pipeline",
+    "make_pipeline",
+    "model_cache_option",
+    "model_option",
+    "open_word_cache",
+    "threshold_option",
+    "word_cache_option",
+]
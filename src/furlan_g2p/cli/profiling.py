@@ -0,0 +1,294 @@
+"""CLI command for profiling the pipeline over an input file."""
+
+from __future__ import annotations
+
+import cProfile
+import csv
+import io
+import pstats
+import time
+import tracemalloc
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+import click
+
+from ..services.pipeline import PipelineService
+from .options import make_lexicon_pipeline
+
+InputFormat = Literal["auto", "text", "csv"]
+
+STAGE_MODULES: tuple[str, ...] = ("normalization", "tokenization", "g2p", "phonology", "lexicon")
+"""Subpackages of ``furlan_g2p`` reported as pipeline stages."""
+
+_PACKAGE_MARKER = "furlan_g2p"
+_OTHER_PACKAGE = "other"
+_EXTERNAL = "external"
+
+# pstats function key: (filename, line number, function name).
+_FuncKey = tuple[str, int, str]
+
+
+@dataclass
+class ProfileReport:
+    """Aggregated result of one profiling run.
+
+    Attributes:
+        texts: Number of input texts processed
+        phonemes: Number of phonemes produced
+        wall_seconds: Wall time of the profiled run
+        stage_seconds: Self time per stage, external callees charged to
+            the calling stage
+        top_functions: Text of the top functions table from ``pstats``
+        peak_memory: Peak traced memory in bytes (``tracemalloc`` only)
+        stage_memory: Bytes still allocated at the end per stage
+    """
+
+    texts: int
+    phonemes: int
+    wall_seconds: float
+    stage_seconds: dict[str, float]
+    top_functions: str
+    peak_memory: int | None = None
+    stage_memory: dict[str, int] = field(default_factory=dict)
+
+
+def _stage_for_path(filename: str) -> str:
+    """Map a source path to a pipeline stage name.
+
+    Args:
+        filename: Code object file name as recorded by the profiler.
+
+    Returns:
+        A name from ``STAGE_MODULES``, ``"other"`` for remaining package
+        modules (services, cli, ...) or ``"external"``.
+    """
+
+    parts = Path(filename).parts
+    if _PACKAGE_MARKER not in parts:
+        return _EXTERNAL
+    index = len(parts) - 1 - parts[::-1].index(_PACKAGE_MARKER)
+    if index + 1 < len(parts) and parts[index + 1] in STAGE_MODULES:
+        return parts[index + 1]
+    return _OTHER_PACKAGE
+
+
+def _aggregate_stage_seconds(stats: pstats.Stats) -> dict[str, float]:
+    """Sum self time per stage.
+
+    Time spent in functions outside the package (``re``, ``unicodedata``,
+    builtins, ...) is charged to the package function that called them, so
+    each stage includes the library work it triggered.
+    """
+
+    raw: dict[_FuncKey, Any] = stats.stats  # type: ignore[attr-defined]
+    totals: dict[str, float] = {}
+    for func, (_cc, _nc, tottime, _ct, callers) in raw.items():
+        stage = _stage_for_path(func[0])
+        if stage != _EXTERNAL or not callers:
+            totals[stage] = totals.get(stage, 0.0) + tottime
+            continue
+        for caller, caller_stats in callers.items():
+            caller_stage = _stage_for_path(caller[0])
+            totals[caller_stage] = totals.get(caller_stage, 0.0) + caller_stats[2]
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def _aggregate_stage_memory(snapshot: tracemalloc.Snapshot) -> dict[str, int]:
+    """Sum live allocation sizes per stage from a ``tracemalloc`` snapshot."""
+
+    totals: dict[str, int] = {}
+    for stat in snapshot.statistics("filename"):
+        stage = _stage_for_path(stat.traceback[0].filename)
+        totals[stage] = totals.get(stage, 0) + stat.size
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def _iter_texts(path: Path, input_format: InputFormat, delimiter: str) -> Iterator[str]:
+    """Yield texts from a plain file (one per line) or LJSpeech-style CSV."""
+
+    if input_format == "auto":
+        input_format = "csv" if path.suffix.lower() in {".csv", ".psv"} else "text"
+    with path.open("r", encoding="utf-8") as handle:
+        if input_format == "csv":
+            for row in csv.reader(handle, delimiter=delimiter):
+                if len(row) >= 2 and row[1].strip():
+                    yield row[1]
+            return
+        for line in handle:
+            if line.strip():
+                yield line.rstrip("\n")
+
+
+def run_profile(
+    service: PipelineService,
+    texts: list[str],
+    dialect: str | None = None,
+    memory: bool = False,
+    sort: str = "tottime",
+    top: int = 20,
+) -> tuple[ProfileReport, pstats.Stats]:
+    """Run ``service.process_text`` over ``texts`` under ``cProfile``.
+
+    Args:
+        service: Pipeline to profile.
+        texts: Input texts.
+        dialect: Optional dialect passed to every call.
+        memory: Also trace allocations with ``tracemalloc``.
+        sort: ``pstats`` sort key for the top functions table.
+        top: Number of functions in the top table.
+
+    Returns:
+        The aggregated report and the raw ``pstats.Stats``.
+    """
+
+    profiler = cProfile.Profile()
+    if memory:
+        tracemalloc.start()
+    phonemes_out = 0
+    started = time.perf_counter()
+    profiler.enable()
+    try:
+        for text in texts:
+            _normalized, phonemes = service.process_text(text, dialect=dialect)
+            phonemes_out += len(phonemes)
+    finally:
+        profiler.disable()
+        wall = time.perf_counter() - started
+        peak_memory: int | None = None
+        stage_memory: dict[str, int] = {}
+        if memory:
+            _current, peak_memory = tracemalloc.get_traced_memory()
+            stage_memory = _aggregate_stage_memory(tracemalloc.take_snapshot())
+            tracemalloc.stop()
+
+    buffer = io.StringIO()
+    stats = pstats.Stats(profiler, stream=buffer)
+    stats.sort_stats(sort).print_stats(top)
+    report = ProfileReport(
+        texts=len(texts),
+        phonemes=phonemes_out,
+        wall_seconds=wall,
+        stage_seconds=_aggregate_stage_seconds(stats),
+        top_functions=buffer.getvalue().strip(),
+        peak_memory=peak_memory,
+        stage_memory=stage_memory,
+    )
+    return report, stats
+
+
+def _format_bytes(size: int) -> str:
+    """Return ``size`` in KiB/MiB with one decimal."""
+
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MiB"
+    return f"{size / 1024:.1f} KiB"
+
+
+def format_profile_report(report: ProfileReport) -> str:
+    """Render a ``ProfileReport`` as a short text report."""
+
+    profiled = sum(report.stage_seconds.values())
+    lines = [
+        f"Texts: {report.texts}",
+        f"Phonemes: {report.phonemes}",
+        f"Wall time: {report.wall_seconds:.3f}s",
+        "Time by stage (self time, external calls charged to caller):",
+    ]
+    for stage, seconds in report.stage_seconds.items():
+        share = seconds / profiled * 100.0 if profiled > 0 else 0.0
+        lines.append(f"  {stage:<14} {seconds:10.4f}s {share:6.1f}%")
+    if report.peak_memory is not None:
+        lines.append(f"Peak traced memory: {_format_bytes(report.peak_memory)}")
+        lines.append("Live allocations by stage:")
+        lines.extend(
+            f"  {stage:<14} {_format_bytes(size):>12}"
+            for stage, size in report.stage_memory.items()
+        )
+    lines.append("Top functions:")
+    lines.append(report.top_functions)
+    return "\n".join(lines)
+
+
+@click.command("profile")
+@click.argument("input_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--input-format",
+    "input_format",
+    type=click.Choice(["auto", "text", "csv"], case_sensitive=False),
+    default="auto",
+    show_default=True,
+    help="Plain text (one text per line) or LJSpeech CSV; auto uses the file suffix.",
+)
+@click.option("--delim", "delim", default="|", show_default=True, help="CSV delimiter.")
+@click.option("--dialect", "dialect", type=str, default=None, help="Dialect for every text.")
+@click.option(
+    "--lexicon",
+    "lexicon_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Custom lexicon TSV/JSONL path.",
+)
+@click.option(
+    "--pstats",
+    "pstats_path",
+    type=click.Path(dir_okay=False),
+    default="furlang2p.pstats",
+    show_default=True,
+    help="Where to write the raw profile (load with pstats or snakeviz).",
+)
+@click.option(
+    "--report",
+    "report_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Also write the text report to this file.",
+)
+@click.option(
+    "--memory",
+    is_flag=True,
+    default=False,
+    help="Trace allocations with tracemalloc (slower).",
+)
+@click.option(
+    "--sort",
+    type=click.Choice(["tottime", "cumulative", "ncalls"], case_sensitive=False),
+    default="tottime",
+    show_default=True,
+    help="Sort key for the top functions table.",
+)
+@click.option("--top", type=click.IntRange(min=1), default=20, show_default=True)
+def profile_command(
+    input_file: str,
+    input_format: InputFormat,
+    delim: str,
+    dialect: str | None,
+    lexicon_path: str | None,
+    pstats_path: str,
+    report_path: str | None,
+    memory: bool,
+    sort: str,
+    top: int,
+) -> None:
+    """Profile the pipeline over INPUT_FILE and report hotspots by stage."""
+
+    try:
+        texts = list(_iter_texts(Path(input_file), input_format, delim))
+        service = make_lexicon_pipeline(Path(lexicon_path) if lexicon_path else None)
+    except (OSError, ValueError) as exc:
+        raise click.ClickException(str(exc)) from exc
+    if not texts:
+        raise click.ClickException("Input file contains no texts")
+
+    report, stats = run_profile(service, texts, dialect=dialect, memory=memory, sort=sort, top=top)
+    stats.dump_stats(pstats_path)
+    content = format_profile_report(report)
+    click.echo(content)
+    click.echo(f"Profile written to {pstats_path}")
+    if report_path is not None:
+        Path(report_path).write_text(content + "\n", encoding="utf-8")
+
+
+__all__ = ["ProfileReport", "format_profile_report", "profile_command", "run_profile"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
@@ -30,6 +31,20 @@ def _load_mapping(path: str | Path) -> dict[str, Any]:
     return data
 
 
+def default_cache_dir() -> Path:
+    """Return the directory for persistent caches.
+
+    ``$FURLAN_G2P_CACHE_DIR`` when set, else ``$XDG_CACHE_HOME/furlan_g2p``,
+    else ``~/.cache/furlan_g2p``. The directory is not created.
+    """
+
+    configured = os.environ.get("FURLAN_G2P_CACHE_DIR")
+    if configured:
+        return Path(configured).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base).expanduser() / "furlan_g2p"
+
+
 def load_normalizer_config(path: str | Path) -> NormalizerConfig:
     """Load a :class:`NormalizerConfig` from a JSON or YAML file."""
 
@@ -45,6 +60,7 @@ def load_tokenizer_config(path: str | Path) -> TokenizerConfig:
 
 
 __all__ = [
+    "default_cache_dir",
     "load_normalizer_config",
     "load_tokenizer_config",
     "NormalizerConfig",
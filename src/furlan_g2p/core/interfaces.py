@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from furlan_g2p.evaluation.types import EvaluationResult
+    from furlan_g2p.lexicon.bloom import BloomFilter
     from furlan_g2p.lexicon.builder import ValidationIssue
     from furlan_g2p.lexicon.schema import LexiconEntry
 
@@ -187,6 +188,72 @@ class ILexiconBuilder(ABC):
         raise NotImplementedError
 
 
+class ILexiconStore(ABC):
+    """Interface for read-only storage of normalized lexicon entries.
+
+    Stores hold at most one entry per ``(lemma, dialect)`` key; lemmas are
+    already normalized by the caller.
+
+    Attributes:
+        prefers_batches: True when :meth:`candidates_many` is much cheaper
+            than repeated :meth:`candidates` calls (e.g. database backends).
+    """
+
+    prefers_batches: bool = False
+
+    @abstractmethod
+    def candidates(self, lemma: str) -> list[LexiconEntry]:
+        """Return every entry stored for ``lemma``.
+
+        Args:
+            lemma: Normalized lemma.
+
+        Returns:
+            Entries for all dialects (universal included) in insertion order,
+            or an empty list.
+        """
+        raise NotImplementedError
+
+    def candidates_many(self, lemmas: Iterable[str]) -> dict[str, list[LexiconEntry]]:
+        """Return candidates for several lemmas at once.
+
+        Args:
+            lemmas: Normalized lemmas; duplicates are allowed.
+
+        Returns:
+            Mapping from each lemma that has entries to its candidates.
+        """
+        found: dict[str, list[LexiconEntry]] = {}
+        for lemma in lemmas:
+            entries = self.candidates(lemma)
+            if entries:
+                found[lemma] = entries
+        return found
+
+    @abstractmethod
+    def lemma_count(self) -> int:
+        """Return the number of distinct lemmas."""
+        raise NotImplementedError
+
+    def iter_lemmas(self) -> Iterator[str]:
+        """Iterate distinct normalized lemmas."""
+        return iter(dict.fromkeys(entry.lemma for entry in self))
+
+    def bloom_filter(self) -> BloomFilter | None:
+        """Return a prebuilt filter over :meth:`iter_lemmas`, if the store has one."""
+        return None
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[LexiconEntry]:
+        """Iterate all stored entries."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        raise NotImplementedError
+
+
 __all__ = [
     "INormalizer",
     "ITokenizer",
@@ -195,4 +262,5 @@ __all__ = [
     "IStressAssigner",
     "IEvaluator",
     "ILexiconBuilder",
+    "ILexiconStore",
 ]
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from furlan_g2p.evaluation.batch import BatchEvaluator
 from furlan_g2p.evaluation.metrics import Evaluator
 from furlan_g2p.evaluation.types import EvaluationResult, WordResult
 
 __all__ = [
+    "BatchEvaluator",
     "Evaluator",
     "EvaluationResult",
     "WordResult",
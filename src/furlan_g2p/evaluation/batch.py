@@ -0,0 +1,380 @@
+"""Batch evaluation engine computing all metrics from one encoding pass."""
+
+from __future__ import annotations
+
+import unicodedata
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from furlan_g2p.evaluation.metrics import (
+    Evaluator,
+    _extract_stress_position,
+    _levenshtein_alignment,
+    _levenshtein_distance,
+    _normalize_ipa,
+)
+from furlan_g2p.evaluation.types import EvaluationResult, WordResult
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+# Pairs per vectorized DP chunk; bounds the (chunk x gold_length) work arrays.
+_CHUNK_SIZE = 8192
+_PAD = -1
+_MARK_CATEGORIES = frozenset({"Mn", "Mc", "Me"})
+
+
+@dataclass(slots=True)
+class EncodedStrings:
+    """IPA strings normalized, tokenized and integer-coded exactly once.
+
+    Attributes:
+        ids: Per input string, the index of its normalized form
+        normalized: Unique normalized strings
+        tokens: Phoneme tokens of each unique normalized string
+        codes: Integer phoneme codes of each unique normalized string
+        stress: Primary stress position per unique string (-1 if unmarked)
+    """
+
+    ids: list[int] = field(default_factory=list)
+    normalized: list[str] = field(default_factory=list)
+    tokens: list[list[str]] = field(default_factory=list)
+    codes: list[list[int]] = field(default_factory=list)
+    stress: list[int] = field(default_factory=list)
+
+
+class _Encoder:
+    """Shared vocabulary for one evaluation run."""
+
+    def __init__(self) -> None:
+        self._raw_ids: dict[str, int] = {}
+        self._normalized_ids: dict[str, int] = {}
+        self._token_codes: dict[str, int] = {}
+        self._is_mark: dict[str, bool] = {}
+        self.strings = EncodedStrings()
+
+    def encode(self, values: Sequence[str]) -> list[int]:
+        return [self._encode_one(value) for value in values]
+
+    def _encode_one(self, raw: str) -> int:
+        uid = self._raw_ids.get(raw)
+        if uid is not None:
+            return uid
+        normalized = _normalize_ipa(raw)
+        uid = self._normalized_ids.get(normalized)
+        if uid is None:
+            uid = len(self.strings.normalized)
+            tokens = self._tokenize(normalized)
+            self.strings.normalized.append(normalized)
+            self.strings.tokens.append(tokens)
+            self.strings.codes.append(
+                [self._token_codes.setdefault(token, len(self._token_codes)) for token in tokens]
+            )
+            position = _extract_stress_position(normalized)
+            self.strings.stress.append(-1 if position is None else position)
+            self._normalized_ids[normalized] = uid
+        self._raw_ids[raw] = uid
+        return uid
+
+    def _tokenize(self, ipa: str) -> list[str]:
+        """Group combining marks with their base, as ``_tokenize_phonemes`` does."""
+
+        tokens: list[str] = []
+        is_mark = self._is_mark
+        for char in ipa:
+            mark = is_mark.get(char)
+            if mark is None:
+                mark = unicodedata.category(char) in _MARK_CATEGORIES
+                is_mark[char] = mark
+            if mark and tokens:
+                tokens[-1] += char
+            else:
+                tokens.append(char)
+        return tokens
+
+
+def _vectorized_distances(
+    pred_codes: Any,
+    pred_len: Any,
+    gold_codes: Any,
+    gold_len: Any,
+) -> Any:
+    """Edit distances for aligned rows of padded code matrices.
+
+    Runs the DP one predicted position at a time across every pair; the
+    insertion recurrence within a row is a running minimum, so each row is a
+    handful of array operations regardless of batch size.
+    """
+
+    n = pred_len.shape[0]
+    out = np.where(pred_len == 0, gold_len, 0).astype(np.int64)
+    if n == 0:
+        return out
+    lp_max = int(pred_len.max())
+    lg_max = int(gold_len.max())
+    steps = np.arange(lg_max + 1, dtype=np.int64)
+    prev = np.broadcast_to(steps, (n, lg_max + 1)).copy()
+    rows = np.arange(n)
+    gold = gold_codes[:, :lg_max]
+    for i in range(1, lp_max + 1):
+        mismatch = pred_codes[:, i - 1 : i] != gold
+        vals = np.empty_like(prev)
+        vals[:, 0] = i
+        np.minimum(prev[:, :-1] + mismatch, prev[:, 1:] + 1, out=vals[:, 1:])
+        cur = np.minimum.accumulate(vals - steps, axis=1) + steps
+        done = pred_len == i
+        if done.any():
+            out[done] = cur[rows[done], gold_len[done]]
+        prev = cur
+    return out
+
+
+class BatchEvaluator(Evaluator):
+    """Evaluator that encodes each IPA string once and scores pairs in bulk.
+
+    Every distinct string is normalized, tokenized and mapped to integer
+    phoneme codes a single time per call.  Exact matches and stress positions
+    then reduce to integer comparisons and phoneme distances are computed
+    only for distinct mismatching pairs: with NumPy as padded code matrices
+    through a vectorized DP, otherwise with the bit-parallel distance.
+
+    Args:
+        use_numpy: Force (``True``) or disable (``False``) the NumPy path;
+            ``None`` uses NumPy when it is installed.
+
+    Raises:
+        ImportError: If ``use_numpy=True`` but NumPy is not installed.
+    """
+
+    def __init__(self, use_numpy: bool | None = None) -> None:
+        if use_numpy and np is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+
+    def evaluate(
+        self,
+        predictions: list[tuple[str, str]],
+        gold: list[tuple[str, str]],
+        with_alignment: bool = False,
+    ) -> EvaluationResult:
+        """Compute all metrics (WER, PER, stress accuracy).
+
+        Args:
+            predictions: List of (word, predicted_ipa) tuples
+            gold: List of (word, gold_ipa) tuples
+            with_alignment: Attach a phoneme alignment to every word result
+
+        Returns:
+            EvaluationResult with aggregate metrics and per-word details
+
+        Raises:
+            ValueError: If predictions and gold have different lengths
+        """
+        self._check_lengths(predictions, gold)
+        if not predictions:
+            return EvaluationResult(
+                wer=0.0,
+                per=0.0,
+                stress_accuracy=0.0,
+                word_count=0,
+                correct_count=0,
+                details=[],
+            )
+
+        encoder = _Encoder()
+        pred_ids = encoder.encode([ipa for _word, ipa in predictions])
+        gold_ids = encoder.encode([ipa for _word, ipa in gold])
+        strings = encoder.strings
+        distances = self._distances(strings, pred_ids, gold_ids)
+
+        details: list[WordResult] = []
+        correct_count = 0
+        total_gold_phonemes = 0
+        for (word, ipa_pred), (_word, ipa_gold), pid, gid, distance in zip(
+            predictions, gold, pred_ids, gold_ids, distances, strict=True
+        ):
+            is_correct = pid == gid
+            correct_count += is_correct
+            total_gold_phonemes += len(strings.codes[gid])
+            details.append(
+                WordResult(
+                    word=word,
+                    predicted=ipa_pred,
+                    gold=ipa_gold,
+                    is_correct=is_correct,
+                    phoneme_distance=float(distance),
+                    alignment=(
+                        _levenshtein_alignment(strings.tokens[pid], strings.tokens[gid])
+                        if with_alignment
+                        else None
+                    ),
+                )
+            )
+
+        word_count = len(predictions)
+        total_distance = sum(distances)
+        return EvaluationResult(
+            wer=1.0 - (correct_count / word_count),
+            per=total_distance / total_gold_phonemes if total_gold_phonemes > 0 else 0.0,
+            stress_accuracy=self._stress_ratio(strings, pred_ids, gold_ids),
+            word_count=word_count,
+            correct_count=correct_count,
+            details=details,
+        )
+
+    def word_error_rate(self, predictions: list[str], gold: list[str]) -> float:
+        """Compute word error rate only.
+
+        Args:
+            predictions: List of predicted IPA strings
+            gold: List of gold IPA strings
+
+        Returns:
+            WER in range [0.0, 1.0]
+
+        Raises:
+            ValueError: If predictions and gold have different lengths
+        """
+        self._check_lengths(predictions, gold)
+        if not predictions:
+            return 0.0
+        encoder = _Encoder()
+        pred_ids = encoder.encode(predictions)
+        gold_ids = encoder.encode(gold)
+        if self.use_numpy:
+            correct = int(np.count_nonzero(np.asarray(pred_ids) == np.asarray(gold_ids)))
+        else:
+            correct = sum(1 for pid, gid in zip(pred_ids, gold_ids, strict=True) if pid == gid)
+        return 1.0 - (correct / len(predictions))
+
+    def phoneme_error_rate(self, predictions: list[str], gold: list[str]) -> float:
+        """Compute phoneme error rate only.
+
+        Args:
+            predictions: List of predicted IPA strings
+            gold: List of gold IPA strings
+
+        Returns:
+            PER in range [0.0, ∞) - can exceed 1.0 for heavy insertions
+
+        Raises:
+            ValueError: If predictions and gold have different lengths
+        """
+        self._check_lengths(predictions, gold)
+        if not predictions:
+            return 0.0
+        encoder = _Encoder()
+        pred_ids = encoder.encode(predictions)
+        gold_ids = encoder.encode(gold)
+        strings = encoder.strings
+        total_gold = sum(len(strings.codes[gid]) for gid in gold_ids)
+        total_distance = sum(self._distances(strings, pred_ids, gold_ids))
+        return total_distance / total_gold if total_gold > 0 else 0.0
+
+    def stress_accuracy(self, predictions: list[str], gold: list[str]) -> float:
+        """Compute stress marker position accuracy only.
+
+        Args:
+            predictions: List of predicted IPA strings
+            gold: List of gold IPA strings
+
+        Returns:
+            Stress accuracy in range [0.0, 1.0]
+
+        Raises:
+            ValueError: If predictions and gold have different lengths
+        """
+        self._check_lengths(predictions, gold)
+        if not predictions:
+            return 0.0
+        encoder = _Encoder()
+        pred_ids = encoder.encode(predictions)
+        gold_ids = encoder.encode(gold)
+        return self._stress_ratio(encoder.strings, pred_ids, gold_ids)
+
+    @staticmethod
+    def _check_lengths(predictions: Sequence[object], gold: Sequence[object]) -> None:
+        if len(predictions) != len(gold):
+            raise ValueError(f"Length mismatch: {len(predictions)} predictions vs {len(gold)} gold")
+
+    def _stress_ratio(
+        self,
+        strings: EncodedStrings,
+        pred_ids: list[int],
+        gold_ids: list[int],
+    ) -> float:
+        if self.use_numpy:
+            stress = np.asarray(strings.stress, dtype=np.int64)
+            stress_pred = stress[np.asarray(pred_ids)]
+            stress_gold = stress[np.asarray(gold_ids)]
+            comparable = stress_gold >= 0
+            matches = int(np.count_nonzero(comparable & (stress_pred == stress_gold)))
+            total = int(np.count_nonzero(comparable))
+        else:
+            matches = 0
+            total = 0
+            for pid, gid in zip(pred_ids, gold_ids, strict=True):
+                position = strings.stress[gid]
+                if position >= 0:
+                    total += 1
+                    matches += strings.stress[pid] == position
+        return matches / total if total > 0 else 0.0
+
+    def _distances(
+        self,
+        strings: EncodedStrings,
+        pred_ids: list[int],
+        gold_ids: list[int],
+    ) -> list[int]:
+        """Return the phoneme distance of every pair, computing each distinct pair once."""
+
+        pairs: dict[tuple[int, int], int] = {}
+        for pid, gid in zip(pred_ids, gold_ids, strict=True):
+            if pid != gid:
+                pairs.setdefault((pid, gid), 0)
+
+        if pairs:
+            if self.use_numpy:
+                self._fill_vectorized(strings, pairs)
+            else:
+                codes = strings.codes
+                for key in pairs:
+                    pairs[key] = _levenshtein_distance(codes[key[0]], codes[key[1]])
+
+        return [
+            0 if pid == gid else pairs[(pid, gid)]
+            for pid, gid in zip(pred_ids, gold_ids, strict=True)
+        ]
+
+    @staticmethod
+    def _fill_vectorized(strings: EncodedStrings, pairs: dict[tuple[int, int], int]) -> None:
+        lengths = np.fromiter((len(codes) for codes in strings.codes), dtype=np.int64)
+        width = max(int(lengths.max()), 1)
+        matrix = np.full((len(strings.codes), width), _PAD, dtype=np.int64)
+        for row, codes in enumerate(strings.codes):
+            matrix[row, : len(codes)] = codes
+
+        keys = list(pairs)
+        pred = np.fromiter((key[0] for key in keys), dtype=np.int64, count=len(keys))
+        gold = np.fromiter((key[1] for key in keys), dtype=np.int64, count=len(keys))
+        # Sorting by length keeps padding per chunk small.
+        order = np.argsort(lengths[pred] * (width + 1) + lengths[gold], kind="stable")
+        result = np.empty(len(keys), dtype=np.int64)
+        for start in range(0, len(keys), _CHUNK_SIZE):
+            chunk = order[start : start + _CHUNK_SIZE]
+            pred_len = lengths[pred[chunk]]
+            gold_len = lengths[gold[chunk]]
+            result[chunk] = _vectorized_distances(
+                matrix[pred[chunk], : max(int(pred_len.max()), 1)],
+                pred_len,
+                matrix[gold[chunk], : max(int(gold_len.max()), 1)],
+                gold_len,
+            )
+        for key, value in zip(keys, result.tolist(), strict=True):
+            pairs[key] = value
+
+
+__all__ = ["BatchEvaluator", "EncodedStrings"]
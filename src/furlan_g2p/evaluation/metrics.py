@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from collections.abc import Hashable, Sequence
 from pathlib import Path
 
 from furlan_g2p.core.interfaces import IEvaluator
-from furlan_g2p.evaluation.types import EvaluationResult, WordResult
+from furlan_g2p.evaluation.types import AlignmentStep, EvaluationResult, WordResult
 
 
 def _normalize_ipa(ipa: str) -> str:
@@ -73,9 +74,54 @@ def _tokenize_phonemes(ipa: str) -> list[str]:
     return phonemes
 
 
-def _levenshtein_distance(seq1: list[str], seq2: list[str]) -> int:
+def _myers_distance(seq1: Sequence[Hashable], seq2: Sequence[Hashable]) -> int:
+    """Compute Levenshtein distance with Myers/Hyyrö bit-parallel vectors.
+
+    ``seq1`` is the bit-vector pattern (one bit per token) and ``seq2`` is
+    scanned once.  Python integers give arbitrary-width vectors, so long
+    patterns need no blocking: the cost grows with ``len(seq1) / 30`` digit
+    operations per text token instead of a full DP row.
+
+    Args:
+        seq1: Pattern sequence (non-empty)
+        seq2: Text sequence
+
+    Returns:
+        Minimum edit distance (insertions, deletions, substitutions)
+    """
+    m = len(seq1)
+    peq: dict[Hashable, int] = {}
+    for i, token in enumerate(seq1):
+        peq[token] = peq.get(token, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+    for token in seq2:
+        eq = peq.get(token, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+def _levenshtein_distance(seq1: Sequence[Hashable], seq2: Sequence[Hashable]) -> int:
     """Compute Levenshtein edit distance between two sequences.
 
+    Uses the bit-parallel algorithm with the shorter sequence as pattern.
+    Tokens may be phoneme strings or integer phoneme codes.
+
     Args:
         seq1: First sequence of tokens
         seq2: Second sequence of tokens
@@ -83,30 +129,58 @@ def _levenshtein_distance(seq1: list[str], seq2: list[str]) -> int:
     Returns:
         Minimum edit distance (insertions, deletions, substitutions)
     """
-    m, n = len(seq1), len(seq2)
+    if len(seq1) > len(seq2):
+        seq1, seq2 = seq2, seq1
+    if not seq1:
+        return len(seq2)
+    return _myers_distance(seq1, seq2)
 
-    # Initialize DP table
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
 
-    # Base cases
+def _levenshtein_alignment(seq1: Sequence[str], seq2: Sequence[str]) -> list[AlignmentStep]:
+    """Return a minimum-cost alignment of predicted ``seq1`` to gold ``seq2``.
+
+    Builds the full DP table, so it is only used when alignments are
+    requested explicitly.
+
+    Args:
+        seq1: Predicted phoneme tokens
+        seq2: Gold phoneme tokens
+
+    Returns:
+        Alignment steps ``(op, predicted, gold)`` where ``op`` is one of
+        ``"match"``, ``"substitute"``, ``"insert"`` (extra predicted token)
+        or ``"delete"`` (gold token missing from the prediction)
+    """
+    m, n = len(seq1), len(seq2)
+    dp = [[0] * (n + 1) for _ in range(m + 1)]
     for i in range(m + 1):
         dp[i][0] = i
     for j in range(n + 1):
         dp[0][j] = j
-
-    # Fill DP table
     for i in range(1, m + 1):
         for j in range(1, n + 1):
-            if seq1[i - 1] == seq2[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1]
-            else:
-                dp[i][j] = 1 + min(
-                    dp[i - 1][j],  # deletion
-                    dp[i][j - 1],  # insertion
-                    dp[i - 1][j - 1],  # substitution
-                )
-
-    return dp[m][n]
+            cost = 0 if seq1[i - 1] == seq2[j - 1] else 1
+            dp[i][j] = min(dp[i - 1][j] + 1, dp[i][j - 1] + 1, dp[i - 1][j - 1] + cost)
+
+    steps: list[AlignmentStep] = []
+    i, j = m, n
+    while i > 0 or j > 0:
+        if i > 0 and j > 0:
+            cost = 0 if seq1[i - 1] == seq2[j - 1] else 1
+            if dp[i][j] == dp[i - 1][j - 1] + cost:
+                op = "match" if cost == 0 else "substitute"
+                steps.append((op, seq1[i - 1], seq2[j - 1]))
+                i -= 1
+                j -= 1
+                continue
+        if i > 0 and dp[i][j] == dp[i - 1][j] + 1:
+            steps.append(("insert", seq1[i - 1], None))
+            i -= 1
+        else:
+            steps.append(("delete", None, seq2[j - 1]))
+            j -= 1
+    steps.reverse()
+    return steps
 
 
 def _extract_stress_position(ipa: str) -> int | None:
@@ -130,12 +204,14 @@ class Evaluator(IEvaluator):
         self,
         predictions: list[tuple[str, str]],
         gold: list[tuple[str, str]],
+        with_alignment: bool = False,
     ) -> EvaluationResult:
         """Compute all metrics (WER, PER, stress accuracy).
 
         Args:
             predictions: List of (word, predicted_ipa) tuples
             gold: List of (word, gold_ipa) tuples
+            with_alignment: Attach a phoneme alignment to every word result
 
         Returns:
             EvaluationResult with aggregate metrics and per-word details
@@ -197,6 +273,11 @@ class Evaluator(IEvaluator):
                     gold=ipa_gold,
                     is_correct=is_correct,
                     phoneme_distance=float(distance),
+                    alignment=(
+                        _levenshtein_alignment(phonemes_pred, phonemes_gold)
+                        if with_alignment
+                        else None
+                    ),
                 )
             )
 
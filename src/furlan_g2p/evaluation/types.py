@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+AlignmentStep = tuple[str, str | None, str | None]
+"""One alignment step: ``(op, predicted_token, gold_token)``."""
+
 
 @dataclass
 class WordResult:
@@ -15,6 +18,7 @@ class WordResult:
         gold: Gold standard IPA transcription
         is_correct: Whether predicted exactly matches gold
         phoneme_distance: Levenshtein distance at phoneme level
+        alignment: Optional phoneme alignment (match/substitute/insert/delete)
     """
 
     word: str
@@ -22,6 +26,7 @@ class WordResult:
     gold: str
     is_correct: bool
     phoneme_distance: float
+    alignment: list[AlignmentStep] | None = None
 
 
 @dataclass
@@ -46,6 +51,7 @@ class EvaluationResult:
 
 
 __all__ = [
+    "AlignmentStep",
     "WordResult",
     "EvaluationResult",
 ]
@@ -5,5 +5,6 @@ from __future__ import annotations
 from .lexicon import Lexicon
 from .phonemizer import G2PPhonemizer
 from .rules import PhonemeRules
+from .word_cache import WordCache
 
-__all__ = ["Lexicon", "PhonemeRules", "G2PPhonemizer"]
+__all__ = ["Lexicon", "PhonemeRules", "G2PPhonemizer", "WordCache"]
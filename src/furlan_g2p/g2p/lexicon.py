@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
+from ..lexicon.fallback import FallbackTracker
 from ..lexicon.lookup import DialectAwareLexicon
 from ..lexicon.schema import LexiconConfig
 from ..lexicon.schema import LexiconEntry as SchemaLexiconEntry
@@ -70,6 +71,12 @@ class Lexicon:
         dialect_lexicon = DialectAwareLexicon.from_path(path=path, config=config)
         return cls(config=config, dialect_lexicon=dialect_lexicon)
 
+    @property
+    def fallbacks(self) -> FallbackTracker:
+        """Universal-entry fallbacks counted by the wrapped lexicon."""
+
+        return self._dialect_lexicon.fallbacks
+
     @lru_cache(maxsize=2048)  # noqa: B019 - deliberate cache on bound method
     def _lookup_entry(
         self,
@@ -102,6 +109,25 @@ class Lexicon:
         entry = self.lookup(word, dialect=dialect)
         return entry.ipa if entry else None
 
+    def lookup_many(
+        self,
+        words: Iterable[str],
+        dialect: str | None = None,
+    ) -> list[SchemaLexiconEntry | None]:
+        """Return schema entries for ``words`` in input order (see ``DialectAwareLexicon``)."""
+
+        return self._dialect_lexicon.lookup_many(words, dialect=dialect)
+
+    def lookup_ipa_many(self, words: Iterable[str], dialect: str | None = None) -> list[str | None]:
+        """Return the primary IPA for each of ``words`` in input order."""
+
+        return self._dialect_lexicon.lookup_ipa_many(words, dialect=dialect)
+
+    def content_hash(self) -> str:
+        """Return the content digest of the wrapped lexicon."""
+
+        return self._dialect_lexicon.content_hash()
+
     def get(self, word: str, dialect: str | None = None) -> str | None:
         """Compatibility alias returning the primary IPA string."""
 
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from collections.abc import Iterable
+import time
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+from hashlib import blake2b
+from typing import TYPE_CHECKING
 
 from ..core.interfaces import IG2PPhonemizer
+from ..lexicon.fallback import FallbackTracker
 from ..lexicon.lookup import DialectAwareLexicon
-from ..lexicon.schema import LexiconEntry as SchemaLexiconEntry
+from ..lexicon.reload import ReloadableLexicon
+from ..phonology import canonicalize_ipa
 from .lexicon import Lexicon
 from .rules import PhonemeRules
+from .word_cache import WordCache
+
+if TYPE_CHECKING:
+    from ..ml.interfaces import ExceptionPrediction, IExceptionModel
+    from ..services.instrumentation import PipelineMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -32,9 +44,51 @@ def _segment_ipa(ipa: str) -> list[str]:
     return segments
 
 
+def _strip_stress(ipa: str) -> str:
+    return ipa.replace("ˈ", "").replace("ˌ", "")
+
+
 class G2PPhonemizer(IG2PPhonemizer):
     """Phonemizer that combines a lexicon and rule fallback.
 
+    With an ``exception_model`` the lookup order becomes lexicon -> model ->
+    rules: lexicon misses are collected over the whole call, deduplicated
+    and sent to :meth:`IExceptionModel.predict_batch` in chunks of at most
+    ``model_batch_size`` words. Predictions below ``model_threshold`` (or
+    ``None``) fall through to :class:`PhonemeRules`, as do the words of a
+    chunk the model raised on (logged; e.g. a dead model worker). Use
+    :meth:`to_phonemes_batch` to share one model pass across many texts.
+
+    With a ``word_cache`` every call first reads its distinct tokens from the
+    cache and resolves only the rest, writing them back in bulk. Entries are
+    keyed by the lexicon's content hash, the rules version and the exception
+    model's identity and threshold, so a change to any of them starts from
+    an empty slice of the cache. Universal-entry fallbacks are counted by the
+    lexicon (``fallbacks`` is its tracker), so words answered from the cache
+    are not counted.
+
+    Parameters
+    ----------
+    lexicon:
+        Lexicon consulted first.
+    rules:
+        Rule engine for words neither the lexicon nor the model resolve.
+    metrics:
+        Optional :class:`PipelineMetrics`; enables stage timing and counters.
+    exception_model:
+        Optional model predicting lexicon misses.
+    model_threshold:
+        Minimum prediction confidence accepted from ``exception_model``.
+    model_batch_size:
+        Maximum number of words per ``predict_batch`` call.
+    word_cache:
+        Optional persistent :class:`WordCache` read before the lexicon.
+
+    Raises
+    ------
+    ValueError
+        If ``model_batch_size`` is not positive.
+
     Examples
     --------
     >>> G2PPhonemizer().to_phonemes(["cjase"])
@@ -43,11 +97,29 @@ class G2PPhonemizer(IG2PPhonemizer):
 
     def __init__(
         self,
-        lexicon: Lexicon | DialectAwareLexicon | None = None,
+        lexicon: Lexicon | DialectAwareLexicon | ReloadableLexicon | None = None,
         rules: PhonemeRules | None = None,
+        metrics: PipelineMetrics | None = None,
+        exception_model: IExceptionModel | None = None,
+        model_threshold: float = 0.5,
+        model_batch_size: int = 256,
+        word_cache: WordCache | None = None,
     ) -> None:
+        if model_batch_size < 1:
+            raise ValueError(f"model_batch_size must be positive, got {model_batch_size}")
         self.lexicon = lexicon or Lexicon()
         self.rules = rules or PhonemeRules()
+        self.metrics = metrics
+        self.exception_model = exception_model
+        self.model_threshold = model_threshold
+        self.model_batch_size = model_batch_size
+        self.word_cache = word_cache
+
+    @property
+    def fallbacks(self) -> FallbackTracker:
+        """Universal-entry fallbacks, as counted by the lexicon's lookups."""
+
+        return self.lexicon.fallbacks
 
     def to_phonemes(self, tokens: Iterable[str], dialect: str | None = None) -> list[str]:
         """Convert token strings into a flat list of phoneme symbols.
@@ -58,29 +130,265 @@ class G2PPhonemizer(IG2PPhonemizer):
             Tokens to phonemize.
         dialect:
             Optional dialect code for lexicon/rule selection.
+
+        Returns
+        -------
+        list[str]
+            Phonemes of every token, resolved as in :meth:`to_phonemes_batch`.
+        """
+
+        return [phone for segments in self._phonemize(list(tokens), dialect) for phone in segments]
+
+    def to_phonemes_batch(
+        self,
+        token_lists: Iterable[Iterable[str]],
+        dialect: str | None = None,
+    ) -> list[list[str]]:
+        """Phonemize several token sequences with one lexicon and model pass.
+
+        Equivalent to calling :meth:`to_phonemes` per sequence, except that
+        all sequences share a single bulk lookup and their lexicon misses
+        are predicted together, so the exception model sees full batches.
+
+        Parameters
+        ----------
+        token_lists:
+            Token sequences, e.g. one per text.
+        dialect:
+            Optional dialect code for lexicon/model/rule selection.
+
+        Returns
+        -------
+        list[list[str]]
+            Flat phoneme list per input sequence, in input order.
+        """
+
+        sequences = [list(tokens) for tokens in token_lists]
+        segments = self._phonemize(
+            [token for tokens in sequences for token in tokens], dialect, len(sequences)
+        )
+        results: list[list[str]] = []
+        offset = 0
+        for tokens in sequences:
+            end = offset + len(tokens)
+            results.append([phone for word in segments[offset:end] for phone in word])
+            offset = end
+        return results
+
+    def phonemize_words(
+        self,
+        words: Sequence[str],
+        dialect: str | None = None,
+        texts: int = 1,
+    ) -> list[list[str]]:
+        """Return the phoneme segments of each word, resolved in bulk.
+
+        Uses the lexicon -> model -> rules path of :meth:`to_phonemes_batch`
+        (whether or not an exception model is set), so a whole vocabulary is
+        looked up and predicted in batches.
+
+        Parameters
+        ----------
+        words:
+            Words to phonemize (typically distinct).
+        dialect:
+            Optional dialect code for lexicon/model/rule selection.
+        texts:
+            Number of texts the words come from; the stage times recorded
+            in ``self.metrics`` are spread over them.
+
+        Returns
+        -------
+        list[list[str]]
+            Phoneme symbols per word, in input order.
+        """
+
+        return self._phonemize(words, dialect, texts)
+
+    def _phonemize(
+        self, tokens: Sequence[str], dialect: str | None, texts: int = 1
+    ) -> list[list[str]]:
+        """Return phoneme segments per token via cache -> lexicon -> model -> rules.
+
+        Model predictions and rule output are computed once per distinct
+        missing word. Lexicon, model and rule time plus the per-stage
+        counters go to ``self.metrics`` when attached, as per-text means
+        over ``texts``.
+        """
+
+        metrics = self.metrics
+        clock = time.perf_counter
+        cache_seconds = lexicon_seconds = model_seconds = rules_seconds = 0.0
+        hits = model_hits = fallbacks = batches = cache_hits = 0
+        misses: list[str] = []
+        cached: dict[str, list[str]] = {}
+        cache = self.word_cache
+        context = ""
+        model_failed = False
+        try:
+            lookup_tokens: Sequence[str] = tokens
+            if cache is not None:
+                start = clock()
+                context = self.cache_context()
+                cached = cache.get_many(tokens, dialect, context)
+                cache_seconds = clock() - start
+                lookup_tokens = [token for token in tokens if token not in cached]
+                cache_hits = len(tokens) - len(lookup_tokens)
+
+            start = clock()
+            entries = self.lexicon.lookup_many(lookup_tokens, dialect=dialect)
+            lexicon_seconds = clock() - start
+            misses = list(
+                dict.fromkeys(
+                    token
+                    for token, entry in zip(lookup_tokens, entries, strict=True)
+                    if entry is None
+                )
+            )
+
+            predicted: dict[str, list[str]] = {}
+            ruled: dict[str, list[str] | ValueError] = {}
+            model = self.exception_model
+            if misses and model is not None:
+                start = clock()
+                size = self.model_batch_size
+                chunks = [misses[i : i + size] for i in range(0, len(misses), size)]
+                batches = len(chunks)
+                if model.asynchronous:
+                    futures = [model.predict_batch_async(chunk, dialect) for chunk in chunks]
+                    # Run the rules while the model works; results for words
+                    # the model resolves are discarded.
+                    rules_start = clock()
+                    ruled = self._apply_rules(misses, dialect)
+                    rules_seconds = clock() - rules_start
+                    results = [self._model_result(future.result) for future in futures]
+                else:
+                    results = [
+                        self._model_result(partial(model.predict_batch, chunk, dialect))
+                        for chunk in chunks
+                    ]
+                model_seconds = clock() - start - rules_seconds
+                for chunk, predictions in zip(chunks, results, strict=True):
+                    if predictions is None:
+                        model_failed = True
+                    else:
+                        self._accept(chunk, predictions, predicted)
+
+            start = clock()
+            ruled.update(
+                self._apply_rules(
+                    [word for word in misses if word not in predicted and word not in ruled],
+                    dialect,
+                )
+            )
+            rules_seconds += clock() - start
+
+            resolved: dict[str, list[str]] = {}
+            segments: list[list[str]] = []
+            remaining = iter(entries)
+            for token in tokens:
+                if token in cached:
+                    segments.append(cached[token])
+                    continue
+                entry = next(remaining)
+                if entry is not None:
+                    hits += 1
+                    phones = _segment_ipa(_strip_stress(entry.ipa))
+                elif token in predicted:
+                    model_hits += 1
+                    phones = predicted[token]
+                else:
+                    ruled_phones = ruled[token]
+                    if isinstance(ruled_phones, ValueError):
+                        if metrics is not None:
+                            metrics.increment("rule_errors")
+                        raise ruled_phones
+                    fallbacks += 1
+                    phones = ruled_phones
+                resolved[token] = phones
+                segments.append(phones)
+
+            if cache is not None and resolved:
+                if model is not None and (model_failed or not model.is_available()):
+                    # Rule output stands in for a model that is down; do not persist it.
+                    resolved = {
+                        word: phones
+                        for word, phones in resolved.items()
+                        if word not in ruled or word in predicted
+                    }
+                start = clock()
+                cache.put_many(resolved.items(), dialect, context)
+                cache_seconds += clock() - start
+        finally:
+            if metrics is not None:
+                metrics.record_g2p(lexicon_seconds, rules_seconds, hits, fallbacks, texts)
+                if self.exception_model is not None:
+                    metrics.record_model(model_seconds, batches, len(misses), model_hits, texts)
+                if cache is not None:
+                    metrics.record_cache(cache_seconds, len(tokens), cache_hits, texts)
+        return segments
+
+    def cache_context(self) -> str:
+        """Return the digest keying :attr:`word_cache` entries.
+
+        It covers the lexicon content hash, the rule engine (class, version
+        and default dialect) and, with an exception model, the model's
+        metadata (without ``available``) and ``model_threshold``.
+
+        Returns
+        -------
+        str
+            Hex digest.
         """
 
-        phonemes: list[str] = []
-        for token in tokens:
-            entry = self._lookup_entry(token, dialect=dialect)
-            if entry is not None:
-                if dialect is not None and entry.dialect is None:
-                    logger.info(
-                        "Dialect-specific lexicon entry missing for token=%r dialect=%r; "
-                        "used universal entry",
-                        token,
-                        dialect,
-                    )
-                ipa = entry.ipa.replace("ˈ", "").replace("ˌ", "")
-                phonemes.extend(_segment_ipa(ipa))
-                continue
-            phonemes.extend(self.rules.apply(token, dialect=dialect))
-        return phonemes
-
-    def _lookup_entry(self, token: str, dialect: str | None) -> SchemaLexiconEntry | None:
-        if isinstance(self.lexicon, DialectAwareLexicon):
-            return self.lexicon.lookup(token, dialect=dialect)
-        return self.lexicon.lookup(token, dialect=dialect)
+        parts: dict[str, object] = {
+            "lexicon": self.lexicon.content_hash(),
+            "rules": [type(self.rules).__name__, self.rules.version, self.rules.dialect],
+        }
+        model = self.exception_model
+        if model is not None:
+            info = model.get_model_info()
+            parts["model"] = {key: value for key, value in info.items() if key != "available"}
+            parts["threshold"] = self.model_threshold
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return blake2b(payload, digest_size=16).hexdigest()
+
+    def _apply_rules(
+        self, words: Iterable[str], dialect: str | None
+    ) -> dict[str, list[str] | ValueError]:
+        """Apply the rules per word, keeping a rule error in place of its result."""
+
+        results: dict[str, list[str] | ValueError] = {}
+        for word in words:
+            try:
+                results[word] = self.rules.apply(word, dialect=dialect)
+            except ValueError as exc:
+                results[word] = exc
+        return results
+
+    @staticmethod
+    def _model_result(
+        predict: Callable[[], list[ExceptionPrediction | None]],
+    ) -> list[ExceptionPrediction | None] | None:
+        """Return ``predict()``, or ``None`` (logged) if the model failed; the rules take over."""
+
+        try:
+            return predict()
+        except Exception as exc:  # noqa: BLE001 - the model is optional; fall back to the rules
+            logger.warning("Exception model failed (%s); using the rules for its words", exc)
+            return None
+
+    def _accept(
+        self,
+        words: list[str],
+        predictions: list[ExceptionPrediction | None],
+        accepted: dict[str, list[str]],
+    ) -> None:
+        """Add segments of the predictions reaching ``model_threshold`` to ``accepted``."""
+
+        for word, prediction in zip(words, predictions, strict=True):
+            if prediction is not None and prediction.confidence >= self.model_threshold:
+                accepted[word] = _segment_ipa(_strip_stress(canonicalize_ipa(prediction.ipa)))
 
 
 __all__ = ["G2PPhonemizer"]
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import unicodedata
 from collections.abc import Iterable
-from typing import Literal
+from typing import ClassVar, Literal
 
 from ..phonology import PHONEME_INVENTORY, canonicalize_ipa
 
 Dialect = Literal["central", "western_codroipo", "carnia"]
 
+# Bump whenever a rule change alters ``PhonemeRules.apply`` output; it keys
+# persisted G2P results (see ``g2p.word_cache``).
+RULES_VERSION = "1"
+
 _DIALECT_ALIASES: dict[str, Dialect] = {
     "central": "central",
     "cent": "central",
@@ -161,6 +165,8 @@ class PhonemeRules:
     basic dialectal differences.
     """
 
+    version: ClassVar[str] = RULES_VERSION
+
     def __init__(
         self,
         phoneme_inventory: Iterable[str] | None = None,
@@ -266,4 +272,4 @@ class PhonemeRules:
         return segments
 
 
-__all__ = ["orth_to_ipa_basic", "PhonemeRules"]
+__all__ = ["orth_to_ipa_basic", "PhonemeRules", "RULES_VERSION"]
@@ -0,0 +1,272 @@
+"""Persistent SQLite cache of resolved word pronunciations."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from ..config import default_cache_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS words (
+    context TEXT NOT NULL,
+    dialect TEXT NOT NULL,
+    word TEXT NOT NULL,
+    phonemes TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (context, dialect, word)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS words_last_used ON words (last_used);
+"""
+# Stay below SQLITE_MAX_VARIABLE_NUMBER of old SQLite builds (999).
+_BATCH_SIZE = 500
+# Words looked up without a dialect are stored under ''.
+_NO_DIALECT = ""
+# Fraction of ``max_entries`` kept after an eviction pass.
+_EVICT_TO = 0.9
+# Minimum age before a read refreshes an entry's ``last_used``.
+_TOUCH_INTERVAL_NS = 60 * 1_000_000_000
+
+
+def default_word_cache_path() -> Path:
+    """Return ``words.sqlite`` inside :func:`furlan_g2p.config.default_cache_dir`."""
+
+    return default_cache_dir() / "words.sqlite"
+
+
+class WordCache:
+    """SQLite file mapping ``(word, dialect, context)`` to phoneme segments.
+
+    :class:`G2PPhonemizer` reads every distinct token of a call with a few
+    ``IN (...)`` queries and writes the words it had to resolve back in one
+    transaction. ``context`` is a digest of everything else that determines
+    the result: lexicon content hash, rules version and exception-model
+    identity (see ``G2PPhonemizer``). Entries of other contexts stay in the
+    file untouched, so jobs using different lexica can share one cache.
+    When more than ``max_entries`` rows exist, the least recently used are
+    evicted down to 90% of the limit. The row count is tracked
+    incrementally (recounted only when it crosses the limit) and reads
+    refresh an entry's recency at most once a minute.
+
+    The file uses WAL journaling, so several processes may read and write
+    it concurrently; a connection opened before ``fork`` is reopened in the
+    child.
+
+    Parameters
+    ----------
+    path:
+        Cache file; parent directories are created. Defaults to
+        :func:`default_word_cache_path`.
+    max_entries:
+        Maximum number of cached words (``None`` for unbounded).
+
+    Raises
+    ------
+    ValueError
+        If ``max_entries`` is not positive.
+
+    Examples
+    --------
+    >>> cache = WordCache("words.sqlite")  # doctest: +SKIP
+    >>> cache.put_many([("cjase", ["c", "a", "z", "e"])], None, "ctx")  # doctest: +SKIP
+    >>> cache.get_many(["cjase", "sûr"], None, "ctx")  # doctest: +SKIP
+    {'cjase': ['c', 'a', 'z', 'e']}
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_entries: int | None = 1_000_000,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.path = Path(path) if path is not None else default_word_cache_path()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pid = -1
+        self._db: sqlite3.Connection | None = None
+        self._entries = 0
+
+    def get_many(
+        self,
+        words: Iterable[str],
+        dialect: str | None,
+        context: str,
+    ) -> dict[str, list[str]]:
+        """Return the cached segments of ``words`` that are present.
+
+        Parameters
+        ----------
+        words:
+            Words to look up (duplicates are queried once).
+        dialect:
+            Dialect the words were resolved for.
+        context:
+            Resolution context digest.
+
+        Returns
+        -------
+        dict[str, list[str]]
+            Phoneme segments per cached word; absent words are misses.
+        """
+
+        unique = list(dict.fromkeys(words))
+        dialect_key = dialect or _NO_DIALECT
+        found: dict[str, list[str]] = {}
+        stale = time.time_ns() - _TOUCH_INTERVAL_NS
+        touch: list[str] = []
+        with self._lock:
+            connection = self._connection()
+            for start in range(0, len(unique), _BATCH_SIZE):
+                batch = unique[start : start + _BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                rows = connection.execute(
+                    "SELECT word, phonemes, last_used FROM words "
+                    f"WHERE context = ? AND dialect = ? AND word IN ({placeholders})",
+                    [context, dialect_key, *batch],
+                ).fetchall()
+                for word, phonemes, last_used in rows:
+                    found[word] = phonemes.split()
+                    if last_used < stale:
+                        touch.append(word)
+            if touch and self.max_entries is not None:
+                now = time.time_ns()
+                with connection:
+                    connection.executemany(
+                        "UPDATE words SET last_used = ? "
+                        "WHERE context = ? AND dialect = ? AND word = ?",
+                        [(now, context, dialect_key, word) for word in touch],
+                    )
+            self.hits += len(found)
+            self.misses += len(unique) - len(found)
+        return found
+
+    def put_many(
+        self,
+        items: Iterable[tuple[str, list[str]]],
+        dialect: str | None,
+        context: str,
+    ) -> None:
+        """Store ``(word, segments)`` pairs in one transaction.
+
+        Parameters
+        ----------
+        items:
+            Resolved words and their phoneme segments.
+        dialect:
+            Dialect the words were resolved for.
+        context:
+            Resolution context digest.
+        """
+
+        now = time.time_ns()
+        dialect_key = dialect or _NO_DIALECT
+        rows = [(context, dialect_key, word, " ".join(segments), now) for word, segments in items]
+        if not rows:
+            return
+        with self._lock:
+            connection = self._connection()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO words (context, dialect, word, phonemes, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                # Replaced rows and other processes' writes make this an estimate.
+                self._entries += len(rows)
+                if self.max_entries is not None and self._entries > self.max_entries:
+                    self._entries = self._count()
+                    if self._entries > self.max_entries:
+                        keep = int(self.max_entries * _EVICT_TO)
+                        connection.execute(
+                            "DELETE FROM words WHERE (context, dialect, word) IN ("
+                            "SELECT context, dialect, word FROM words ORDER BY last_used LIMIT ?)",
+                            (self._entries - keep,),
+                        )
+                        self._entries = keep
+
+    def stats(self) -> dict[str, object]:
+        """Return counters for this instance and the stored entry counts.
+
+        Returns
+        -------
+        dict[str, object]
+            ``hits`` and ``misses`` (distinct words per lookup), ``entries``,
+            ``contexts`` (number of distinct resolution contexts), file
+            ``size_bytes`` and ``path``.
+        """
+
+        with self._lock:
+            entries, contexts = (
+                self._connection()
+                .execute("SELECT COUNT(*), COUNT(DISTINCT context) FROM words")
+                .fetchone()
+            )
+        size = sum(
+            candidate.stat().st_size
+            for candidate in (self.path, Path(f"{self.path}-wal"))
+            if candidate.exists()
+        )
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": int(entries),
+            "contexts": int(contexts),
+            "size_bytes": size,
+            "path": str(self.path),
+        }
+
+    def clear(self) -> int:
+        """Delete every cached word.
+
+        Returns
+        -------
+        int
+            Number of deleted entries.
+        """
+
+        with self._lock:
+            connection = self._connection()
+            with connection:
+                deleted = connection.execute("DELETE FROM words").rowcount
+            connection.execute("VACUUM")
+            self._entries = 0
+        return int(deleted)
+
+    def close(self) -> None:
+        """Close the database connection (it reopens on next use)."""
+
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection, reopening it in a forked child. Hold ``_lock``."""
+
+        pid = os.getpid()
+        if self._db is None or self._pid != pid:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._db = connection
+            self._pid = pid
+            self._entries = self._count()
+        return self._db
+
+    def _count(self) -> int:
+        """Return the number of stored rows. Hold ``_lock``."""
+
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM words").fetchone()
+        return int(count)
+
+
+__all__ = ["WordCache", "default_word_cache_path"]
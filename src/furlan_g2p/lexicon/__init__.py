@@ -2,25 +2,40 @@
 
 from __future__ import annotations
 
+from .bloom import BloomFilter
 from .builder import LexiconBuilder, ValidationIssue
 from .canonicalizer import IPACanonicalize, load_ipa_mapping
+from .fallback import FallbackTracker
 from .lookup import DialectAwareLexicon
+from .reload import ReloadableLexicon
 from .schema import LexiconConfig, LexiconEntry
+from .shared import SharedLexiconStore
+from .sqlite import SqliteLexiconStore, write_sqlite
 from .storage import detect_format, read_jsonl, read_tsv, write_jsonl, write_tsv
+from .stores import CompactLexiconStore, DictLexiconStore, build_store
 from .wikipron import WikiPronEntry, iter_wikipron_entries
 
 __all__ = [
+    "BloomFilter",
+    "CompactLexiconStore",
     "DialectAwareLexicon",
+    "DictLexiconStore",
+    "FallbackTracker",
     "IPACanonicalize",
     "LexiconBuilder",
     "LexiconEntry",
     "LexiconConfig",
+    "ReloadableLexicon",
+    "SharedLexiconStore",
+    "SqliteLexiconStore",
     "ValidationIssue",
     "read_tsv",
     "write_tsv",
     "read_jsonl",
     "write_jsonl",
+    "write_sqlite",
     "detect_format",
+    "build_store",
     "load_ipa_mapping",
     "WikiPronEntry",
     "iter_wikipron_entries",
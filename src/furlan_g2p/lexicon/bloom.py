@@ -0,0 +1,180 @@
+"""Bloom filter over normalized lemmas for cheap negative lookups."""
+
+from __future__ import annotations
+
+import math
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from functools import cache
+from hashlib import blake2b
+
+_MAGIC = b"FGBF"
+_VERSION = 1
+# magic, version, word count, bits set per key, key count
+_HEADER = struct.Struct("<4sBQBQ")
+_MAX_HASHES = 10
+# In-word bit patterns are looked up in a table of this many masks.
+_PATTERN_BITS = 12
+_PATTERN_MASK = (1 << _PATTERN_BITS) - 1
+
+
+class BloomFilter:
+    """Probabilistic set of strings with no false negatives.
+
+    A blocked Bloom filter: each key is hashed once with BLAKE2b; the low
+    digest bits pick one of a fixed table of ``k``-bit patterns and the rest
+    select the 64-bit word it is applied to, so a membership test is one
+    hash and one word probe. A ``False``
+    answer is definite; ``True`` is wrong with probability close to the
+    configured ``error_rate``.
+
+    Parameters
+    ----------
+    capacity:
+        Expected number of keys.
+    error_rate:
+        Target false-positive rate once ``capacity`` keys were added.
+
+    Examples
+    --------
+    >>> bloom = BloomFilter.from_keys(["cjase", "aghe"])
+    >>> "cjase" in bloom
+    True
+    >>> len(bloom)
+    2
+    """
+
+    __slots__ = ("_words", "_hashes", "_count", "_masks")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError(f"error_rate must be in (0, 1), got {error_rate}")
+        capacity = max(capacity, 1)
+        # Confining a key to one word raises the false-positive rate; sizing
+        # for a quarter of the target rate compensates for it.
+        bits = -capacity * math.log(error_rate / 4) / math.log(2) ** 2
+        self._hashes = min(_MAX_HASHES, max(1, round(bits / capacity * math.log(2))))
+        self._words: array[int] | memoryview = array("Q", bytes(8 * max(1, math.ceil(bits / 64))))
+        self._count = 0
+        self._masks = _bit_patterns(self._hashes)
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str], error_rate: float = 0.01) -> BloomFilter:
+        """Build a filter sized for and holding ``keys``."""
+
+        values = keys if isinstance(keys, list | tuple | set | frozenset) else list(keys)
+        bloom = cls(len(values), error_rate=error_rate)
+        for key in values:
+            bloom.add(key)
+        return bloom
+
+    def add(self, key: str) -> None:
+        """Insert ``key``."""
+
+        index, mask = self._probe(key)
+        self._words[index] |= mask
+        self._count += 1
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        index, mask = self._probe(key)
+        return self._words[index] & mask == mask
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the bit array in bytes."""
+
+        return len(self._words) * 8
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter (header plus little-endian words)."""
+
+        words = array("Q", self._words)
+        if sys.byteorder != "little":
+            words.byteswap()
+        header = _HEADER.pack(_MAGIC, _VERSION, len(words), self._hashes, self._count)
+        return header + words.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview, copy: bool = True) -> BloomFilter:
+        """Load a filter produced by :meth:`to_bytes`.
+
+        Parameters
+        ----------
+        data:
+            Serialized filter.
+        copy:
+            If False (and the host is little-endian), the filter reads its
+            bits from ``data`` in place, e.g. from shared memory; it is then
+            read-only and holds a view of ``data`` until :meth:`release`.
+
+        Raises
+        ------
+        ValueError
+            If ``data`` is not a serialized filter of a supported version.
+        """
+
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated Bloom filter data")
+        magic, version, size, hashes, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Unsupported Bloom filter data")
+        payload = memoryview(data)[_HEADER.size :]
+        if size == 0 or len(payload) != size * 8 or not 1 <= hashes <= _MAX_HASHES:
+            raise ValueError("Corrupt Bloom filter data")
+        words: array[int] | memoryview
+        if not copy and sys.byteorder == "little":
+            words = payload.toreadonly().cast("Q")
+        else:
+            words = array("Q")
+            words.frombytes(payload)
+            if sys.byteorder != "little":
+                words.byteswap()
+        payload.release()
+        bloom = cls.__new__(cls)
+        bloom._words = words
+        bloom._hashes = hashes
+        bloom._count = count
+        bloom._masks = _bit_patterns(hashes)
+        return bloom
+
+    def release(self) -> None:
+        """Drop the view of the buffer a ``copy=False`` filter reads from.
+
+        The filter is unusable afterwards; filters owning their bits ignore
+        the call.
+        """
+
+        if isinstance(self._words, memoryview):
+            self._words.release()
+
+    def _probe(self, key: str) -> tuple[int, int]:
+        """Return the word index and bit mask for ``key``."""
+
+        digest = int.from_bytes(blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+        return (digest >> _PATTERN_BITS) % len(self._words), self._masks[digest & _PATTERN_MASK]
+
+
+@cache
+def _bit_patterns(hashes: int) -> tuple[int, ...]:
+    """Return the deterministic table of 64-bit masks with ``hashes`` bits set."""
+
+    patterns: list[int] = []
+    for index in range(1 << _PATTERN_BITS):
+        seed = blake2b(index.to_bytes(2, "little") + bytes([hashes]), digest_size=32).digest()
+        mask = 0
+        for byte in seed:
+            if mask.bit_count() == hashes:
+                break
+            mask |= 1 << (byte & 63)
+        patterns.append(mask)
+    return tuple(patterns)
+
+
+__all__ = ["BloomFilter"]
@@ -9,7 +9,9 @@ from pathlib import Path
 
 from ..core.interfaces import ILexiconBuilder
 from .canonicalizer import IPACanonicalize
+from .lookup import DialectAwareLexicon
 from .schema import LexiconEntry
+from .sqlite import SqliteLexiconStore, write_sqlite
 from .storage import detect_format, read_jsonl, read_tsv, write_jsonl, write_tsv
 from .wikipron import iter_wikipron_entries
 
@@ -184,7 +186,9 @@ class LexiconBuilder(ILexiconBuilder):
         path:
             Destination path.
         format:
-            Export format ("jsonl", "tsv", "tsv_simple", "tsv_extended").
+            Export format ("jsonl", "tsv", "tsv_simple", "tsv_extended",
+            "sqlite"). SQLite output holds entries normalized as
+            ``DialectAwareLexicon`` indexes them, ready to open in place.
         """
 
         fmt = format.strip().lower()
@@ -195,6 +199,8 @@ class LexiconBuilder(ILexiconBuilder):
             write_tsv(entries, path, format="extended")
         elif fmt in {"tsv_simple", "simple"}:
             write_tsv(entries, path, format="simple")
+        elif fmt == "sqlite":
+            write_sqlite(DialectAwareLexicon(entries).iter_entries(), path)
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
@@ -236,6 +242,12 @@ class LexiconBuilder(ILexiconBuilder):
             return read_tsv(path, format="extended")
         if source == "jsonl":
             return read_jsonl(path)
+        if source == "sqlite":
+            store = SqliteLexiconStore(path)
+            try:
+                return list(store)
+            finally:
+                store.close()
         raise ValueError(f"Unsupported source type: {source}")
 
     def _make_entry_from_wikipron(
@@ -0,0 +1,156 @@
+"""Aggregated accounting of dialect-to-universal lexicon fallbacks."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Mapping
+
+FallbackKey = tuple[str, str]
+"""``(requested_dialect, entry_source)`` pair used as a counter key."""
+
+
+class FallbackTracker:
+    """Count universal-entry fallbacks and log them at a bounded rate.
+
+    Dialected runs fall back to universal entries for most tokens, so
+    logging each one dominates the lookup cost. The tracker instead keeps
+    counters per requested dialect and entry source and emits at most one
+    sample log line per ``log_interval`` seconds, mentioning how many
+    fallbacks were suppressed since the previous line.
+
+    Parameters
+    ----------
+    logger:
+        Logger receiving sample lines and summaries.
+    log_interval:
+        Minimum seconds between sample lines; ``None`` disables sampling
+        (summaries are still available).
+    level:
+        Log level for sample lines and summaries.
+
+    Examples
+    --------
+    >>> tracker = FallbackTracker(logging.getLogger("demo"), log_interval=None)
+    >>> tracker.record("cjase", "western", "seed")
+    >>> tracker.total
+    1
+    >>> tracker.summary()
+    'Universal fallbacks: 1 (western: 1; sources: seed=1)'
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        log_interval: float | None = 10.0,
+        level: int = logging.INFO,
+    ) -> None:
+        self.logger = logger
+        self.log_interval = log_interval
+        self.level = level
+        self._lock = threading.Lock()
+        self._counts: dict[FallbackKey, int] = {}
+        self._suppressed = 0
+        self._next_log = 0.0
+
+    @property
+    def total(self) -> int:
+        """Total fallbacks recorded."""
+
+        return sum(self._counts.values())
+
+    def record(self, word: str, dialect: str, source: str) -> None:
+        """Count one fallback and maybe emit a sample log line."""
+
+        key = (dialect, source)
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+            if self.log_interval is None or not self.logger.isEnabledFor(self.level):
+                return
+            now = time.monotonic()
+            if now < self._next_log:
+                self._suppressed += 1
+                return
+            suppressed, self._suppressed = self._suppressed, 0
+            self._next_log = now + self.log_interval
+        self.logger.log(
+            self.level,
+            "Lexicon fallback to universal entry for word=%r dialect=%r "
+            "(%d similar fallbacks not logged)",
+            word,
+            dialect,
+            suppressed,
+        )
+
+    def counts(self) -> dict[FallbackKey, int]:
+        """Return a copy of the per ``(dialect, source)`` counters."""
+
+        with self._lock:
+            return dict(self._counts)
+
+    def merge(self, counts: Mapping[FallbackKey, int]) -> None:
+        """Add counters collected elsewhere (e.g. in worker processes)."""
+
+        with self._lock:
+            for key, value in counts.items():
+                self._counts[key] = self._counts.get(key, 0) + value
+
+    def reset(self) -> None:
+        """Clear counters and the sampling state."""
+
+        with self._lock:
+            self._counts = {}
+            self._suppressed = 0
+            self._next_log = 0.0
+
+    def report(self, since: Mapping[FallbackKey, int] | None = None) -> dict[str, object]:
+        """Return totals grouped by dialect and by source.
+
+        Parameters
+        ----------
+        since:
+            Earlier :meth:`counts` result; only fallbacks recorded after it
+            are reported.
+        """
+
+        total, by_dialect, by_source = _group(_subtract(self.counts(), since))
+        return {"total": total, "by_dialect": by_dialect, "by_source": by_source}
+
+    def summary(self, since: Mapping[FallbackKey, int] | None = None) -> str:
+        """Return a one-line human-readable summary."""
+
+        total, by_dialect, by_source = _group(_subtract(self.counts(), since))
+        if not total:
+            return "Universal fallbacks: 0"
+        dialects = ", ".join(f"{name}: {value}" for name, value in by_dialect.items())
+        sources = ", ".join(f"{name}={value}" for name, value in by_source.items())
+        return f"Universal fallbacks: {total} ({dialects}; sources: {sources})"
+
+    def log_summary(self, since: Mapping[FallbackKey, int] | None = None) -> None:
+        """Log :meth:`summary` if any fallback was recorded."""
+
+        if _subtract(self.counts(), since):
+            self.logger.log(self.level, "%s", self.summary(since))
+
+
+def _group(counts: dict[FallbackKey, int]) -> tuple[int, dict[str, int], dict[str, int]]:
+    by_dialect: dict[str, int] = {}
+    by_source: dict[str, int] = {}
+    for (dialect, source), value in counts.items():
+        by_dialect[dialect] = by_dialect.get(dialect, 0) + value
+        by_source[source] = by_source.get(source, 0) + value
+    return sum(counts.values()), dict(sorted(by_dialect.items())), dict(sorted(by_source.items()))
+
+
+def _subtract(
+    counts: dict[FallbackKey, int],
+    since: Mapping[FallbackKey, int] | None,
+) -> dict[FallbackKey, int]:
+    if not since:
+        return counts
+    delta = {key: value - since.get(key, 0) for key, value in counts.items()}
+    return {key: value for key, value in delta.items() if value > 0}
+
+
+__all__ = ["FallbackKey", "FallbackTracker"]
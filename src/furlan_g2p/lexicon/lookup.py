@@ -3,18 +3,33 @@
 from __future__ import annotations
 
 import csv
+import gc
 import json
 import logging
 import unicodedata
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import replace
 from functools import lru_cache
+from hashlib import blake2b
 from importlib import resources
 from pathlib import Path
 
+from ..core.interfaces import ILexiconStore
 from ..phonology import canonicalize_ipa
+from .bloom import BloomFilter
+from .fallback import FallbackTracker
 from .schema import LexiconConfig, LexiconEntry
+from .shared import SharedLexiconStore
+from .snapshot import (
+    default_snapshot_dir,
+    prune_snapshots,
+    read_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
+from .sqlite import SqliteLexiconStore
 from .storage import detect_format, read_jsonl, read_tsv
+from .stores import build_store
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +71,8 @@ class DialectAwareLexicon:
     entries:
         Lexicon entries to index.
     config:
-        Lookup behavior settings.
+        Lookup behavior settings; ``config.storage`` selects the in-memory
+        backend.
 
     Examples
     --------
@@ -78,15 +94,88 @@ class DialectAwareLexicon:
         config: LexiconConfig | None = None,
     ) -> None:
         self.config = config or LexiconConfig()
-        self._entries: dict[tuple[str, str | None], LexiconEntry] = {}
-        self._entries_by_lemma: dict[str, list[LexiconEntry]] = {}
+        self.fallbacks = FallbackTracker(logger)
+        merged: dict[tuple[str, str | None], LexiconEntry] = {}
 
         for entry in entries:
             normalized = self._normalize_entry(entry)
-            self._merge_entry(normalized)
+            self._merge_entry(merged, normalized)
 
-        for (lemma_key, _dialect), entry in self._entries.items():
-            self._entries_by_lemma.setdefault(lemma_key, []).append(entry)
+        self._attach(build_store(merged.values(), self.config.storage))
+
+    @classmethod
+    def from_store(
+        cls,
+        store: ILexiconStore,
+        config: LexiconConfig | None = None,
+    ) -> DialectAwareLexicon:
+        """Wrap an already built store of normalized entries.
+
+        Parameters
+        ----------
+        store:
+            Storage backend; entries must already be normalized and merged.
+        config:
+            Lookup configuration (``config.storage`` is ignored).
+
+        Returns
+        -------
+        DialectAwareLexicon
+            Lexicon reading from ``store``.
+        """
+
+        # Bypass __init__, which would index (and filter) an empty store first.
+        lexicon = cls.__new__(cls)
+        lexicon.config = config or LexiconConfig()
+        lexicon.fallbacks = FallbackTracker(logger)
+        lexicon._attach(store)
+        return lexicon
+
+    @classmethod
+    def from_shared(cls, name: str, config: LexiconConfig | None = None) -> DialectAwareLexicon:
+        """Attach to a lexicon published with :meth:`publish_shared`.
+
+        Parameters
+        ----------
+        name:
+            Shared-memory segment name (``SharedLexiconStore.name``).
+        config:
+            Lookup configuration; ``case_sensitive`` must match the
+            publisher's.
+
+        Returns
+        -------
+        DialectAwareLexicon
+            Lexicon reading the shared pages without copying them.
+
+        Raises
+        ------
+        FileNotFoundError
+            If no segment called ``name`` exists.
+        ValueError
+            If the segment is not a compatible shared lexicon.
+        """
+
+        config = config or LexiconConfig()
+        store = SharedLexiconStore.attach(name, case_sensitive=config.case_sensitive)
+        return cls.from_store(store, config=config)
+
+    def _attach(self, store: ILexiconStore) -> None:
+        """Use ``store`` and set up the lookup cache and the lemma filter.
+
+        The cache belongs to this instance, so dropping the lexicon (e.g.
+        after a reload) drops its cached entries with it.
+        """
+
+        self._store = store
+        self._lookup_cached = lru_cache(maxsize=8192)(self._lookup_store)
+        self._content_hash: str | None = None
+        self._lemma_filter: BloomFilter | None = None
+        if self.config.bloom_filter is False:
+            return
+        self._lemma_filter = store.bloom_filter()
+        if self._lemma_filter is None and self.config.bloom_filter:
+            self._lemma_filter = BloomFilter.from_keys(list(store.iter_lemmas()))
 
     @classmethod
     def from_path(
@@ -96,6 +185,9 @@ class DialectAwareLexicon:
     ) -> DialectAwareLexicon:
         """Load entries from TSV or JSONL and build a dialect-aware lexicon.
 
+        SQLite files (``.sqlite``/``.db``) are opened in place instead of
+        being loaded into memory.
+
         Parameters
         ----------
         path:
@@ -111,41 +203,103 @@ class DialectAwareLexicon:
 
         file_path = Path(path)
         file_format = detect_format(file_path)
+        if file_format == "sqlite":
+            config = config or LexiconConfig()
+            store = SqliteLexiconStore(file_path, case_sensitive=config.case_sensitive)
+            return cls.from_store(store, config=config)
+        source = str(file_path.resolve())
         if file_format == "jsonl":
-            entries = read_jsonl(file_path)
-        elif file_format == "tsv":
-            entries = cls._read_tsv_with_compat(file_path)
-        else:
-            raise ValueError(f"Unsupported lexicon format: {file_path}")
-        return cls(entries, config=config)
+            return cls._load_snapshotted(
+                source, file_path.read_bytes, lambda: read_jsonl(file_path), config
+            )
+        if file_format == "tsv":
+            return cls._load_snapshotted(
+                source,
+                file_path.read_bytes,
+                lambda: cls._read_tsv_with_compat(file_path),
+                config,
+            )
+        raise ValueError(f"Unsupported lexicon format: {file_path}")
 
     @classmethod
     def load_seed(cls, config: LexiconConfig | None = None) -> DialectAwareLexicon:
         """Load the packaged seed lexicon as universal entries."""
 
-        with (
-            resources.files("furlan_g2p.data")
-            .joinpath("seed_lexicon.tsv")
-            .open("r", encoding="utf-8") as handle
-        ):
-            reader = csv.DictReader(handle, delimiter="\t")
-            entries: list[LexiconEntry] = []
-            for row in reader:
-                lemma = row["word"].strip()
-                ipa = canonicalize_ipa(row["ipa"].strip())
-                raw_variants = json.loads(row.get("variants_json", "[]") or "[]")
-                alternatives = [canonicalize_ipa(value) for value in raw_variants]
-                source = row["source"].strip() or "seed"
-                entries.append(
-                    LexiconEntry(
-                        lemma=lemma,
-                        ipa=ipa,
-                        dialect=None,
-                        source=source,
-                        alternatives=alternatives,
-                    )
+        seed = resources.files("furlan_g2p.data").joinpath("seed_lexicon.tsv")
+        return cls._load_snapshotted(
+            "furlan_g2p.data/seed_lexicon.tsv",
+            seed.read_bytes,
+            lambda: cls._read_seed(seed.read_text(encoding="utf-8")),
+            config,
+        )
+
+    @classmethod
+    def _load_snapshotted(
+        cls,
+        source: str,
+        data: Callable[[], bytes],
+        read: Callable[[], list[LexiconEntry]],
+        config: LexiconConfig | None,
+    ) -> DialectAwareLexicon:
+        """Build from the snapshot of ``data()`` if cached, else from ``read()``.
+
+        A freshly built lexicon's normalized entries and a Bloom filter over
+        its lemmas are written as the snapshot, replacing older snapshots of
+        the same ``source``; the stored filter is used when
+        ``config.bloom_filter`` is true. Snapshot
+        I/O errors are logged and never fail the load. With snapshots
+        disabled the source bytes are not read for hashing.
+        """
+
+        config = config or LexiconConfig()
+        if not config.snapshot:
+            return cls(read(), config=config)
+        directory = Path(config.snapshot_dir) if config.snapshot_dir else default_snapshot_dir()
+        path = snapshot_path(directory, source, data(), config.case_sensitive)
+        # Loading allocates only acyclic objects; pausing the cyclic collector
+        # avoids repeated full scans of the growing heap.
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            snapshot = read_snapshot(path)
+            if snapshot is not None:
+                entries, bloom = snapshot
+                if not config.bloom_filter:
+                    bloom = None
+                store = build_store(entries, config.storage, bloom)
+                return cls.from_store(store, config=config)
+        finally:
+            if collecting:
+                gc.enable()
+        lexicon = cls(read(), config=config)
+        try:
+            bloom = lexicon.lemma_filter or BloomFilter.from_keys(list(lexicon.store.iter_lemmas()))
+            write_snapshot(lexicon.iter_entries(), path, bloom)
+            prune_snapshots(path)
+        except OSError as exc:
+            logger.debug("Could not write lexicon snapshot %s: %s", path, exc)
+        return lexicon
+
+    @staticmethod
+    def _read_seed(text: str) -> list[LexiconEntry]:
+        reader = csv.DictReader(text.splitlines(), delimiter="\t")
+        entries: list[LexiconEntry] = []
+        for row in reader:
+            lemma = row["word"].strip()
+            ipa = canonicalize_ipa(row["ipa"].strip())
+            raw_variants = json.loads(row.get("variants_json", "[]") or "[]")
+            alternatives = [canonicalize_ipa(value) for value in raw_variants]
+            source = row["source"].strip() or "seed"
+            entries.append(
+                LexiconEntry(
+                    lemma=lemma,
+                    ipa=ipa,
+                    dialect=None,
+                    source=source,
+                    alternatives=alternatives,
                 )
-        return cls(entries=entries, config=config)
+            )
+        return entries
 
     def lookup(self, word: str, dialect: str | None = None) -> LexiconEntry | None:
         """Return the best matching entry for ``word`` and optional ``dialect``."""
@@ -153,14 +307,12 @@ class DialectAwareLexicon:
         normalized_word = _canonical_word(word, self.config.case_sensitive)
         if not normalized_word:
             return None
+        if self._lemma_filter is not None and normalized_word not in self._lemma_filter:
+            return None
         normalized_dialect = _normalize_dialect(dialect)
         entry, used_fallback = self._lookup_cached(normalized_word, normalized_dialect)
-        if used_fallback and normalized_dialect is not None:
-            logger.info(
-                "Lexicon fallback to universal entry for word=%r dialect=%r",
-                word,
-                normalized_dialect,
-            )
+        if used_fallback and normalized_dialect is not None and entry is not None:
+            self.fallbacks.record(word, normalized_dialect, entry.source)
         return entry
 
     def lookup_ipa(self, word: str, dialect: str | None = None) -> str | None:
@@ -169,6 +321,79 @@ class DialectAwareLexicon:
         entry = self.lookup(word, dialect=dialect)
         return entry.ipa if entry is not None else None
 
+    def lookup_many(
+        self,
+        words: Iterable[str],
+        dialect: str | None = None,
+    ) -> list[LexiconEntry | None]:
+        """Return the best entry for each of ``words``, in input order.
+
+        Equivalent to calling :meth:`lookup` per word (fallbacks are counted
+        per occurrence), but the dialect is resolved once and each distinct
+        word is normalized and resolved only once per call. Stores that
+        prefer batches (SQLite) are queried once for all distinct words.
+
+        Parameters
+        ----------
+        words:
+            Words to look up; duplicates are allowed.
+        dialect:
+            Optional dialect shared by all lookups.
+
+        Returns
+        -------
+        list[LexiconEntry | None]
+            One result per input word.
+        """
+
+        words = list(words)
+        case_sensitive = self.config.case_sensitive
+        normalized_dialect = _normalize_dialect(dialect)
+        lemma_filter = self._lemma_filter
+        keys: dict[str, str] = {}
+        for word in words:
+            if word not in keys:
+                key = _canonical_word(word, case_sensitive)
+                # Empty keys are resolved as misses below.
+                keys[word] = key if lemma_filter is None or key in lemma_filter else ""
+
+        missing: tuple[LexiconEntry | None, bool] = (None, False)
+        resolved: dict[str, tuple[LexiconEntry | None, bool]]
+        if self._store.prefers_batches:
+            found = self._store.candidates_many(key for key in keys.values() if key)
+            by_key = {
+                key: self._resolve(candidates, normalized_dialect)
+                for key, candidates in found.items()
+            }
+            resolved = {word: by_key.get(key, missing) for word, key in keys.items()}
+        else:
+            resolve = self._lookup_cached
+            resolved = {
+                word: resolve(key, normalized_dialect) if key else missing
+                for word, key in keys.items()
+            }
+
+        record = self.fallbacks.record
+        results: list[LexiconEntry | None] = []
+        for word in words:
+            entry, used_fallback = resolved[word]
+            if used_fallback and normalized_dialect is not None and entry is not None:
+                record(word, normalized_dialect, entry.source)
+            results.append(entry)
+        return results
+
+    def lookup_ipa_many(
+        self,
+        words: Iterable[str],
+        dialect: str | None = None,
+    ) -> list[str | None]:
+        """Return the primary IPA for each of ``words``, in input order."""
+
+        return [
+            entry.ipa if entry is not None else None
+            for entry in self.lookup_many(words, dialect=dialect)
+        ]
+
     def get_alternatives(self, word: str, dialect: str | None = None) -> list[str]:
         """Return alternative pronunciations for ``word``."""
 
@@ -187,7 +412,7 @@ class DialectAwareLexicon:
 
         if self.config.return_alternatives:
             lemma_key = _canonical_word(word, self.config.case_sensitive)
-            for candidate in self._entries_by_lemma.get(lemma_key, []):
+            for candidate in self._store.candidates(lemma_key):
                 for value in [candidate.ipa, *candidate.alternatives]:
                     if value in seen:
                         continue
@@ -208,7 +433,7 @@ class DialectAwareLexicon:
         by_source: dict[str, int] = {}
         entries_with_alternatives = 0
 
-        for entry in self._entries.values():
+        for entry in self._store:
             dialect_key = entry.dialect or "universal"
             by_dialect[dialect_key] = by_dialect.get(dialect_key, 0) + 1
             by_source[entry.source] = by_source.get(entry.source, 0) + 1
@@ -216,8 +441,8 @@ class DialectAwareLexicon:
                 entries_with_alternatives += 1
 
         return {
-            "total_entries": len(self._entries),
-            "total_lemmas": len(self._entries_by_lemma),
+            "total_entries": len(self._store),
+            "total_lemmas": self._store.lemma_count(),
             "entries_by_dialect": by_dialect,
             "entries_by_source": by_source,
             "entries_with_alternatives": entries_with_alternatives,
@@ -226,46 +451,128 @@ class DialectAwareLexicon:
     def iter_entries(self) -> Iterable[LexiconEntry]:
         """Iterate all indexed entries."""
 
-        return self._entries.values()
+        return iter(self._store)
+
+    def content_hash(self) -> str:
+        """Return a digest of the indexed entries and lookup settings.
+
+        The digest is independent of entry order and storage backend, so
+        the same lexicon loaded from TSV, JSONL or SQLite hashes equally.
+        It is computed on first use (one pass over the store) and kept.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the lexicon content.
+        """
+
+        if self._content_hash is None:
+            total = 0
+            for entry in self._store:
+                record = [
+                    entry.lemma,
+                    entry.ipa,
+                    entry.dialect,
+                    entry.source,
+                    entry.confidence,
+                    entry.frequency,
+                    entry.alternatives,
+                ]
+                digest = blake2b(
+                    json.dumps(record, ensure_ascii=False).encode("utf-8"), digest_size=8
+                ).digest()
+                total = (total + int.from_bytes(digest, "little")) % (1 << 64)
+            settings = [
+                self.config.default_dialect,
+                self.config.fallback_to_universal,
+                self.config.case_sensitive,
+                len(self._store),
+                total,
+            ]
+            self._content_hash = blake2b(
+                json.dumps(settings).encode("utf-8"), digest_size=16
+            ).hexdigest()
+        return self._content_hash
+
+    def publish_shared(self, name: str | None = None) -> SharedLexiconStore:
+        """Copy the indexed entries into a named shared-memory segment.
+
+        Other processes attach with :meth:`from_shared` and share one
+        physical copy of the lexicon.
+
+        Parameters
+        ----------
+        name:
+            Segment name; a random one is chosen when omitted.
+
+        Returns
+        -------
+        SharedLexiconStore
+            Owning store; keep it open while readers need the segment and
+            call ``unlink()`` when done.
+        """
+
+        return SharedLexiconStore.publish(
+            self.iter_entries(), name=name, case_sensitive=self.config.case_sensitive
+        )
+
+    @property
+    def store(self) -> ILexiconStore:
+        """Storage backend holding the indexed entries."""
+
+        return self._store
+
+    @property
+    def lemma_filter(self) -> BloomFilter | None:
+        """Bloom filter consulted before lookups, if enabled."""
+
+        return self._lemma_filter
 
     def __len__(self) -> int:
-        return len(self._entries)
+        return len(self._store)
 
-    @lru_cache(maxsize=8192)  # noqa: B019 - deliberate cache on bound method
-    def _lookup_cached(
+    def _lookup_store(
         self,
         normalized_word: str,
         normalized_dialect: str | None,
     ) -> tuple[LexiconEntry | None, bool]:
+        return self._resolve(self._store.candidates(normalized_word), normalized_dialect)
+
+    def _resolve(
+        self,
+        candidates: Sequence[LexiconEntry],
+        normalized_dialect: str | None,
+    ) -> tuple[LexiconEntry | None, bool]:
+        """Pick the entry for ``normalized_dialect`` among one lemma's entries.
+
+        Returns the entry and whether it is a universal fallback.
+        """
+
+        if not candidates:
+            return None, False
+        by_dialect = {entry.dialect: entry for entry in candidates}
+        universal = by_dialect.get(None)
+
         if normalized_dialect is not None:
-            dialect_entry = self._entries.get((normalized_word, normalized_dialect))
+            dialect_entry = by_dialect.get(normalized_dialect)
             if dialect_entry is not None:
                 return dialect_entry, False
-            if self.config.fallback_to_universal:
-                universal = self._entries.get((normalized_word, None))
-                if universal is not None:
-                    return universal, True
+            if self.config.fallback_to_universal and universal is not None:
+                return universal, True
             return None, False
 
         default_dialect = _normalize_dialect(self.config.default_dialect)
         if default_dialect is not None:
-            preferred = self._entries.get((normalized_word, default_dialect))
+            preferred = by_dialect.get(default_dialect)
             if preferred is not None:
                 return preferred, False
-            if self.config.fallback_to_universal:
-                universal = self._entries.get((normalized_word, None))
-                if universal is not None:
-                    return universal, True
+            if self.config.fallback_to_universal and universal is not None:
+                return universal, True
 
-        universal = self._entries.get((normalized_word, None))
         if universal is not None:
             return universal, False
 
-        dialect_entries = self._entries_by_lemma.get(normalized_word, [])
-        if not dialect_entries:
-            return None, False
-
-        best = max(dialect_entries, key=lambda entry: entry.confidence)
+        best = max(candidates, key=lambda entry: entry.confidence)
         return best, False
 
     @classmethod
@@ -333,11 +640,15 @@ class DialectAwareLexicon:
             alternatives=alternatives,
         )
 
-    def _merge_entry(self, entry: LexiconEntry) -> None:
+    def _merge_entry(
+        self,
+        merged: dict[tuple[str, str | None], LexiconEntry],
+        entry: LexiconEntry,
+    ) -> None:
         key = (entry.lemma, entry.dialect)
-        existing = self._entries.get(key)
+        existing = merged.get(key)
         if existing is None:
-            self._entries[key] = entry
+            merged[key] = entry
             return
 
         if entry.confidence > existing.confidence:
@@ -348,7 +659,7 @@ class DialectAwareLexicon:
             secondary = entry
 
         merged_alternatives = self._merge_alternatives(primary, secondary)
-        self._entries[key] = replace(primary, alternatives=merged_alternatives)
+        merged[key] = replace(primary, alternatives=merged_alternatives)
 
     @staticmethod
     def _merge_alternatives(primary: LexiconEntry, secondary: LexiconEntry) -> list[str]:
@@ -0,0 +1,246 @@
+"""Lexicon wrapper that reloads its source file when it changes."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from ..core.interfaces import ILexiconStore
+from .bloom import BloomFilter
+from .fallback import FallbackTracker
+from .lookup import DialectAwareLexicon
+from .schema import LexiconConfig, LexiconEntry
+
+logger = logging.getLogger(__name__)
+
+LexiconLoader = Callable[[Path, LexiconConfig], DialectAwareLexicon]
+"""Callable building a lexicon from a path, e.g. ``DialectAwareLexicon.from_path``."""
+
+ReloadListener = Callable[[DialectAwareLexicon], None]
+"""Callback receiving the new lexicon right after a swap."""
+
+# (mtime_ns, size, inode): changes whenever the file is rewritten or replaced.
+_Signature = tuple[int, int, int]
+
+
+def _file_signature(path: Path) -> _Signature | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class ReloadableLexicon:
+    """Dialect-aware lexicon that picks up changes to its source file.
+
+    A background thread polls the file signature (mtime, size, inode) every
+    ``poll_interval`` seconds. When it changes, the new lexicon is built on
+    that thread while lookups keep using the current one; the finished
+    lexicon is then swapped in with a single reference assignment, so a
+    lookup sees either the old or the new lexicon, never a partial one.
+    Each lexicon owns its lookup cache, which goes away with the old one;
+    after a swap ``on_reload`` listeners run so callers can drop their own
+    word-level caches. A file that fails to load, or loads empty while the
+    current lexicon is not, is logged and skipped until it changes again.
+    Writers should still replace the file atomically (write a temporary
+    file, then rename it), since the TSV/JSONL readers skip malformed rows
+    of a partially written file.
+
+    Lookup methods mirror :class:`DialectAwareLexicon`; fallbacks are
+    counted on one tracker that survives reloads.
+
+    Parameters
+    ----------
+    path:
+        Lexicon file (TSV, JSONL or SQLite).
+    config:
+        Lookup configuration for every loaded lexicon.
+    poll_interval:
+        Seconds between file checks once :meth:`start` was called.
+    loader:
+        Builds a lexicon from ``(path, config)``; defaults to
+        :meth:`DialectAwareLexicon.from_path`.
+    on_reload:
+        Listeners called after each swap.
+
+    Examples
+    --------
+    >>> lexicon = ReloadableLexicon("lexicon.tsv").start()  # doctest: +SKIP
+    >>> lexicon.lookup_ipa("cjase")  # doctest: +SKIP
+    'ˈcaze'
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        config: LexiconConfig | None = None,
+        poll_interval: float = 5.0,
+        loader: LexiconLoader | None = None,
+        on_reload: Iterable[ReloadListener] = (),
+    ) -> None:
+        self.path = Path(path)
+        self.config = config or LexiconConfig()
+        self.poll_interval = poll_interval
+        self.fallbacks = FallbackTracker(logger)
+        self.generation = 0
+        self._loader: LexiconLoader = loader or DialectAwareLexicon.from_path
+        self._listeners = list(on_reload)
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._signature = _file_signature(self.path)
+        self._current = self._load()
+
+    @property
+    def current(self) -> DialectAwareLexicon:
+        """Lexicon serving lookups right now."""
+
+        return self._current
+
+    def add_listener(self, listener: ReloadListener) -> None:
+        """Register a callback run after every swap."""
+
+        self._listeners.append(listener)
+
+    def start(self) -> ReloadableLexicon:
+        """Start the background polling thread (idempotent) and return ``self``."""
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._poll, name=f"lexicon-reload:{self.path.name}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the polling thread."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def check(self) -> bool:
+        """Reload now if the file changed since the last attempt.
+
+        Returns
+        -------
+        bool
+            True if a new lexicon was swapped in.
+        """
+
+        if _file_signature(self.path) == self._signature:
+            return False
+        return self.reload()
+
+    def reload(self) -> bool:
+        """Rebuild from the file and swap it in; keep the current one on failure."""
+
+        with self._reload_lock:
+            self._signature = _file_signature(self.path)
+            try:
+                fresh = self._load()
+            except Exception:  # noqa: BLE001 - a bad file must not kill the poller
+                logger.exception("Lexicon reload from %s failed; keeping current", self.path)
+                return False
+            if not len(fresh) and len(self._current):
+                logger.error("Lexicon %s loaded empty; keeping current", self.path)
+                return False
+            self._current = fresh
+            self.generation += 1
+            for listener in self._listeners:
+                try:
+                    listener(fresh)
+                except Exception:  # noqa: BLE001 - one listener must not block the others
+                    logger.exception("Lexicon reload listener %r failed", listener)
+        logger.info("Reloaded lexicon from %s (%d entries)", self.path, len(fresh))
+        return True
+
+    def lookup(self, word: str, dialect: str | None = None) -> LexiconEntry | None:
+        """See :meth:`DialectAwareLexicon.lookup`."""
+
+        return self._current.lookup(word, dialect=dialect)
+
+    def lookup_ipa(self, word: str, dialect: str | None = None) -> str | None:
+        """See :meth:`DialectAwareLexicon.lookup_ipa`."""
+
+        return self._current.lookup_ipa(word, dialect=dialect)
+
+    def lookup_many(
+        self,
+        words: Iterable[str],
+        dialect: str | None = None,
+    ) -> list[LexiconEntry | None]:
+        """See :meth:`DialectAwareLexicon.lookup_many`."""
+
+        return self._current.lookup_many(words, dialect=dialect)
+
+    def lookup_ipa_many(
+        self,
+        words: Iterable[str],
+        dialect: str | None = None,
+    ) -> list[str | None]:
+        """See :meth:`DialectAwareLexicon.lookup_ipa_many`."""
+
+        return self._current.lookup_ipa_many(words, dialect=dialect)
+
+    def get_alternatives(self, word: str, dialect: str | None = None) -> list[str]:
+        """See :meth:`DialectAwareLexicon.get_alternatives`."""
+
+        return self._current.get_alternatives(word, dialect=dialect)
+
+    def has_entry(self, word: str, dialect: str | None = None) -> bool:
+        """See :meth:`DialectAwareLexicon.has_entry`."""
+
+        return self._current.has_entry(word, dialect=dialect)
+
+    def stats(self) -> dict[str, object]:
+        """Return current lexicon statistics plus the reload generation."""
+
+        stats = self._current.stats()
+        stats["generation"] = self.generation
+        return stats
+
+    def iter_entries(self) -> Iterable[LexiconEntry]:
+        """Iterate entries of the current lexicon."""
+
+        return self._current.iter_entries()
+
+    def content_hash(self) -> str:
+        """Return the content digest of the current lexicon."""
+
+        return self._current.content_hash()
+
+    @property
+    def store(self) -> ILexiconStore:
+        """Storage backend of the current lexicon."""
+
+        return self._current.store
+
+    @property
+    def lemma_filter(self) -> BloomFilter | None:
+        """Bloom filter of the current lexicon, if enabled."""
+
+        return self._current.lemma_filter
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def _load(self) -> DialectAwareLexicon:
+        lexicon = self._loader(self.path, self.config)
+        lexicon.fallbacks = self.fallbacks
+        return lexicon
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check()
+            except Exception:  # noqa: BLE001 - keep polling after unexpected errors
+                logger.exception("Lexicon reload check for %s failed", self.path)
+
+
+__all__ = ["LexiconLoader", "ReloadListener", "ReloadableLexicon"]
@@ -15,6 +15,9 @@ _IPA_PATTERN: Final[re.Pattern[str]] = re.compile(
 # Valid dialect codes
 _VALID_DIALECTS: Final[set[str]] = {"central", "western", "carnic"}
 
+# Valid in-memory storage backends (see ``lexicon.stores``)
+_VALID_STORAGE: Final[set[str]] = {"dict", "compact"}
+
 
 @dataclass(frozen=True)
 class LexiconEntry:
@@ -113,6 +116,24 @@ class LexiconConfig:
         If True, perform case-sensitive lookups.
     return_alternatives : bool
         If True, include alternative pronunciations in lookup results.
+    storage : str
+        In-memory backend: ``"dict"`` keeps entry objects (fastest lookups),
+        ``"compact"`` keeps columnar arrays (several times smaller for large
+        lexica, entries built on demand).
+    bloom_filter : bool | None
+        Bloom filter over lemmas checked before each lookup so definite
+        misses skip the cache and store. ``None`` uses a filter only when
+        the store ships one (SQLite files, shared segments), ``True`` also
+        uses a snapshot's filter or builds one at load time for in-memory
+        stores, ``False`` disables it.
+    snapshot : bool
+        If True, ``load_seed``/``from_path`` keep a pre-normalized snapshot
+        of TSV/JSONL lexica in ``snapshot_dir``, keyed by a hash of the
+        file, and later loads of the same file read it instead of parsing,
+        canonicalizing and merging the entries again.
+    snapshot_dir : str | None
+        Snapshot directory; None uses ``lexicon/`` under the cache
+        directory (``$FURLAN_G2P_CACHE_DIR`` or ``~/.cache/furlan_g2p``).
 
     Examples
     --------
@@ -127,9 +148,18 @@ class LexiconConfig:
     fallback_to_universal: bool = True
     case_sensitive: bool = False
     return_alternatives: bool = False
+    storage: str = "dict"
+    bloom_filter: bool | None = None
+    snapshot: bool = True
+    snapshot_dir: str | None = None
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
+        if self.storage not in _VALID_STORAGE:
+            raise ValueError(
+                f"Invalid storage '{self.storage}'. "
+                f"Valid storage: {', '.join(sorted(_VALID_STORAGE))}"
+            )
         if self.default_dialect is not None and self.default_dialect not in _VALID_DIALECTS:
             raise ValueError(
                 f"Invalid default_dialect '{self.default_dialect}'. "
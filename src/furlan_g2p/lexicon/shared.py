@@ -0,0 +1,400 @@
+"""Lexicon store living in a named shared-memory segment."""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from ..core.interfaces import ILexiconStore
+from .bloom import BloomFilter
+from .schema import LexiconEntry
+
+SHARED_FORMAT_VERSION = 2
+"""Layout version written by :meth:`SharedLexiconStore.publish`."""
+
+_MAGIC = b"FGSL"
+# magic, version, metadata length
+_HEADER = struct.Struct("<4sBI")
+_NO_FREQUENCY = -1
+# Separates alternatives inside one row's slice of the alternatives blob.
+_ALT_SEPARATOR = "\x1f"
+# Sections in layout order: name, array typecode.
+_SECTIONS = (
+    ("slots", "I"),
+    ("lemma_offsets", "I"),
+    ("group_starts", "I"),
+    ("ipa_offsets", "I"),
+    ("alt_offsets", "I"),
+    ("source_codes", "I"),
+    ("confidence", "d"),
+    ("frequency", "q"),
+    ("dialect_codes", "B"),
+    ("lemmas", "B"),
+    ("ipa", "B"),
+    ("alternatives", "B"),
+    ("bloom", "B"),
+)
+_ATTACH_LOCK = threading.Lock()
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _buffer(memory: SharedMemory) -> memoryview:
+    buffer = memory.buf
+    if buffer is None:
+        raise ValueError(f"Shared memory segment {memory.name!r} is closed")
+    return buffer
+
+
+def _open_untracked(name: str) -> SharedMemory:
+    """Attach to ``name`` without letting this process's resource tracker unlink it at exit."""
+
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    # Before 3.13 attaching registers the segment with the resource tracker,
+    # which would destroy it when an unrelated reader process exits.
+    with _ATTACH_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class SharedLexiconStore(ILexiconStore):
+    """Read-only lexicon store whose data lives in shared memory.
+
+    One process calls :meth:`publish` to lay the normalized entries out in
+    a named :class:`multiprocessing.shared_memory.SharedMemory` segment;
+    any process on the host (forked, spawned or unrelated) calls
+    :meth:`attach` with the segment name. All of them read the same
+    physical pages: the layout is a set of flat arrays (an open-addressing
+    lemma hash table keyed by CRC-32, row offsets, typed columns and UTF-8
+    blobs) accessed through ``memoryview`` casts, and
+    :class:`LexiconEntry` objects are only built for looked-up lemmas. The
+    segment also holds a :class:`BloomFilter` over the lemmas, which
+    :meth:`bloom_filter` reads in place.
+    Wrap the store with :meth:`DialectAwareLexicon.from_store` (or use
+    :meth:`DialectAwareLexicon.from_shared`).
+
+    Pickling a store pickles its segment name, so it can be passed to
+    ``spawn`` workers, which attach on unpickling.
+
+    Parameters
+    ----------
+    memory:
+        Open segment holding a published layout.
+    owner:
+        True for the publishing process; only the owner should
+        :meth:`unlink` the segment.
+
+    Raises
+    ------
+    ValueError
+        If the segment does not hold a compatible layout.
+
+    Examples
+    --------
+    >>> store = SharedLexiconStore.publish([LexiconEntry(lemma="cjase", ipa="ˈcaze")])
+    >>> SharedLexiconStore.attach(store.name).candidates("cjase")[0].ipa
+    'ˈcaze'
+    >>> store.unlink()
+    """
+
+    def __init__(self, memory: SharedMemory, owner: bool = False) -> None:
+        self._memory = memory
+        self.owner = owner
+        buffer = _buffer(memory)
+        magic, version, meta_size = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != SHARED_FORMAT_VERSION:
+            raise ValueError(f"Shared memory segment {memory.name!r} is not a shared lexicon")
+        meta = json.loads(bytes(buffer[_HEADER.size : _HEADER.size + meta_size]))
+        self.case_sensitive: bool = meta["case_sensitive"]
+        self._size: int = meta["entries"]
+        self._lemma_count: int = meta["lemmas"]
+        self._dialects: list[str | None] = meta["dialects"]
+        self._sources: list[str] = meta["sources"]
+        views: dict[str, memoryview] = {}
+        for (name, typecode), (start, end) in zip(_SECTIONS, meta["sections"], strict=True):
+            views[name] = buffer[start:end].cast(typecode)  # type: ignore[call-overload]
+        self._slots = views["slots"]
+        self._lemma_offsets = views["lemma_offsets"]
+        self._group_starts = views["group_starts"]
+        self._ipa_offsets = views["ipa_offsets"]
+        self._alt_offsets = views["alt_offsets"]
+        self._source_codes = views["source_codes"]
+        self._confidence = views["confidence"]
+        self._frequency = views["frequency"]
+        self._dialect_codes = views["dialect_codes"]
+        self._lemmas = views["lemmas"]
+        self._ipa = views["ipa"]
+        self._alternatives = views["alternatives"]
+        self._mask = len(self._slots) - 1
+        self._views = tuple(views.values())
+        self._bloom = BloomFilter.from_bytes(views["bloom"], copy=False)
+
+    @classmethod
+    def publish(
+        cls,
+        entries: Iterable[LexiconEntry],
+        name: str | None = None,
+        case_sensitive: bool = False,
+    ) -> SharedLexiconStore:
+        """Lay ``entries`` out in a new shared-memory segment.
+
+        Parameters
+        ----------
+        entries:
+            Normalized entries with unique ``(lemma, dialect)`` keys, e.g.
+            ``DialectAwareLexicon.iter_entries()``.
+        name:
+            Segment name; a random one is chosen when omitted.
+        case_sensitive:
+            Lemma normalization of ``entries``; readers must match it.
+
+        Returns
+        -------
+        SharedLexiconStore
+            Owning store; keep it alive while readers need the segment and
+            call :meth:`unlink` when done.
+
+        Raises
+        ------
+        FileExistsError
+            If a segment called ``name`` already exists.
+        ValueError
+            If a blob exceeds the 4 GiB addressable by the layout.
+        """
+
+        groups: dict[str, list[LexiconEntry]] = {}
+        for entry in entries:
+            groups.setdefault(entry.lemma, []).append(entry)
+
+        columns: dict[str, array[Any]] = {
+            section_name: array(typecode) for section_name, typecode in _SECTIONS
+        }
+        lemmas, ipa, alternatives = bytearray(), bytearray(), bytearray()
+        columns["lemma_offsets"].append(0)
+        columns["group_starts"].append(0)
+        columns["ipa_offsets"].append(0)
+        columns["alt_offsets"].append(0)
+        dialect_codes: dict[str | None, int] = {}
+        source_codes: dict[str, int] = {}
+        rows = 0
+        for lemma, group in groups.items():
+            lemmas += lemma.encode("utf-8")
+            columns["lemma_offsets"].append(len(lemmas))
+            for entry in group:
+                ipa += entry.ipa.encode("utf-8")
+                columns["ipa_offsets"].append(len(ipa))
+                alternatives += _ALT_SEPARATOR.join(entry.alternatives).encode("utf-8")
+                columns["alt_offsets"].append(len(alternatives))
+                columns["dialect_codes"].append(
+                    dialect_codes.setdefault(entry.dialect, len(dialect_codes))
+                )
+                columns["source_codes"].append(
+                    source_codes.setdefault(entry.source, len(source_codes))
+                )
+                columns["confidence"].append(entry.confidence)
+                columns["frequency"].append(
+                    _NO_FREQUENCY if entry.frequency is None else entry.frequency
+                )
+                rows += 1
+            columns["group_starts"].append(rows)
+        if max(len(lemmas), len(ipa), len(alternatives)) >= 1 << 32:
+            raise ValueError("Lexicon too large for the shared layout (4 GiB per blob)")
+        columns["lemmas"].frombytes(lemmas)
+        columns["ipa"].frombytes(ipa)
+        columns["alternatives"].frombytes(alternatives)
+        columns["bloom"].frombytes(BloomFilter.from_keys(list(groups)).to_bytes())
+
+        # Open addressing at a load factor of at most 1/2.
+        size = 1 << max(3, (2 * len(groups)).bit_length())
+        slots = columns["slots"]
+        slots.frombytes(bytes(slots.itemsize * size))
+        for group_index, lemma in enumerate(groups):
+            slot = zlib.crc32(lemma.encode("utf-8")) & (size - 1)
+            while slots[slot]:
+                slot = (slot + 1) & (size - 1)
+            slots[slot] = group_index + 1
+
+        sections: list[tuple[int, int]] = []
+        meta: dict[str, object] = {
+            "case_sensitive": case_sensitive,
+            "entries": rows,
+            "lemmas": len(groups),
+            "dialects": list(dialect_codes),
+            "sources": list(source_codes),
+            "sections": sections,
+        }
+        # Section offsets depend on the metadata length, which depends on the
+        # offsets' digits; reserve room by padding the metadata to a fixed size.
+        provisional = len(json.dumps(meta)) + 40 * len(_SECTIONS)
+        offset = _align(_HEADER.size + provisional)
+        for section_name, _ in _SECTIONS:
+            nbytes = len(columns[section_name]) * columns[section_name].itemsize
+            sections.append((offset, offset + nbytes))
+            offset = _align(offset + nbytes)
+        encoded = json.dumps(meta).encode("utf-8")
+        if len(encoded) > provisional:
+            raise ValueError("Shared lexicon metadata exceeds its reserved size")
+        encoded = encoded.ljust(provisional)
+
+        memory = SharedMemory(name=name, create=True, size=max(offset, 1))
+        try:
+            buffer = _buffer(memory)
+            buffer[: _HEADER.size] = _HEADER.pack(_MAGIC, SHARED_FORMAT_VERSION, provisional)
+            buffer[_HEADER.size : _HEADER.size + provisional] = encoded
+            for (section_name, _), (start, end) in zip(_SECTIONS, sections, strict=True):
+                buffer[start:end] = columns[section_name].tobytes()
+            return cls(memory, owner=True)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str, case_sensitive: bool = False) -> SharedLexiconStore:
+        """Open the segment published as ``name``.
+
+        Parameters
+        ----------
+        name:
+            Segment name (:attr:`name` of the publishing store).
+        case_sensitive:
+            Lemma normalization expected by the caller; must match.
+
+        Returns
+        -------
+        SharedLexiconStore
+            Reader over the shared pages; exiting the reader never removes
+            the segment.
+
+        Raises
+        ------
+        FileNotFoundError
+            If no segment called ``name`` exists.
+        ValueError
+            If the segment is not a compatible lexicon or ``case_sensitive``
+            differs from the published one.
+        """
+
+        memory = _open_untracked(name)
+        try:
+            store = cls(memory)
+        except (ValueError, struct.error, json.JSONDecodeError) as exc:
+            memory.close()
+            raise ValueError(f"Shared memory segment {name!r} is not a shared lexicon") from exc
+        if store.case_sensitive != case_sensitive:
+            store.close()
+            raise ValueError(
+                f"Shared lexicon {name!r} was published with case_sensitive={store.case_sensitive}"
+            )
+        return store
+
+    @property
+    def name(self) -> str:
+        """Name of the shared-memory segment."""
+
+        return self._memory.name
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the shared segment in bytes."""
+
+        return self._memory.size
+
+    def candidates(self, lemma: str) -> list[LexiconEntry]:
+        group = self._find(lemma)
+        if group < 0:
+            return []
+        return [
+            self._materialize(lemma, row)
+            for row in range(self._group_starts[group], self._group_starts[group + 1])
+        ]
+
+    def lemma_count(self) -> int:
+        return self._lemma_count
+
+    def bloom_filter(self) -> BloomFilter:
+        """Return the published lemma filter, reading the shared pages in place."""
+
+        return self._bloom
+
+    def iter_lemmas(self) -> Iterator[str]:
+        offsets, lemmas = self._lemma_offsets, self._lemmas
+        for group in range(self._lemma_count):
+            yield str(lemmas[offsets[group] : offsets[group + 1]], "utf-8")
+
+    def __iter__(self) -> Iterator[LexiconEntry]:
+        for group, lemma in enumerate(self.iter_lemmas()):
+            for row in range(self._group_starts[group], self._group_starts[group + 1]):
+                yield self._materialize(lemma, row)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __reduce__(self) -> tuple[Any, tuple[str, bool]]:
+        return SharedLexiconStore.attach, (self.name, self.case_sensitive)
+
+    def close(self) -> None:
+        """Release this process's mapping (the segment stays for other readers)."""
+
+        self._bloom.release()
+        for view in self._views:
+            view.release()
+        self._memory.close()
+
+    def __del__(self) -> None:
+        # The segment cannot unmap while views into it are alive.
+        if hasattr(self, "_bloom"):
+            self.close()
+
+    def unlink(self) -> None:
+        """Close the mapping and remove the segment (publisher only)."""
+
+        self.close()
+        self._memory.unlink()
+
+    def _find(self, lemma: str) -> int:
+        """Return the group index of ``lemma``, or -1."""
+
+        key = lemma.encode("utf-8")
+        slots, offsets, lemmas, mask = self._slots, self._lemma_offsets, self._lemmas, self._mask
+        slot = zlib.crc32(key) & mask
+        while True:
+            group = slots[slot] - 1
+            if group < 0:
+                return -1
+            if lemmas[offsets[group] : offsets[group + 1]] == key:
+                return group
+            slot = (slot + 1) & mask
+
+    def _materialize(self, lemma: str, row: int) -> LexiconEntry:
+        frequency = self._frequency[row]
+        alternatives = str(
+            self._alternatives[self._alt_offsets[row] : self._alt_offsets[row + 1]], "utf-8"
+        )
+        return LexiconEntry(
+            lemma=lemma,
+            ipa=str(self._ipa[self._ipa_offsets[row] : self._ipa_offsets[row + 1]], "utf-8"),
+            dialect=self._dialects[self._dialect_codes[row]],
+            source=self._sources[self._source_codes[row]],
+            confidence=self._confidence[row],
+            frequency=None if frequency == _NO_FREQUENCY else frequency,
+            alternatives=alternatives.split(_ALT_SEPARATOR) if alternatives else [],
+        )
+
+
+__all__ = ["SHARED_FORMAT_VERSION", "SharedLexiconStore"]
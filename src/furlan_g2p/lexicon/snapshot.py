@@ -0,0 +1,188 @@
+"""Pre-normalized lexicon snapshots cached on disk."""
+
+from __future__ import annotations
+
+import logging
+import marshal
+import os
+import tempfile
+from collections.abc import Iterable
+from hashlib import blake2b
+from pathlib import Path
+
+from ..__about__ import __version__
+from ..config import default_cache_dir
+from .bloom import BloomFilter
+from .schema import LexiconEntry
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 2
+_MAGIC = b"FGLS"
+_HEADER = _MAGIC + bytes([SNAPSHOT_VERSION])
+
+_Row = tuple[str, str, str | None, str, float, int | None, list[str]]
+
+
+def default_snapshot_dir() -> Path:
+    """Return ``lexicon/`` inside :func:`furlan_g2p.config.default_cache_dir`."""
+
+    return default_cache_dir() / "lexicon"
+
+
+def snapshot_key(data: bytes, case_sensitive: bool) -> str:
+    """Return the snapshot name for a lexicon source.
+
+    Parameters
+    ----------
+    data:
+        Raw bytes of the source file.
+    case_sensitive:
+        ``LexiconConfig.case_sensitive``, which changes lemma normalization.
+
+    Returns
+    -------
+    str
+        Hex digest of the file content, the normalization setting, the
+        snapshot format and the package version (normalization code may
+        change between releases).
+    """
+
+    digest = blake2b(data, digest_size=16)
+    digest.update(f"|{int(case_sensitive)}|{SNAPSHOT_VERSION}|{__version__}".encode())
+    return digest.hexdigest()
+
+
+def snapshot_path(directory: Path, source: str, data: bytes, case_sensitive: bool) -> Path:
+    """Return the snapshot file for one version of a lexicon source.
+
+    Parameters
+    ----------
+    directory:
+        Snapshot directory.
+    source:
+        Stable identifier of the source (e.g. its resolved path).
+    data:
+        Raw bytes of the source file.
+    case_sensitive:
+        ``LexiconConfig.case_sensitive``.
+
+    Returns
+    -------
+    Path
+        ``<source id>-<snapshot_key>.snapshot``; the prefix is shared by
+        every version of the same source and normalization setting, which
+        lets :func:`prune_snapshots` drop outdated versions.
+    """
+
+    prefix = blake2b(f"{source}|{int(case_sensitive)}".encode(), digest_size=8).hexdigest()
+    return directory / f"{prefix}-{snapshot_key(data, case_sensitive)}.snapshot"
+
+
+def prune_snapshots(path: Path) -> int:
+    """Delete the other snapshots of the source ``path`` belongs to.
+
+    Parameters
+    ----------
+    path:
+        Current snapshot, as returned by :func:`snapshot_path`.
+
+    Returns
+    -------
+    int
+        Number of files removed (outdated file contents or package versions).
+    """
+
+    prefix = path.name.partition("-")[0]
+    removed = 0
+    for stale in path.parent.glob(f"{prefix}-*.snapshot"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def write_snapshot(
+    entries: Iterable[LexiconEntry],
+    path: Path,
+    bloom: BloomFilter | None = None,
+) -> None:
+    """Write normalized entries and their lemma filter to ``path`` atomically.
+
+    Parameters
+    ----------
+    entries:
+        Normalized, merged entries (as indexed by ``DialectAwareLexicon``).
+    path:
+        Destination; parent directories are created.
+    bloom:
+        Optional Bloom filter over the entries' lemmas, stored so loads
+        with ``bloom_filter=True`` need not hash every lemma again.
+    """
+
+    rows: list[_Row] = [
+        (
+            entry.lemma,
+            entry.ipa,
+            entry.dialect,
+            entry.source,
+            entry.confidence,
+            entry.frequency,
+            list(entry.alternatives),
+        )
+        for entry in entries
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(_HEADER)
+            marshal.dump((rows, bloom.to_bytes() if bloom is not None else None), handle)
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+def read_snapshot(path: Path) -> tuple[list[LexiconEntry], BloomFilter | None] | None:
+    """Return the contents of the snapshot at ``path``, or ``None`` if absent or unreadable.
+
+    Parameters
+    ----------
+    path:
+        Snapshot file.
+
+    Returns
+    -------
+    tuple[list[LexiconEntry], BloomFilter | None] | None
+        Entries exactly as written (they are not canonicalized again) and
+        the stored lemma filter, if any.
+    """
+
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if not data.startswith(_HEADER):
+        logger.warning("Ignoring lexicon snapshot %s: unknown format", path)
+        return None
+    try:
+        rows: list[_Row]
+        bloom: bytes | None
+        rows, bloom = marshal.loads(data[len(_HEADER) :])
+        entries = [LexiconEntry(*row) for row in rows]
+        return entries, BloomFilter.from_bytes(bloom) if bloom is not None else None
+    except (EOFError, ValueError, TypeError) as exc:
+        logger.warning("Ignoring lexicon snapshot %s: %s", path, exc)
+        return None
+
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "default_snapshot_dir",
+    "prune_snapshots",
+    "read_snapshot",
+    "snapshot_key",
+    "snapshot_path",
+    "write_snapshot",
+]
@@ -0,0 +1,247 @@
+"""SQLite storage backend for lexica too large to hold as Python objects."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import cast
+
+from ..core.interfaces import ILexiconStore
+from .bloom import BloomFilter
+from .schema import LexiconEntry
+
+SQLITE_SCHEMA_VERSION = 1
+"""Version stored in the ``meta`` table of files written by :func:`write_sqlite`."""
+
+# Stay below SQLITE_MAX_VARIABLE_NUMBER of old SQLite builds (999).
+_BATCH_SIZE = 500
+# SQLite unique indexes treat NULLs as distinct, so universal entries use ''.
+_UNIVERSAL = ""
+_NO_ALTERNATIVES = "[]"
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE bloom (data BLOB NOT NULL);
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    lemma TEXT NOT NULL,
+    dialect TEXT NOT NULL,
+    ipa TEXT NOT NULL,
+    source TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    frequency INTEGER,
+    alternatives TEXT NOT NULL
+);
+"""
+_INDEX = "CREATE UNIQUE INDEX entries_lemma_dialect ON entries (lemma, dialect)"
+_COLUMNS = "lemma, dialect, ipa, source, confidence, frequency, alternatives"
+
+_Row = tuple[str, str, str, str, float, int | None, str]
+
+
+def write_sqlite(entries: Iterable[LexiconEntry], path: Path, case_sensitive: bool = False) -> int:
+    """Write normalized entries to a new SQLite lexicon file.
+
+    The file is built next to ``path`` and moved into place when complete,
+    so readers never see a partial lexicon. It is left in WAL journal mode
+    and carries a :class:`~furlan_g2p.lexicon.bloom.BloomFilter` over the
+    lemmas for negative lookups.
+
+    Parameters
+    ----------
+    entries:
+        Normalized entries with unique ``(lemma, dialect)`` keys, e.g.
+        ``DialectAwareLexicon.iter_entries()``.
+    path:
+        Destination file.
+    case_sensitive:
+        Whether lemmas were normalized case-sensitively; recorded so readers
+        with a different setting are rejected.
+
+    Returns
+    -------
+    int
+        Number of entries written.
+    """
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        with connection:
+            connection.executemany(
+                f"INSERT INTO entries ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        entry.lemma,
+                        entry.dialect or _UNIVERSAL,
+                        entry.ipa,
+                        entry.source,
+                        entry.confidence,
+                        entry.frequency,
+                        json.dumps(entry.alternatives, ensure_ascii=False),
+                    )
+                    for entry in entries
+                ),
+            )
+            connection.execute(_INDEX)
+            (count,) = connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+            bloom = BloomFilter.from_keys(
+                [lemma for (lemma,) in connection.execute("SELECT DISTINCT lemma FROM entries")]
+            )
+            lemmas = len(bloom)
+            connection.execute("INSERT INTO bloom (data) VALUES (?)", (bloom.to_bytes(),))
+            connection.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("schema_version", str(SQLITE_SCHEMA_VERSION)),
+                    ("case_sensitive", "1" if case_sensitive else "0"),
+                    ("entries", str(count)),
+                    ("lemmas", str(lemmas)),
+                ],
+            )
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+    return int(count)
+
+
+class SqliteLexiconStore(ILexiconStore):
+    """Read-only lexicon store backed by an SQLite file.
+
+    Each thread (and each forked process) opens its own read-only connection
+    on first use. Entries are materialized per query, so memory stays flat
+    regardless of the lexicon size; :meth:`candidates_many` fetches a whole
+    token batch with ``IN (...)`` queries.
+
+    Parameters
+    ----------
+    path:
+        File written by :func:`write_sqlite`.
+    case_sensitive:
+        Lemma normalization expected by the caller; must match the file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If ``path`` does not exist.
+    ValueError
+        If the file is not a compatible lexicon database.
+    """
+
+    prefers_batches = True
+
+    def __init__(self, path: str | Path, case_sensitive: bool = False) -> None:
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(self.path)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        try:
+            meta = dict(self._connection().execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.DatabaseError as exc:
+            raise ValueError(f"Not an SQLite lexicon: {self.path} ({exc})") from exc
+        if meta.get("schema_version") != str(SQLITE_SCHEMA_VERSION):
+            raise ValueError(
+                f"Unsupported SQLite lexicon schema {meta.get('schema_version')!r} "
+                f"in {self.path}; expected {SQLITE_SCHEMA_VERSION}"
+            )
+        if (meta.get("case_sensitive") == "1") != case_sensitive:
+            raise ValueError(
+                f"SQLite lexicon {self.path} was built with "
+                f"case_sensitive={meta.get('case_sensitive') == '1'}"
+            )
+        self._size = int(meta["entries"])
+        self._lemma_count = int(meta["lemmas"])
+
+    def candidates(self, lemma: str) -> list[LexiconEntry]:
+        rows = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM entries WHERE lemma = ? ORDER BY id", (lemma,)
+        )
+        return [_entry_from_row(row) for row in rows]
+
+    def candidates_many(self, lemmas: Iterable[str]) -> dict[str, list[LexiconEntry]]:
+        connection = self._connection()
+        keys = list(dict.fromkeys(lemmas))
+        found: dict[str, list[LexiconEntry]] = {}
+        for start in range(0, len(keys), _BATCH_SIZE):
+            batch = keys[start : start + _BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            rows = connection.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE lemma IN ({placeholders}) ORDER BY id",
+                batch,
+            )
+            for row in rows:
+                found.setdefault(row[0], []).append(_entry_from_row(row))
+        return found
+
+    def lemma_count(self) -> int:
+        return self._lemma_count
+
+    def iter_lemmas(self) -> Iterator[str]:
+        for (lemma,) in self._connection().execute("SELECT DISTINCT lemma FROM entries"):
+            yield lemma
+
+    def bloom_filter(self) -> BloomFilter | None:
+        try:
+            row = self._connection().execute("SELECT data FROM bloom").fetchone()
+        except sqlite3.OperationalError:  # written without a filter
+            return None
+        return BloomFilter.from_bytes(row[0]) if row is not None else None
+
+    def close(self) -> None:
+        """Close every connection opened by this store."""
+
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def __iter__(self) -> Iterator[LexiconEntry]:
+        rows = self._connection().execute(f"SELECT {_COLUMNS} FROM entries ORDER BY id")
+        for row in rows:
+            yield _entry_from_row(row)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, reopening it after a fork."""
+
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+            self._local.connection = connection
+            self._local.pid = pid
+            with self._lock:
+                self._connections.append(connection)
+        return cast(sqlite3.Connection, self._local.connection)
+
+
+def _entry_from_row(row: _Row) -> LexiconEntry:
+    lemma, dialect, ipa, source, confidence, frequency, alternatives = row
+    return LexiconEntry(
+        lemma=lemma,
+        ipa=ipa,
+        dialect=dialect or None,
+        source=source,
+        confidence=confidence,
+        frequency=frequency,
+        alternatives=json.loads(alternatives) if alternatives != _NO_ALTERNATIVES else [],
+    )
+
+
+__all__ = ["SQLITE_SCHEMA_VERSION", "SqliteLexiconStore", "write_sqlite"]
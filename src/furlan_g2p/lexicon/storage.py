@@ -13,7 +13,7 @@ from .schema import LexiconEntry
 logger = logging.getLogger(__name__)
 
 FormatType = Literal["simple", "extended"]
-FileFormat = Literal["tsv", "jsonl", "unknown"]
+FileFormat = Literal["tsv", "jsonl", "sqlite", "unknown"]
 
 
 def detect_format(path: Path) -> FileFormat:
@@ -27,7 +27,7 @@ def detect_format(path: Path) -> FileFormat:
     Returns
     -------
     FileFormat
-        One of "tsv", "jsonl", or "unknown".
+        One of "tsv", "jsonl", "sqlite", or "unknown".
 
     Examples
     --------
@@ -41,6 +41,8 @@ def detect_format(path: Path) -> FileFormat:
         return "tsv"
     if suffix in {".jsonl", ".ndjson"}:
         return "jsonl"
+    if suffix in {".sqlite", ".sqlite3", ".db"}:
+        return "sqlite"
     return "unknown"
 
 
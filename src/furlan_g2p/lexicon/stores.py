@@ -0,0 +1,236 @@
+"""In-memory storage backends for :class:`~furlan_g2p.lexicon.DialectAwareLexicon`."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Hashable, Iterable, Iterator
+from sys import getsizeof
+from typing import TypeVar
+
+from ..core.interfaces import ILexiconStore
+from .bloom import BloomFilter
+from .schema import LexiconEntry
+
+_NO_FREQUENCY = -1
+
+_Key = TypeVar("_Key", bound=Hashable)
+
+
+class DictLexiconStore(ILexiconStore):
+    """Store entries as :class:`LexiconEntry` objects grouped per lemma.
+
+    Lookups return the stored objects directly, which makes this the fastest
+    backend for small and medium lexica.
+
+    Parameters
+    ----------
+    entries:
+        Normalized entries with unique ``(lemma, dialect)`` keys.
+    bloom:
+        Optional prebuilt filter over the lemmas (e.g. from a snapshot),
+        returned by :meth:`bloom_filter`.
+    """
+
+    __slots__ = ("_by_lemma", "_size", "_bloom")
+
+    def __init__(self, entries: Iterable[LexiconEntry], bloom: BloomFilter | None = None) -> None:
+        self._by_lemma: dict[str, list[LexiconEntry]] = {}
+        self._size = 0
+        self._bloom = bloom
+        for entry in entries:
+            self._by_lemma.setdefault(entry.lemma, []).append(entry)
+            self._size += 1
+
+    def candidates(self, lemma: str) -> list[LexiconEntry]:
+        return self._by_lemma.get(lemma, [])
+
+    def lemma_count(self) -> int:
+        return len(self._by_lemma)
+
+    def iter_lemmas(self) -> Iterator[str]:
+        return iter(self._by_lemma)
+
+    def bloom_filter(self) -> BloomFilter | None:
+        return self._bloom
+
+    def __iter__(self) -> Iterator[LexiconEntry]:
+        for group in self._by_lemma.values():
+            yield from group
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class CompactLexiconStore(ILexiconStore):
+    """Columnar store for large lexica.
+
+    Entries are kept as parallel arrays grouped by lemma: IPA strings are
+    packed into one UTF-8 buffer with offsets, dialects and sources are
+    interned to small integer codes, confidence and frequency live in typed
+    arrays and the (rare) alternatives in a sparse map of tuples. Only the
+    lemma index holds one Python object per lemma.
+    :class:`LexiconEntry` objects are built on demand, so lookups are slower
+    than with :class:`DictLexiconStore`; the lexicon's lookup cache absorbs
+    most of that cost for repeated words.
+
+    Parameters
+    ----------
+    entries:
+        Normalized entries with unique ``(lemma, dialect)`` keys.
+    bloom:
+        Optional prebuilt filter over the lemmas (e.g. from a snapshot),
+        returned by :meth:`bloom_filter`.
+
+    Examples
+    --------
+    >>> store = CompactLexiconStore([LexiconEntry(lemma="cjase", ipa="ˈcaze")])
+    >>> store.candidates("cjase")[0].ipa
+    'ˈcaze'
+    """
+
+    __slots__ = (
+        "_index",
+        "_group_starts",
+        "_ipa",
+        "_ipa_offsets",
+        "_dialect_codes",
+        "_source_codes",
+        "_confidence",
+        "_frequency",
+        "_alternatives",
+        "_dialects",
+        "_sources",
+        "_bloom",
+    )
+
+    def __init__(self, entries: Iterable[LexiconEntry], bloom: BloomFilter | None = None) -> None:
+        self._bloom = bloom
+        groups: dict[str, list[LexiconEntry]] = {}
+        for entry in entries:
+            groups.setdefault(entry.lemma, []).append(entry)
+
+        self._index: dict[str, int] = {}
+        self._group_starts = array("I", [0])
+        self._ipa_offsets = array("I", [0])
+        self._dialect_codes = bytearray()
+        self._source_codes = array("I")
+        self._confidence = array("d")
+        self._frequency = array("q")
+        self._alternatives: dict[int, tuple[str, ...]] = {}
+        self._dialects: list[str | None] = []
+        self._sources: list[str] = []
+
+        dialect_codes: dict[str | None, int] = {}
+        source_codes: dict[str, int] = {}
+        ipa = bytearray()
+        row = 0
+        for lemma, group in groups.items():
+            self._index[lemma] = len(self._index)
+            for entry in group:
+                ipa += entry.ipa.encode("utf-8")
+                self._ipa_offsets.append(len(ipa))
+                self._dialect_codes.append(_intern(entry.dialect, dialect_codes, self._dialects))
+                self._source_codes.append(_intern(entry.source, source_codes, self._sources))
+                self._confidence.append(entry.confidence)
+                self._frequency.append(
+                    _NO_FREQUENCY if entry.frequency is None else entry.frequency
+                )
+                if entry.alternatives:
+                    self._alternatives[row] = tuple(entry.alternatives)
+                row += 1
+            self._group_starts.append(row)
+        self._ipa = bytes(ipa)
+
+    def candidates(self, lemma: str) -> list[LexiconEntry]:
+        group = self._index.get(lemma)
+        if group is None:
+            return []
+        start, end = self._group_starts[group], self._group_starts[group + 1]
+        return [self._materialize(lemma, row) for row in range(start, end)]
+
+    def lemma_count(self) -> int:
+        return len(self._index)
+
+    def iter_lemmas(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def bloom_filter(self) -> BloomFilter | None:
+        return self._bloom
+
+    def memory_usage(self) -> int:
+        """Return an estimate of the bytes held by the columns and index.
+
+        Lemma strings are counted once (they are the index keys); interned
+        dialect/source tables are ignored.
+        """
+
+        total = getsizeof(self._index) + getsizeof(self._alternatives) + len(self._ipa)
+        total += sum(getsizeof(lemma) for lemma in self._index)
+        total += sum(getsizeof(group) for group in self._index.values())
+        for column in (
+            self._group_starts,
+            self._ipa_offsets,
+            self._dialect_codes,
+            self._source_codes,
+            self._confidence,
+            self._frequency,
+        ):
+            total += getsizeof(column)
+        for alternatives in self._alternatives.values():
+            total += getsizeof(alternatives) + sum(getsizeof(value) for value in alternatives)
+        return total
+
+    def __iter__(self) -> Iterator[LexiconEntry]:
+        for lemma, group in self._index.items():
+            for row in range(self._group_starts[group], self._group_starts[group + 1]):
+                yield self._materialize(lemma, row)
+
+    def __len__(self) -> int:
+        return len(self._confidence)
+
+    def _materialize(self, lemma: str, row: int) -> LexiconEntry:
+        frequency = self._frequency[row]
+        return LexiconEntry(
+            lemma=lemma,
+            ipa=self._ipa[self._ipa_offsets[row] : self._ipa_offsets[row + 1]].decode("utf-8"),
+            dialect=self._dialects[self._dialect_codes[row]],
+            source=self._sources[self._source_codes[row]],
+            confidence=self._confidence[row],
+            frequency=None if frequency == _NO_FREQUENCY else frequency,
+            alternatives=list(self._alternatives.get(row, ())),
+        )
+
+
+def _intern(value: _Key, codes: dict[_Key, int], table: list[_Key]) -> int:
+    """Return the code of ``value``, adding it to ``table`` on first use."""
+
+    code = codes.get(value)
+    if code is None:
+        code = codes[value] = len(table)
+        table.append(value)
+    return code
+
+
+def build_store(
+    entries: Iterable[LexiconEntry],
+    kind: str = "dict",
+    bloom: BloomFilter | None = None,
+) -> ILexiconStore:
+    """Build an in-memory store of ``kind`` (``"dict"`` or ``"compact"``).
+
+    ``bloom`` is an optional prebuilt lemma filter handed to the store.
+
+    Raises
+    ------
+    ValueError
+        If ``kind`` is not a known storage backend.
+    """
+
+    if kind == "dict":
+        return DictLexiconStore(entries, bloom)
+    if kind == "compact":
+        return CompactLexiconStore(entries, bloom)
+    raise ValueError(f"Unknown lexicon storage: {kind!r}. Expected 'dict' or 'compact'.")
+
+
+__all__ = ["CompactLexiconStore", "DictLexiconStore", "build_store"]
@@ -6,9 +6,14 @@ exception models that can predict IPA transcriptions for words not in the lexico
 or refine rule-based outputs.
 
 The module uses import guards to gracefully handle missing ML dependencies:
-- Base install: Only NullExceptionModel available (always returns None)
+- Base install: NullExceptionModel (always returns None) and the pure-Python
+  JointNgramModel
 - With [ml] extra: Full ML models available (requires torch, transformers)
 
+Availability is probed with ``importlib.util.find_spec`` so importing this
+package never imports torch/transformers; models call ``require_ml()``,
+which performs the real (cached) import on first use.
+
 Usage:
     >>> from furlan_g2p.ml import NullExceptionModel, ML_AVAILABLE
     >>> print(f"ML support: {ML_AVAILABLE}")
@@ -26,33 +31,65 @@ Installation:
 
 Exports:
     ML_AVAILABLE: bool flag indicating if ML dependencies are installed
+    ML_MODULES: names of the optional ML dependencies
     ExceptionPrediction: dataclass for prediction results
     IExceptionModel: abstract interface for exception models
     NullExceptionModel: default implementation (no ML required)
+    JointNgramModel: CPU-only joint-sequence n-gram model (no ML required)
+    CachedExceptionModel: persistent SQLite prediction cache for any model
+    SubprocessExceptionModel: proxy running a model in a worker process
 """
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
+from functools import cache
+from types import ModuleType
+
 # Always available (no ML dependencies)
 from furlan_g2p.ml.interfaces import ExceptionPrediction, IExceptionModel
+from furlan_g2p.ml.joint_ngram import JointNgramModel
 from furlan_g2p.ml.null_model import NullExceptionModel
+from furlan_g2p.ml.prediction_cache import CachedExceptionModel
+from furlan_g2p.ml.subprocess_model import SubprocessExceptionModel
+
+ML_MODULES: tuple[str, ...] = ("torch", "transformers")
+
 
-# Check for optional ML dependencies
-ML_AVAILABLE = False
-_ML_IMPORT_ERROR: str | None = None
+def _find_missing() -> list[str]:
+    """Return the ML modules that cannot be found, without importing them."""
 
-try:
-    import torch  # noqa: F401
-    import transformers  # noqa: F401
+    missing: list[str] = []
+    for name in ML_MODULES:
+        try:
+            found = importlib.util.find_spec(name) is not None
+        except (ImportError, ValueError):
+            found = False
+        if not found:
+            missing.append(name)
+    return missing
 
-    ML_AVAILABLE = True
-except ImportError as e:
-    _ML_IMPORT_ERROR = str(e)
 
+# Check for optional ML dependencies (lookup only, no import)
+_MISSING = _find_missing()
+ML_AVAILABLE = not _MISSING
+_ML_IMPORT_ERROR: str | None = (
+    f"No module named {', '.join(repr(name) for name in _MISSING)}" if _MISSING else None
+)
 
-def require_ml() -> None:
+
+@cache
+def _import_ml_modules() -> dict[str, ModuleType]:
+    return {name: importlib.import_module(name) for name in ML_MODULES}
+
+
+def require_ml() -> dict[str, ModuleType]:
     """
-    Raise ImportError with helpful message if ML dependencies are not installed.
+    Import the ML dependencies on first use, or explain how to install them.
+
+    Returns:
+        Imported modules keyed by name (``"torch"``, ``"transformers"``).
 
     Raises:
         ImportError: If torch or transformers not available.
@@ -62,19 +99,28 @@ def require_ml() -> None:
         Traceback (most recent call last):
         ImportError: ML dependencies not installed. Install with: pip install furlan-g2p[ml]
     """
-    if not ML_AVAILABLE:
-        msg = (
-            "ML dependencies not installed. "
-            "Install with: pip install furlan-g2p[ml]\n"
-            f"Original error: {_ML_IMPORT_ERROR}"
-        )
-        raise ImportError(msg)
+    error = _ML_IMPORT_ERROR
+    if ML_AVAILABLE:
+        try:
+            return _import_ml_modules()
+        except ImportError as exc:
+            error = str(exc)
+    msg = (
+        "ML dependencies not installed. "
+        "Install with: pip install furlan-g2p[ml]\n"
+        f"Original error: {error}"
+    )
+    raise ImportError(msg)
 
 
 __all__ = [
     "ML_AVAILABLE",
+    "ML_MODULES",
+    "CachedExceptionModel",
     "ExceptionPrediction",
     "IExceptionModel",
+    "JointNgramModel",
     "NullExceptionModel",
+    "SubprocessExceptionModel",
     "require_ml",
 ]
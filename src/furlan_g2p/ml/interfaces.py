@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 
 
@@ -57,6 +58,11 @@ class IExceptionModel(ABC):
     - Graceful degradation when models unavailable
     - Optional dialect-specific predictions
 
+    Concurrency:
+    - ``asynchronous`` is True when ``predict_batch_async`` computes in the
+      background (e.g. in another process); callers may then do other work
+      before waiting on the returned future.
+
     Examples:
         >>> model: IExceptionModel = NullExceptionModel()
         >>> model.is_available()
@@ -65,6 +71,8 @@ class IExceptionModel(ABC):
         None
     """
 
+    asynchronous: bool = False
+
     @abstractmethod
     def predict(self, word: str, dialect: str | None = None) -> ExceptionPrediction | None:
         """
@@ -115,6 +123,31 @@ class IExceptionModel(ABC):
         """
         raise NotImplementedError
 
+    def predict_batch_async(
+        self, words: list[str], dialect: str | None = None
+    ) -> Future[list[ExceptionPrediction | None]]:
+        """
+        Start a batch prediction and return a future for its result.
+
+        Args:
+            words: List of orthographic words to transcribe.
+            dialect: Optional dialect identifier for dialect-aware predictions.
+
+        Returns:
+            Future resolving to the ``predict_batch`` result.
+
+        Notes:
+            The default runs ``predict_batch`` in the calling thread and
+            returns a completed future; out-of-process models override it
+            and set ``asynchronous``.
+        """
+        future: Future[list[ExceptionPrediction | None]] = Future()
+        try:
+            future.set_result(self.predict_batch(words, dialect))
+        except Exception as exc:  # noqa: BLE001 - delivered through the future
+            future.set_exception(exc)
+        return future
+
     @abstractmethod
     def is_available(self) -> bool:
         """
@@ -0,0 +1,575 @@
+"""Joint-sequence (graphone) n-gram G2P model that runs on a CPU without ML extras."""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+import sys
+import unicodedata
+import zlib
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from hashlib import blake2b
+from pathlib import Path
+
+from furlan_g2p.lexicon.schema import LexiconEntry
+from furlan_g2p.ml.interfaces import ExceptionPrediction, IExceptionModel
+from furlan_g2p.phonology import canonicalize_ipa
+
+_MAGIC = b"FGJM"
+_VERSION = 1
+# magic, version, compressed payload length
+_HEADER = struct.Struct("<4sBI")
+_COUNT = struct.Struct("<I")
+
+# Graphone id shared by the word-start and word-end symbols.
+_BOUNDARY = 0
+# Longest letter / phoneme chunk one graphone may cover.
+_MAX_LETTERS = 2
+_MAX_PHONES = 2
+_DIGRAPHS = ("tʃ", "dʒ", "dz", "ts")
+_LENGTH = "ː"
+_UNSTRESS = str.maketrans("", "", "ˈˌ.")
+
+Graphone = tuple[str, tuple[str, ...]]
+"""A letter chunk paired with the phonemes it produces."""
+
+# (source node, target node, graphone) with nodes numbered ``i * (phones + 1) + j``
+_Edge = tuple[int, int, Graphone]
+
+
+def split_phonemes(ipa: str) -> tuple[str, ...]:
+    """Split IPA into model phonemes (affricates kept whole, length attached, no stress).
+
+    Examples:
+        >>> split_phonemes("ˈtʃaːr")
+        ('tʃ', 'aː', 'r')
+    """
+    text = canonicalize_ipa(ipa).translate(_UNSTRESS)
+    phones: list[str] = []
+    i = 0
+    while i < len(text):
+        if text[i] == _LENGTH and phones:
+            phones[-1] += _LENGTH
+            i += 1
+            continue
+        for digraph in _DIGRAPHS:
+            if text.startswith(digraph, i):
+                phones.append(digraph)
+                i += len(digraph)
+                break
+        else:
+            if not text[i].isspace():
+                phones.append(text[i])
+            i += 1
+    return tuple(phones)
+
+
+def _normalize_word(word: str) -> str:
+    return unicodedata.normalize("NFC", word.strip()).lower()
+
+
+def _lattice(letters: str, phones: tuple[str, ...]) -> list[_Edge]:
+    """Return the segmentation lattice edges of a word in topological order.
+
+    Node ``(i, j)`` means ``i`` letters and ``j`` phonemes consumed; only
+    nodes on some complete path are kept.
+    """
+
+    n, m = len(letters), len(phones)
+    width = m + 1
+    edges: list[_Edge] = []
+    for i in range(1, n + 1):
+        for j in range(max(0, m - _MAX_PHONES * (n - i)), min(m, _MAX_PHONES * i) + 1):
+            for letter_len in range(1, min(_MAX_LETTERS, i) + 1):
+                for phone_len in range(0, min(_MAX_PHONES, j) + 1):
+                    prev_i, prev_j = i - letter_len, j - phone_len
+                    if prev_j > _MAX_PHONES * prev_i or m - prev_j > _MAX_PHONES * (n - prev_i):
+                        continue
+                    graphone = (letters[prev_i:i], phones[prev_j:j])
+                    edges.append((prev_i * width + prev_j, i * width + j, graphone))
+    return edges
+
+
+def _viterbi(
+    letters: str, phones: tuple[str, ...], weights: dict[Graphone, float]
+) -> list[Graphone] | None:
+    nodes = (len(letters) + 1) * (len(phones) + 1)
+    best = [-math.inf] * nodes
+    back: list[tuple[int, Graphone] | None] = [None] * nodes
+    best[0] = 0.0
+    for source, target, graphone in _lattice(letters, phones):
+        weight = weights.get(graphone)
+        if not weight or best[source] == -math.inf:
+            continue
+        score = best[source] + math.log(weight)
+        if score > best[target]:
+            best[target] = score
+            back[target] = (source, graphone)
+    path: list[Graphone] = []
+    node = nodes - 1
+    while node:
+        step = back[node]
+        if step is None:
+            return None
+        node, graphone = step
+        path.append(graphone)
+    path.reverse()
+    return path
+
+
+def _align(pairs: Sequence[tuple[str, tuple[str, ...]]], iterations: int) -> list[list[Graphone]]:
+    """Estimate graphone probabilities with EM, then return Viterbi segmentations."""
+
+    weights: dict[Graphone, float] = {}
+    default = 1.0  # uniform start: every segmentation is equally likely
+    for _ in range(max(iterations, 1)):
+        counts: defaultdict[Graphone, float] = defaultdict(float)
+        for letters, phones in pairs:
+            edges = _lattice(letters, phones)
+            edge_weights = [weights.get(graphone, default) for _, _, graphone in edges]
+            nodes = (len(letters) + 1) * (len(phones) + 1)
+            alpha = [0.0] * nodes
+            alpha[0] = 1.0
+            for (source, target, _), weight in zip(edges, edge_weights, strict=True):
+                alpha[target] += alpha[source] * weight
+            total = alpha[-1]
+            if not total:
+                continue
+            beta = [0.0] * nodes
+            beta[-1] = 1.0
+            for (source, target, _), weight in zip(
+                reversed(edges), reversed(edge_weights), strict=True
+            ):
+                beta[source] += weight * beta[target]
+            for (source, target, graphone), weight in zip(edges, edge_weights, strict=True):
+                if weight:
+                    counts[graphone] += alpha[source] * weight * beta[target] / total
+        norm = sum(counts.values())
+        weights = {key: value / norm for key, value in counts.items()}
+        default = 0.0
+    paths = (_viterbi(letters, phones, weights) for letters, phones in pairs)
+    return [path for path in paths if path]
+
+
+class JointNgramModel(IExceptionModel):
+    """
+    Joint-sequence n-gram G2P model (pure Python, no ML dependencies).
+
+    Training segments each lexicon word into *graphones* (one or two letters
+    paired with zero to two phonemes) by EM over all segmentations, then
+    fits a Witten-Bell smoothed n-gram over the graphone sequences. Decoding
+    is a left-to-right beam search over the letters of a word, keeping at
+    most ``beam_width`` histories per position and dropping hypotheses more
+    than ``beam_threshold`` (natural log) below the best one.
+
+    Predictions carry no stress marks (stress is assigned by the phonology
+    stage). ``confidence`` is the posterior of the best pronunciation among
+    the surviving hypotheses; words containing letters never seen in
+    training get ``None``. The ``dialect`` argument of ``predict`` is
+    ignored; train one model per dialect with ``train(..., dialect=...)``.
+
+    Args:
+        graphones: Graphone inventory; graphone id ``i + 1`` is ``graphones[i]``.
+        order: N-gram order.
+        log_probs: Log probability for every stored ``history + (graphone,)``.
+        backoffs: Log backoff weight for every stored history.
+        beam_width: Histories kept per letter position.
+        beam_threshold: Log-probability margin for pruning hypotheses.
+        nbest: Number of pronunciations reported (best plus alternatives).
+        words: Number of training words, kept as metadata.
+
+    Examples:
+        >>> entries = [LexiconEntry(lemma="pan", ipa="pan")]  # doctest: +SKIP
+        >>> model = JointNgramModel.train(entries)  # doctest: +SKIP
+        >>> model.predict("pan").ipa  # doctest: +SKIP
+        'pan'
+    """
+
+    name = "joint-ngram"
+
+    def __init__(
+        self,
+        graphones: Sequence[Graphone],
+        order: int,
+        log_probs: dict[tuple[int, ...], float],
+        backoffs: dict[tuple[int, ...], float],
+        beam_width: int = 16,
+        beam_threshold: float = 10.0,
+        nbest: int = 3,
+        words: int = 0,
+    ) -> None:
+        if order < 1:
+            raise ValueError(f"order must be >= 1, got {order}")
+        self.graphones = list(graphones)
+        self.order = order
+        self.beam_width = beam_width
+        self.beam_threshold = beam_threshold
+        self.nbest = nbest
+        self.words = words
+        self._checksum: str | None = None
+        self._log_probs = log_probs
+        self._backoffs = backoffs
+        self._by_letters: dict[str, list[tuple[int, tuple[str, ...]]]] = {}
+        for index, (letters, phones) in enumerate(self.graphones, start=1):
+            self._by_letters.setdefault(letters, []).append((index, phones))
+
+    @classmethod
+    def train(
+        cls,
+        entries: Iterable[LexiconEntry],
+        order: int = 3,
+        iterations: int = 5,
+        dialect: str | None = None,
+        beam_width: int = 16,
+        beam_threshold: float = 10.0,
+        nbest: int = 3,
+    ) -> JointNgramModel:
+        """
+        Train a model from lexicon entries.
+
+        Args:
+            entries: Entries such as ``LexiconBuilder.build()`` or
+                ``DialectAwareLexicon.iter_entries()``.
+            order: N-gram order over graphones.
+            iterations: EM iterations for the graphone segmentation.
+            dialect: Train on this dialect plus universal entries only.
+            beam_width: Decoder setting, see the class docstring.
+            beam_threshold: Decoder setting, see the class docstring.
+            nbest: Decoder setting, see the class docstring.
+
+        Returns:
+            Trained model.
+
+        Raises:
+            ValueError: If no entry can be segmented into graphones.
+        """
+        pairs: dict[tuple[str, tuple[str, ...]], None] = {}
+        for entry in entries:
+            if dialect is not None and entry.dialect not in (None, dialect):
+                continue
+            letters = _normalize_word(entry.lemma)
+            phones = split_phonemes(entry.ipa)
+            if letters and len(phones) <= _MAX_PHONES * len(letters):
+                pairs[(letters, phones)] = None
+        paths = _align(list(pairs), iterations)
+        if not paths:
+            raise ValueError("No trainable lexicon entries")
+
+        ids: dict[Graphone, int] = {}
+        sequences = [
+            [ids.setdefault(graphone, len(ids) + 1) for graphone in path] for path in paths
+        ]
+        graphones = sorted(ids, key=ids.__getitem__)
+        log_probs, backoffs = _witten_bell(sequences, order, len(graphones) + 1)
+        return cls(
+            graphones,
+            order,
+            _as_float32(log_probs),
+            _as_float32(backoffs),
+            beam_width=beam_width,
+            beam_threshold=beam_threshold,
+            nbest=nbest,
+            words=len(paths),
+        )
+
+    def predict(self, word: str, dialect: str | None = None) -> ExceptionPrediction | None:
+        """
+        Predict the pronunciation of ``word``.
+
+        Args:
+            word: Orthographic word.
+            dialect: Ignored (see class docstring).
+
+        Returns:
+            Best pronunciation with n-best alternatives, or None when no
+            graphone segmentation of the word exists.
+        """
+        ranked = self._decode(_normalize_word(word))
+        if not ranked:
+            return None
+        (best_ipa, best_prob), *others = ranked
+        return ExceptionPrediction(
+            ipa=best_ipa,
+            confidence=best_prob,
+            source=self.name,
+            alternatives=others,
+        )
+
+    def predict_batch(
+        self, words: list[str], dialect: str | None = None
+    ) -> list[ExceptionPrediction | None]:
+        """
+        Predict several words; repeated words are decoded once.
+
+        Args:
+            words: Orthographic words.
+            dialect: Ignored (see class docstring).
+
+        Returns:
+            One prediction (or None) per input word.
+        """
+        unique = {word: self.predict(word) for word in dict.fromkeys(words)}
+        return [unique[word] for word in words]
+
+    def is_available(self) -> bool:
+        """
+        Return True; the model is fully loaded on construction.
+
+        Returns:
+            True
+        """
+        return True
+
+    def get_model_info(self) -> dict[str, str | bool | int]:
+        """
+        Return model metadata.
+
+        Returns:
+            Name, format version, availability, checksum of the serialized
+            model (identifies the trained parameters), n-gram order and
+            model sizes.
+        """
+        if self._checksum is None:
+            self._checksum = blake2b(self.to_bytes(), digest_size=8).hexdigest()
+        return {
+            "name": self.name,
+            "version": str(_VERSION),
+            "available": True,
+            "checksum": self._checksum,
+            "order": self.order,
+            "graphones": len(self.graphones),
+            "ngrams": len(self._log_probs),
+            "words": self.words,
+        }
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the model.
+
+        The payload (JSON metadata plus little-endian ``uint32`` n-gram keys
+        and ``float32`` log probabilities) is zlib-compressed.
+
+        Returns:
+            Serialized model.
+        """
+        meta = json.dumps(
+            {
+                "order": self.order,
+                "words": self.words,
+                "beam_width": self.beam_width,
+                "beam_threshold": self.beam_threshold,
+                "nbest": self.nbest,
+                "graphones": [[letters, list(phones)] for letters, phones in self.graphones],
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        parts = [_COUNT.pack(len(meta)), meta]
+        for table in (self._log_probs, self._backoffs):
+            for length in range(1, self.order + 1):
+                rows = [(key, value) for key, value in table.items() if len(key) == length]
+                keys = array("I", [gid for key, _ in rows for gid in key])
+                values = array("f", [value for _, value in rows])
+                if sys.byteorder != "little":
+                    keys.byteswap()
+                    values.byteswap()
+                parts += [_COUNT.pack(len(rows)), keys.tobytes(), values.tobytes()]
+        payload = zlib.compress(b"".join(parts), 9)
+        return _HEADER.pack(_MAGIC, _VERSION, len(payload)) + payload
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> JointNgramModel:
+        """
+        Load a model produced by ``to_bytes``.
+
+        Args:
+            data: Serialized model.
+
+        Returns:
+            Loaded model.
+
+        Raises:
+            ValueError: If ``data`` is not a model of a supported version.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated joint n-gram model")
+        magic, version, size = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Unsupported joint n-gram model data")
+        try:
+            payload = zlib.decompress(data[_HEADER.size : _HEADER.size + size])
+            offset = _COUNT.size + _COUNT.unpack_from(payload)[0]
+            meta = json.loads(payload[_COUNT.size : offset])
+            order = int(meta["order"])
+            tables: list[dict[tuple[int, ...], float]] = [{}, {}]
+            for table in tables:
+                for length in range(1, order + 1):
+                    (count,) = _COUNT.unpack_from(payload, offset)
+                    offset += _COUNT.size
+                    keys = array("I")
+                    keys.frombytes(payload[offset : offset + 4 * count * length])
+                    offset += 4 * count * length
+                    values = array("f")
+                    values.frombytes(payload[offset : offset + 4 * count])
+                    offset += 4 * count
+                    if sys.byteorder != "little":
+                        keys.byteswap()
+                        values.byteswap()
+                    for row, value in enumerate(values):
+                        table[tuple(keys[row * length : (row + 1) * length])] = value
+        except (zlib.error, struct.error, KeyError, ValueError) as exc:
+            raise ValueError(f"Corrupt joint n-gram model data: {exc}") from exc
+        model = cls(
+            [(letters, tuple(phones)) for letters, phones in meta["graphones"]],
+            order,
+            tables[0],
+            tables[1],
+            beam_width=int(meta["beam_width"]),
+            beam_threshold=float(meta["beam_threshold"]),
+            nbest=int(meta["nbest"]),
+            words=int(meta["words"]),
+        )
+        model._checksum = blake2b(data, digest_size=8).hexdigest()
+        return model
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the serialized model to ``path``.
+
+        Args:
+            path: Destination file.
+        """
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str | Path) -> JointNgramModel:
+        """
+        Read a model written by ``save``.
+
+        Args:
+            path: Model file.
+
+        Returns:
+            Loaded model.
+        """
+        return cls.from_bytes(Path(path).read_bytes())
+
+    def _score(self, history: tuple[int, ...], graphone: int) -> float:
+        """Return ``log P(graphone | history)``, backing off to shorter histories."""
+
+        return _backoff_score(self._log_probs, self._backoffs, history, graphone)
+
+    def _decode(self, letters: str) -> list[tuple[str, float]]:
+        """Return up to ``nbest`` ``(ipa, posterior)`` pairs for ``letters``."""
+
+        n = len(letters)
+        context = self.order - 1
+        layers: list[dict[tuple[int, ...], tuple[float, tuple[str, ...]]]] = [
+            {} for _ in range(n + 1)
+        ]
+        layers[0][(_BOUNDARY,)[:context]] = (0.0, ())
+        for position in range(n):
+            layer = layers[position]
+            if not layer:
+                continue
+            ranked = sorted(layer.items(), key=lambda item: item[1][0], reverse=True)
+            floor = ranked[0][1][0] - self.beam_threshold
+            for history, (score, phones) in ranked[: self.beam_width]:
+                if score < floor:
+                    break
+                for length in range(1, min(_MAX_LETTERS, n - position) + 1):
+                    target = layers[position + length]
+                    for graphone, graphone_phones in self._by_letters.get(
+                        letters[position : position + length], ()
+                    ):
+                        total = score + self._score(history, graphone)
+                        state = (history + (graphone,))[max(0, len(history) + 1 - context) :]
+                        current = target.get(state)
+                        if current is None or total > current[0]:
+                            target[state] = (total, phones + graphone_phones)
+
+        finals: dict[str, float] = {}
+        for history, (score, phones) in layers[n].items():
+            total = score + self._score(history, _BOUNDARY)
+            if total == -math.inf:
+                continue
+            ipa = "".join(phones)
+            previous = finals.get(ipa)
+            finals[ipa] = total if previous is None else _log_add(previous, total)
+        if not finals:
+            return []
+        ranked_ipa = sorted(finals.items(), key=lambda item: item[1], reverse=True)
+        best = ranked_ipa[0][1]
+        mass = sum(math.exp(score - best) for _, score in ranked_ipa)
+        return [(ipa, math.exp(score - best) / mass) for ipa, score in ranked_ipa[: self.nbest]]
+
+
+def _as_float32(table: dict[tuple[int, ...], float]) -> dict[tuple[int, ...], float]:
+    """Round values to the stored precision so saved models decode identically."""
+
+    return dict(zip(table, array("f", table.values()), strict=True))
+
+
+def _log_add(left: float, right: float) -> float:
+    high, low = (left, right) if left >= right else (right, left)
+    return high + math.log1p(math.exp(low - high))
+
+
+def _witten_bell(
+    sequences: Sequence[Sequence[int]], order: int, vocabulary: int
+) -> tuple[dict[tuple[int, ...], float], dict[tuple[int, ...], float]]:
+    """Fit an interpolated Witten-Bell n-gram in backoff form.
+
+    Returns ``log P(w | h)`` for every observed ``h + (w,)`` and the log
+    weight ``log(T(h) / (c(h) + T(h)))`` given to the lower order for every
+    observed history ``h``, which together reproduce the interpolated model.
+    """
+
+    counts: list[defaultdict[tuple[int, ...], defaultdict[int, int]]] = [
+        defaultdict(lambda: defaultdict(int)) for _ in range(order)
+    ]
+    for sequence in sequences:
+        symbols = [_BOUNDARY, *sequence, _BOUNDARY]
+        for t in range(1, len(symbols)):
+            for length in range(min(order - 1, t) + 1):
+                counts[length][tuple(symbols[t - length : t])][symbols[t]] += 1
+
+    log_probs: dict[tuple[int, ...], float] = {}
+    backoffs: dict[tuple[int, ...], float] = {}
+    for length in range(order):
+        for history, followers in counts[length].items():
+            total = sum(followers.values())
+            types = len(followers)
+            lower_weight = types / (total + types)
+            if length:
+                backoffs[history] = math.log(lower_weight)
+            for symbol, count in followers.items():
+                if length:
+                    lower = math.exp(_backoff_score(log_probs, backoffs, history[1:], symbol))
+                else:
+                    lower = 1.0 / vocabulary
+                log_probs[history + (symbol,)] = math.log(
+                    count / (total + types) + lower_weight * lower
+                )
+    return log_probs, backoffs
+
+
+def _backoff_score(
+    log_probs: dict[tuple[int, ...], float],
+    backoffs: dict[tuple[int, ...], float],
+    history: tuple[int, ...],
+    symbol: int,
+) -> float:
+    penalty = 0.0
+    for start in range(len(history) + 1):
+        context = history[start:]
+        value = log_probs.get(context + (symbol,))
+        if value is not None:
+            return penalty + value
+        penalty += backoffs.get(context, 0.0)
+    return -math.inf
+
+
+__all__ = ["Graphone", "JointNgramModel", "split_phonemes"]
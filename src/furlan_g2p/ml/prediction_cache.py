@@ -0,0 +1,350 @@
+"""Persistent SQLite cache in front of an exception model."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future
+from pathlib import Path
+
+from furlan_g2p.ml.interfaces import ExceptionPrediction, IExceptionModel
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS predictions (
+    word TEXT NOT NULL,
+    dialect TEXT NOT NULL,
+    ipa TEXT,
+    confidence REAL NOT NULL,
+    source TEXT NOT NULL,
+    alternatives TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (word, dialect)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS predictions_last_used ON predictions (last_used);
+"""
+# Stay below SQLITE_MAX_VARIABLE_NUMBER of old SQLite builds (999).
+_BATCH_SIZE = 500
+# Universal (dialect-less) predictions are stored under ''.
+_NO_DIALECT = ""
+# Fraction of ``max_entries`` kept after an eviction pass.
+_EVICT_TO = 0.9
+# Minimum age before a read refreshes an entry's ``last_used``.
+_TOUCH_INTERVAL_NS = 60 * 1_000_000_000
+
+
+def model_key(model: IExceptionModel) -> str:
+    """
+    Return the cache identity of ``model``.
+
+    Args:
+        model: Exception model.
+
+    Returns:
+        JSON of ``get_model_info()`` without the ``available`` flag, so any
+        change of name, version or other reported metadata (e.g. a
+        checksum) yields a new key.
+    """
+    info = {key: value for key, value in model.get_model_info().items() if key != "available"}
+    return json.dumps(info, sort_keys=True, ensure_ascii=False)
+
+
+class CachedExceptionModel(IExceptionModel):
+    """
+    Exception model wrapper that persists predictions in an SQLite file.
+
+    ``predict_batch`` reads every known word of a batch with a few
+    ``IN (...)`` queries, sends only the remaining words to the wrapped
+    model in one ``predict_batch`` call and writes the results back in one
+    transaction. ``None`` predictions of an available model are cached too,
+    so words the model cannot handle are not retried. Asynchronous models
+    stay asynchronous: ``predict_batch_async`` answers from the cache and
+    forwards the misses.
+
+    Entries are keyed by ``(word, dialect)`` within one model identity
+    (:func:`model_key`). The file remembers the identity it was filled for;
+    opening it with a different model (new name, version or checksum)
+    empties it. When more than ``max_entries`` rows exist, the least
+    recently used are evicted down to 90% of the limit. The row count is
+    tracked incrementally (recounted only when it crosses the limit) and
+    reads refresh an entry's recency at most once a minute.
+
+    Args:
+        model: Model to wrap.
+        path: Cache file; parent directories are created.
+        max_entries: Maximum number of cached words (None for unbounded).
+
+    Examples:
+        >>> cached = CachedExceptionModel(model, "oov-cache.sqlite")  # doctest: +SKIP
+        >>> cached.predict_batch(["gnove", "gnove"])  # doctest: +SKIP
+        [ExceptionPrediction(...), ExceptionPrediction(...)]
+    """
+
+    def __init__(
+        self,
+        model: IExceptionModel,
+        path: str | Path,
+        max_entries: int | None = 100_000,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.model = model
+        self.asynchronous = model.asynchronous
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pid = -1
+        self._db: sqlite3.Connection | None = None
+        self._key = model_key(model)
+        with self._lock:
+            connection = self._connection()
+            with connection:
+                row = connection.execute("SELECT value FROM meta WHERE key = 'model'").fetchone()
+                if row is None or row[0] != self._key:
+                    connection.execute("DELETE FROM predictions")
+                    connection.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('model', ?)",
+                        (self._key,),
+                    )
+            # Upper bound on the stored rows, kept without per-write COUNT(*).
+            self._entries = self._count()
+
+    def predict(self, word: str, dialect: str | None = None) -> ExceptionPrediction | None:
+        """
+        Predict one word through the cache.
+
+        Args:
+            word: Orthographic word.
+            dialect: Optional dialect identifier.
+
+        Returns:
+            Cached or freshly computed prediction.
+        """
+        return self.predict_batch([word], dialect)[0]
+
+    def predict_batch(
+        self, words: list[str], dialect: str | None = None
+    ) -> list[ExceptionPrediction | None]:
+        """
+        Predict words, calling the wrapped model once for all cache misses.
+
+        Args:
+            words: Orthographic words.
+            dialect: Optional dialect identifier.
+
+        Returns:
+            One prediction (or None) per input word.
+        """
+        return self.predict_batch_async(words, dialect).result()
+
+    def predict_batch_async(
+        self, words: list[str], dialect: str | None = None
+    ) -> Future[list[ExceptionPrediction | None]]:
+        """
+        Answer cached words now and hand the misses to the wrapped model.
+
+        Args:
+            words: Orthographic words.
+            dialect: Optional dialect identifier.
+
+        Returns:
+            Future resolving once the wrapped model answered the misses (and
+            they were written to the cache).
+        """
+        unique = list(dict.fromkeys(words))
+        dialect_key = dialect or _NO_DIALECT
+        with self._lock:
+            found = self._read(unique, dialect_key)
+            missing = [word for word in unique if word not in found]
+            self.hits += len(unique) - len(missing)
+            self.misses += len(missing)
+        result: Future[list[ExceptionPrediction | None]] = Future()
+        if not missing:
+            result.set_result([found[word] for word in words])
+            return result
+
+        def complete(inner: Future[list[ExceptionPrediction | None]]) -> None:
+            try:
+                fresh = inner.result()
+                found.update(zip(missing, fresh, strict=True))
+                available = self.model.is_available()
+                with self._lock:
+                    self._write(zip(missing, fresh, strict=True), dialect_key, available)
+            except Exception as exc:  # noqa: BLE001 - delivered through the future
+                result.set_exception(exc)
+                return
+            result.set_result([found[word] for word in words])
+
+        self.model.predict_batch_async(missing, dialect).add_done_callback(complete)
+        return result
+
+    def is_available(self) -> bool:
+        """
+        Report the wrapped model's availability.
+
+        Returns:
+            ``model.is_available()``.
+        """
+        return self.model.is_available()
+
+    def get_model_info(self) -> dict[str, str | bool | int]:
+        """
+        Return the wrapped model's metadata unchanged.
+
+        Returns:
+            ``model.get_model_info()``.
+        """
+        return self.model.get_model_info()
+
+    def stats(self) -> dict[str, object]:
+        """
+        Return cache counters for this instance and the stored entry count.
+
+        Returns:
+            ``hits``, ``misses`` (distinct words per batch), ``entries`` and
+            ``path``.
+        """
+        with self._lock:
+            entries = self._count()
+            hits, misses = self.hits, self.misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "entries": entries,
+            "path": str(self.path),
+        }
+
+    def clear(self) -> None:
+        """Delete every cached prediction."""
+
+        with self._lock:
+            connection = self._connection()
+            with connection:
+                connection.execute("DELETE FROM predictions")
+            self._entries = 0
+
+    def close(self) -> None:
+        """Close the database connection (it reopens on next use)."""
+
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the connection, reopening it in a forked child. Hold ``_lock``."""
+
+        pid = os.getpid()
+        if self._db is None or self._pid != pid:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._db = connection
+            self._pid = pid
+        return self._db
+
+    def _count(self) -> int:
+        """Return the number of stored rows. Hold ``_lock``."""
+
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM predictions").fetchone()
+        return int(count)
+
+    def _read(self, words: list[str], dialect: str) -> dict[str, ExceptionPrediction | None]:
+        connection = self._connection()
+        found: dict[str, ExceptionPrediction | None] = {}
+        stale = time.time_ns() - _TOUCH_INTERVAL_NS
+        touch: list[str] = []
+        for start in range(0, len(words), _BATCH_SIZE):
+            batch = words[start : start + _BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            rows = connection.execute(
+                "SELECT word, ipa, confidence, source, alternatives, last_used FROM predictions "
+                f"WHERE dialect = ? AND word IN ({placeholders})",
+                [dialect, *batch],
+            ).fetchall()
+            for word, ipa, confidence, source, alternatives, last_used in rows:
+                if last_used < stale:
+                    touch.append(word)
+                found[word] = (
+                    None
+                    if ipa is None
+                    else ExceptionPrediction(
+                        ipa=ipa,
+                        confidence=confidence,
+                        source=source,
+                        alternatives=[(value, score) for value, score in json.loads(alternatives)],
+                    )
+                )
+        if touch and self.max_entries is not None:
+            now = time.time_ns()
+            with connection:
+                connection.executemany(
+                    "UPDATE predictions SET last_used = ? WHERE word = ? AND dialect = ?",
+                    [(now, word, dialect) for word in touch],
+                )
+        return found
+
+    def _write(
+        self,
+        predictions: Iterable[tuple[str, ExceptionPrediction | None]],
+        dialect: str,
+        cache_none: bool,
+    ) -> None:
+        """Store predictions. Hold ``_lock``.
+
+        ``None`` is only stored when ``cache_none`` is true, i.e. the model
+        was available when it answered: an unavailable model answers
+        ``None`` for everything, which says nothing about the word.
+        """
+
+        now = time.time_ns()
+        rows = [
+            (
+                (word, dialect, None, 0.0, "", "[]", now)
+                if prediction is None
+                else (
+                    word,
+                    dialect,
+                    prediction.ipa,
+                    prediction.confidence,
+                    prediction.source,
+                    json.dumps(prediction.alternatives, ensure_ascii=False),
+                    now,
+                )
+            )
+            for word, prediction in predictions
+            if prediction is not None or cache_none
+        ]
+        if not rows:
+            return
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO predictions "
+                "(word, dialect, ipa, confidence, source, alternatives, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            # Replaced rows and other processes' writes make this an upper bound.
+            self._entries += len(rows)
+            if self.max_entries is not None and self._entries > self.max_entries:
+                self._entries = self._count()
+                if self._entries > self.max_entries:
+                    keep = int(self.max_entries * _EVICT_TO)
+                    connection.execute(
+                        "DELETE FROM predictions WHERE (word, dialect) IN ("
+                        "SELECT word, dialect FROM predictions ORDER BY last_used LIMIT ?)",
+                        (self._entries - keep,),
+                    )
+                    self._entries = keep
+
+
+__all__ = ["CachedExceptionModel", "model_key"]
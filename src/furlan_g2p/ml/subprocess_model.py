@@ -0,0 +1,303 @@
+"""Run an exception model in a dedicated worker process."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+from furlan_g2p.ml.interfaces import ExceptionPrediction, IExceptionModel
+
+logger = logging.getLogger(__name__)
+
+ModelFactory = Callable[..., IExceptionModel]
+"""Picklable callable building the model inside the worker, e.g. ``JointNgramModel.load``."""
+
+_Batch = list[ExceptionPrediction | None]
+_UNAVAILABLE = "Model worker unavailable"
+
+
+def _serve(connection: Connection, factory: ModelFactory, args: tuple[Any, ...]) -> None:
+    """Worker main loop: build the model, then answer requests until closed."""
+
+    try:
+        model = factory(*args)
+        connection.send(("ready", model.get_model_info(), model.is_available()))
+    except Exception as exc:  # noqa: BLE001 - reported to the parent
+        connection.send(("error", f"{type(exc).__name__}: {exc}", False))
+        return
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        request_id, words, dialect = request
+        try:
+            connection.send((request_id, True, model.predict_batch(words, dialect)))
+        except Exception as exc:  # noqa: BLE001 - reported to the parent
+            connection.send((request_id, False, f"{type(exc).__name__}: {exc}"))
+
+
+class SubprocessExceptionModel(IExceptionModel):
+    """
+    Proxy running an exception model in a separate process.
+
+    The worker builds the model with ``factory(*args)`` and serves
+    ``predict_batch`` requests over a pipe, so inference neither holds this
+    process's GIL nor stalls other pipeline threads. Requests are
+    pipelined: ``predict_batch_async`` returns immediately with a future
+    resolved by a reader thread, which lets :class:`G2PPhonemizer` run rule
+    fallbacks while the model works. Several threads may share one proxy.
+
+    If the worker dies, pending and later requests fail with
+    ``RuntimeError`` (logged once) and ``is_available()`` turns False; a
+    batch the model raises on fails the same way. Failures are never
+    reported as ``None`` predictions, which would read as "the model cannot
+    handle this word" and could be cached. A proxy used in a forked child
+    starts its own worker on first use.
+
+    Args:
+        factory: Picklable callable returning the model.
+        *args: Picklable arguments for ``factory``.
+        start_method: ``multiprocessing`` start method; ``"spawn"`` keeps the
+            worker free of the parent's state.
+        startup_timeout: Seconds to wait for the model to load.
+
+    Raises:
+        RuntimeError: If the worker fails to build the model or does not
+            report ready in time.
+
+    Examples:
+        >>> model = SubprocessExceptionModel(JointNgramModel.load, "oov.fgjm")  # doctest: +SKIP
+        >>> model.predict_batch_async(["gnove"]).result()  # doctest: +SKIP
+        [ExceptionPrediction(...)]
+        >>> model.close()  # doctest: +SKIP
+    """
+
+    asynchronous = True
+
+    def __init__(
+        self,
+        factory: ModelFactory,
+        *args: Any,
+        start_method: str = "spawn",
+        startup_timeout: float = 120.0,
+    ) -> None:
+        self.factory = factory
+        self.args = args
+        self.start_method = start_method
+        self.startup_timeout = startup_timeout
+        self._info: dict[str, str | bool | int] = {}
+        self._available = False
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._pending: dict[int, Future[_Batch]] = {}
+        self._connection: Connection | None = None
+        self._process: BaseProcess | None = None
+        self._reader: threading.Thread | None = None
+        self._pid = -1
+        self._dead = False
+        self._start()
+
+    @property
+    def pid(self) -> int | None:
+        """Process id of the worker."""
+
+        return self._process.pid if self._process is not None else None
+
+    def predict(self, word: str, dialect: str | None = None) -> ExceptionPrediction | None:
+        """
+        Predict one word in the worker.
+
+        Args:
+            word: Orthographic word.
+            dialect: Optional dialect identifier.
+
+        Returns:
+            Prediction, or None.
+        """
+        return self.predict_batch([word], dialect)[0]
+
+    def predict_batch(self, words: list[str], dialect: str | None = None) -> _Batch:
+        """
+        Predict words in the worker and wait for the result.
+
+        Args:
+            words: Orthographic words.
+            dialect: Optional dialect identifier.
+
+        Returns:
+            One prediction (or None) per word.
+
+        Raises:
+            RuntimeError: If the worker is unavailable or failed on the batch.
+        """
+        return self.predict_batch_async(words, dialect).result()
+
+    def predict_batch_async(self, words: list[str], dialect: str | None = None) -> Future[_Batch]:
+        """
+        Send a batch to the worker without waiting.
+
+        Args:
+            words: Orthographic words.
+            dialect: Optional dialect identifier.
+
+        Returns:
+            Future resolving to one prediction (or None) per word, or failing
+            with ``RuntimeError`` if the worker is unavailable or failed on
+            the batch.
+        """
+        future: Future[_Batch] = Future()
+        if not words:
+            future.set_result([])
+            return future
+        with self._lock:
+            if self._pid != os.getpid():
+                self._start_locked()
+            if self._dead or self._connection is None:
+                future.set_exception(RuntimeError(_UNAVAILABLE))
+                return future
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+            try:
+                self._connection.send((request_id, list(words), dialect))
+            except (OSError, ValueError):
+                self._pending.pop(request_id, None)
+                self._mark_dead_locked("send failed")
+                future.set_exception(RuntimeError(_UNAVAILABLE))
+        return future
+
+    def is_available(self) -> bool:
+        """
+        Report whether the worker is running a usable model.
+
+        Returns:
+            The wrapped model's availability while the worker is alive.
+        """
+        return self._available and not self._dead
+
+    def get_model_info(self) -> dict[str, str | bool | int]:
+        """
+        Return the wrapped model's metadata as reported at startup.
+
+        Returns:
+            ``get_model_info()`` of the model in the worker.
+        """
+        return dict(self._info)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker and fail pending requests.
+
+        Args:
+            timeout: Seconds to wait before terminating the worker.
+        """
+        with self._lock:
+            connection, process = self._connection, self._process
+            self._connection = None
+            self._dead = True
+            owned = self._pid == os.getpid()
+        if not owned:
+            return
+        if connection is not None:
+            try:
+                connection.send(None)
+            except (OSError, ValueError):
+                pass
+        if process is not None:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout)
+        if connection is not None:
+            connection.close()
+        if self._reader is not None and self._reader is not threading.current_thread():
+            self._reader.join(timeout)
+
+    def __enter__(self) -> SubprocessExceptionModel:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        with self._lock:
+            self._start_locked()
+
+    def _start_locked(self) -> None:
+        """Start a worker and wait for its ready message. Hold ``_lock``."""
+
+        if self._connection is not None and self._pid != os.getpid():
+            self._connection.close()  # inherited from the parent by fork
+            self._connection = None
+        context = multiprocessing.get_context(self.start_method)
+        parent, child = context.Pipe()
+        process: BaseProcess = context.Process(  # type: ignore[attr-defined]
+            target=_serve,
+            args=(child, self.factory, self.args),
+            name="furlan-g2p-model",
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        if not parent.poll(self.startup_timeout):
+            process.terminate()
+            raise RuntimeError(f"Model worker did not start within {self.startup_timeout}s")
+        try:
+            status, info, available = parent.recv()
+        except EOFError as exc:
+            raise RuntimeError("Model worker exited during startup") from exc
+        if status != "ready":
+            process.join()
+            raise RuntimeError(f"Model worker failed to load the model: {info}")
+        self._info, self._available = info, available
+        self._connection, self._process = parent, process
+        self._pending = {}
+        self._pid = os.getpid()
+        self._dead = False
+        self._reader = threading.Thread(
+            target=self._read_replies, args=(parent,), name="furlan-g2p-model-reader", daemon=True
+        )
+        self._reader.start()
+
+    def _read_replies(self, connection: Connection) -> None:
+        while True:
+            try:
+                request_id, ok, payload = connection.recv()
+            except (EOFError, OSError):
+                with self._lock:
+                    if connection is self._connection or self._connection is None:
+                        self._mark_dead_locked("worker exited")
+                return
+            with self._lock:
+                future = self._pending.pop(request_id, None)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(payload)
+            else:
+                logger.error("Model worker failed on a batch: %s", payload)
+                future.set_exception(RuntimeError(f"Model worker failed on a batch: {payload}"))
+
+    def _mark_dead_locked(self, reason: str) -> None:
+        """Fail pending requests. Hold ``_lock``."""
+
+        if not self._dead and self._connection is not None:
+            logger.error("Model worker unavailable (%s)", reason)
+        self._dead = True
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError(_UNAVAILABLE))
+
+
+__all__ = ["ModelFactory", "SubprocessExceptionModel"]
@@ -5,6 +5,12 @@ from __future__ import annotations
 from .inventory import PHONEME_INVENTORY
 from .ipa import canonicalize_ipa
 from .stress import StressAssigner
-from .syllabifier import Syllabifier
+from .syllabifier import Syllabifier, SyllableBatch
 
-__all__ = ["Syllabifier", "StressAssigner", "canonicalize_ipa", "PHONEME_INVENTORY"]
+__all__ = [
+    "Syllabifier",
+    "SyllableBatch",
+    "StressAssigner",
+    "canonicalize_ipa",
+    "PHONEME_INVENTORY",
+]
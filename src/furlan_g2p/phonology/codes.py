@@ -0,0 +1,97 @@
+"""Dense integer codes for phoneme symbols.
+
+Hot phonology paths (syllabification, stress assignment) work on integer codes
+instead of strings so that per-symbol classification becomes a single bit test
+against precomputed masks.  Codes are interned on first use, which keeps the
+table open to symbols outside :data:`PHONEME_INVENTORY` (e.g. lexicon IPA that
+uses ``ʒ`` or ``w``).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+
+from .inventory import PHONEME_INVENTORY
+
+VOWELS: frozenset[str] = frozenset("aeiouɛɔ")
+LENGTH_MARK = "ː"
+STRESS_MARK = "ˈ"
+
+
+class PhonemeCodes:
+    """Interning table mapping phoneme symbols to dense integer codes.
+
+    Each code owns one bit in the classification masks:
+
+    - ``vowel_mask``: the symbol starts with a vowel letter (``a``, ``ɛ``, ``aː``);
+    - ``long_mask``: the symbol contains the length marker ``ː``;
+    - ``stressed_mask``: the symbol starts with the primary stress marker ``ˈ``.
+
+    Examples
+    --------
+    >>> table = PhonemeCodes(["a", "t"])
+    >>> table.is_vowel(table.code("a")), table.is_vowel(table.code("t"))
+    (True, False)
+    >>> table.symbol(table.code("aː"))
+    'aː'
+    """
+
+    __slots__ = ("_codes", "_symbols", "_lock", "vowel_mask", "long_mask", "stressed_mask")
+
+    def __init__(self, symbols: Iterable[str] = ()) -> None:
+        self._codes: dict[str, int] = {}
+        self._symbols: list[str] = []
+        self._lock = threading.Lock()
+        self.vowel_mask = 0
+        self.long_mask = 0
+        self.stressed_mask = 0
+        for symbol in symbols:
+            self.code(symbol)
+
+    def code(self, symbol: str) -> int:
+        """Return the code for ``symbol``, interning it on first use."""
+
+        code = self._codes.get(symbol)
+        if code is not None:
+            return code
+        with self._lock:
+            code = self._codes.get(symbol)
+            if code is not None:
+                return code
+            code = len(self._symbols)
+            bit = 1 << code
+            if symbol and symbol[0] in VOWELS:
+                self.vowel_mask |= bit
+            if LENGTH_MARK in symbol:
+                self.long_mask |= bit
+            if symbol.startswith(STRESS_MARK):
+                self.stressed_mask |= bit
+            self._symbols.append(symbol)
+            self._codes[symbol] = code
+            return code
+
+    def symbol(self, code: int) -> str:
+        """Return the symbol interned as ``code``."""
+
+        return self._symbols[code]
+
+    def is_vowel(self, code: int) -> bool:
+        """Return ``True`` if ``code`` denotes a vowel symbol."""
+
+        return bool(self.vowel_mask >> code & 1)
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+
+def _default_symbols() -> list[str]:
+    long_vowels = [vowel + LENGTH_MARK for vowel in sorted(VOWELS)]
+    return [*PHONEME_INVENTORY, *long_vowels]
+
+
+PHONEME_CODES = PhonemeCodes(_default_symbols())
+"""Process-wide code table shared by the phonology components."""
+
+
+__all__ = ["PhonemeCodes", "PHONEME_CODES", "VOWELS", "LENGTH_MARK", "STRESS_MARK"]
@@ -2,7 +2,47 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Sequence
+
 from ..core.interfaces import IStressAssigner
+from .codes import PHONEME_CODES, STRESS_MARK
+from .syllabifier import SyllableBatch
+
+
+def _stress_position(
+    codes: Sequence[int],
+    syllable_offsets: Sequence[int],
+    first: int,
+    last: int,
+    long_mask: int,
+    stressed_mask: int,
+) -> int:
+    """Return the word-local index of the stressed syllable in ``[first, last)``.
+
+    A pre-marked syllable wins; otherwise the last syllable holding a long
+    vowel, then the penultimate (or only) syllable.  Returns ``-1`` for a word
+    without syllables.
+    """
+
+    count = last - first
+    if count <= 0:
+        return -1
+    long_idx = -1
+    for k in range(first, last):
+        start = syllable_offsets[k]
+        end = syllable_offsets[k + 1]
+        if start == end:
+            continue
+        if stressed_mask >> codes[start] & 1:
+            return k - first
+        for pos in range(start, end):
+            if long_mask >> codes[pos] & 1:
+                long_idx = k - first
+                break
+    if long_idx >= 0:
+        return long_idx
+    return 0 if count == 1 else count - 2
 
 
 class StressAssigner(IStressAssigner):
@@ -40,23 +80,98 @@ class StressAssigner(IStressAssigner):
             return []
         out = [list(s) for s in syllables]
 
-        # Respect pre-marked stress
-        if any(syl and syl[0].startswith("ˈ") for syl in out):
-            return out
+        code = PHONEME_CODES.code
+        codes: array[int] = array("i")
+        offsets: array[int] = array("i", [0])
+        for syl in out:
+            codes.extend(code(ph) for ph in syl)
+            offsets.append(len(codes))
+        batch = SyllableBatch([], codes, offsets, array("i", [0, len(out)]))
+
+        idx = self.assign_stress_batch(batch)[0]
+        target = out[idx]
+        if not (target and target[0].startswith(STRESS_MARK)):
+            target[0] = STRESS_MARK + target[0]
+        return out
 
-        # Long vowel heuristic
-        long_idx = None
-        for idx, syl in enumerate(out):
-            if any("ː" in ph for ph in syl):
-                long_idx = idx
+    def assign_stress_batch(self, batch: SyllableBatch) -> array[int]:
+        """Return the stressed syllable index of every word in ``batch``.
+
+        The computation reads the flat code array and syllable offsets
+        directly, classifying symbols through the code-table bitmasks; no
+        syllable lists are built.
+
+        Parameters
+        ----------
+        batch:
+            Output of :meth:`Syllabifier.syllabify_many`.
+
+        Returns
+        -------
+        array[int]
+            One word-local syllable index per word, or ``-1`` for words
+            without syllables.  A pre-marked syllable is reported as-is.
+
+        Examples
+        --------
+        >>> from furlan_g2p.phonology.syllabifier import Syllabifier
+        >>> batch = Syllabifier().syllabify_many([["o", "r", "e", "l", "e"], ["p", "a", "t", "iː"]])
+        >>> list(StressAssigner().assign_stress_batch(batch))
+        [1, 1]
+        """
 
-        if long_idx is not None:
-            out[long_idx][0] = "ˈ" + out[long_idx][0]
-            return out
+        codes = batch.codes
+        syllable_offsets = batch.syllable_offsets
+        word_offsets = batch.word_offsets
+        long_mask = PHONEME_CODES.long_mask
+        stressed_mask = PHONEME_CODES.stressed_mask
+        return array(
+            "i",
+            [
+                _stress_position(
+                    codes,
+                    syllable_offsets,
+                    word_offsets[w],
+                    word_offsets[w + 1],
+                    long_mask,
+                    stressed_mask,
+                )
+                for w in range(len(word_offsets) - 1)
+            ],
+        )
+
+    def flatten_stressed(
+        self,
+        batch: SyllableBatch,
+        positions: Sequence[int] | None = None,
+    ) -> list[list[str]]:
+        """Return each word of ``batch`` as a flat, stress-marked phoneme list.
+
+        Parameters
+        ----------
+        batch:
+            Syllabified words.
+        positions:
+            Result of :meth:`assign_stress_batch`; computed when omitted.
+        """
 
-        idx = 0 if len(out) == 1 else len(out) - 2
-        out[idx][0] = "ˈ" + out[idx][0]
-        return out
+        if positions is None:
+            positions = self.assign_stress_batch(batch)
+        symbols = batch.symbols
+        syllable_offsets = batch.syllable_offsets
+        word_offsets = batch.word_offsets
+        words: list[list[str]] = []
+        for w, position in enumerate(positions):
+            first = word_offsets[w]
+            start = syllable_offsets[first]
+            end = syllable_offsets[word_offsets[w + 1]]
+            flat = symbols[start:end]
+            if position >= 0:
+                at = syllable_offsets[first + position] - start
+                if not flat[at].startswith(STRESS_MARK):
+                    flat[at] = STRESS_MARK + flat[at]
+            words.append(flat)
+        return words
 
 
 __all__ = ["StressAssigner"]
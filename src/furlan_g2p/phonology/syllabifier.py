@@ -2,45 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 
 from ..core.interfaces import ISyllabifier
-
-_VOWELS = set("aeiouɛɔ")
-
-
-def _is_vowel(ph: str) -> bool:
-    """Return ``True`` if ``ph`` is a vowel symbol."""
-
-    return ph[0] in _VOWELS
-
-
-def _combine_length(phonemes: list[str]) -> list[str]:
-    """Merge length markers with the preceding vowel.
-
-    Parameters
-    ----------
-    phonemes:
-        Raw phoneme list possibly containing standalone ``ː`` markers.
-
-    Returns
-    -------
-    list[str]
-        List where long vowels appear as single elements (e.g. ``aː``).
-    """
-
-    combined: list[str] = []
-    i = 0
-    while i < len(phonemes):
-        ph = phonemes[i]
-        if _is_vowel(ph) and i + 1 < len(phonemes) and phonemes[i + 1] == "ː":
-            combined.append(ph + "ː")
-            i += 2
-        else:
-            combined.append(ph)
-            i += 1
-    return combined
-
+from .codes import LENGTH_MARK, PHONEME_CODES, VOWELS, PhonemeCodes
 
 # Allow complex onsets such as ``pr``/``st``/``spl``.
 _ALLOWED_ONSETS: set[tuple[str, ...]] = {
@@ -64,6 +31,154 @@ _ALLOWED_ONSETS: set[tuple[str, ...]] = {
 }
 
 
+def _build_onset_trie(
+    onsets: Iterable[tuple[str, ...]],
+    codes: PhonemeCodes,
+) -> tuple[list[dict[int, int]], list[bool]]:
+    """Compile ``onsets`` into a trie walked from the *end* of a cluster.
+
+    Node ``0`` is the root.  Walking a consonant cluster right-to-left and
+    remembering the deepest terminal node yields the maximal permissible
+    onset without materialising candidate tuples.
+    """
+
+    transitions: list[dict[int, int]] = [{}]
+    terminal: list[bool] = [False]
+    for onset in onsets:
+        node = 0
+        for symbol in reversed(onset):
+            code = codes.code(symbol)
+            child = transitions[node].get(code)
+            if child is None:
+                child = len(transitions)
+                transitions[node][code] = child
+                transitions.append({})
+                terminal.append(False)
+            node = child
+        terminal[node] = True
+    return transitions, terminal
+
+
+_ONSET_TRIE, _ONSET_TERMINAL = _build_onset_trie(_ALLOWED_ONSETS, PHONEME_CODES)
+
+
+def _encode_combined(phonemes: Iterable[str], codes: PhonemeCodes) -> tuple[list[str], list[int]]:
+    """Merge length markers and encode symbols in a single pass.
+
+    Returns the combined symbols together with their integer codes.
+    """
+
+    symbols: list[str] = []
+    out: list[int] = []
+    pending: str | None = None
+    for ph in phonemes:
+        if pending is not None:
+            if ph == LENGTH_MARK:
+                pending += LENGTH_MARK
+                symbols.append(pending)
+                out.append(codes.code(pending))
+                pending = None
+                continue
+            symbols.append(pending)
+            out.append(codes.code(pending))
+            pending = None
+        if ph[0] in VOWELS:
+            pending = ph
+        else:
+            symbols.append(ph)
+            out.append(codes.code(ph))
+    if pending is not None:
+        symbols.append(pending)
+        out.append(codes.code(pending))
+    return symbols, out
+
+
+def _append_boundaries(codes: Sequence[int], vowel_mask: int, base: int, out: array[int]) -> int:
+    """Append syllable end offsets for one word to ``out``.
+
+    Offsets are absolute (shifted by ``base``).  Returns the number of
+    syllables produced, which is zero only for an empty word.
+    """
+
+    n = len(codes)
+    if n == 0:
+        return 0
+    count = 0
+    i = 0
+    # Skip the leading onset up to the first nucleus.
+    while i < n and not vowel_mask >> codes[i] & 1:
+        i += 1
+    while i < n:
+        j = i + 1
+        while j < n and not vowel_mask >> codes[j] & 1:
+            j += 1
+        if j == n:
+            break
+        onset = 0
+        if j > i + 1:
+            onset = 1
+            node = 0
+            depth = 0
+            k = j - 1
+            while k > i:
+                nxt = _ONSET_TRIE[node].get(codes[k])
+                if nxt is None:
+                    break
+                node = nxt
+                depth += 1
+                if _ONSET_TERMINAL[node]:
+                    onset = depth
+                k -= 1
+        out.append(base + j - onset)
+        count += 1
+        i = j
+    out.append(base + n)
+    return count + 1
+
+
+@dataclass(slots=True)
+class SyllableBatch:
+    """Flat, offset-based syllabification of several words.
+
+    The layout mirrors a CSR matrix: ``symbols``/``codes`` hold the combined
+    phonemes of every word back to back, syllable ``k`` spans
+    ``symbols[syllable_offsets[k]:syllable_offsets[k + 1]]`` and word ``w``
+    owns syllables ``word_offsets[w]`` to ``word_offsets[w + 1]``.
+
+    Attributes
+    ----------
+    symbols:
+        Combined phoneme symbols (length markers merged into vowels).
+    codes:
+        Integer codes of ``symbols`` in :data:`~furlan_g2p.phonology.codes.PHONEME_CODES`.
+    syllable_offsets:
+        Syllable boundaries into ``symbols``; starts with ``0``.
+    word_offsets:
+        Word boundaries into the syllable index space; starts with ``0``.
+    """
+
+    symbols: list[str]
+    codes: array[int]
+    syllable_offsets: array[int]
+    word_offsets: array[int]
+
+    def __len__(self) -> int:
+        return len(self.word_offsets) - 1
+
+    def word(self, index: int) -> list[list[str]]:
+        """Return word ``index`` as nested syllable lists."""
+
+        bounds = self.syllable_offsets
+        first = self.word_offsets[index]
+        last = self.word_offsets[index + 1]
+        return [self.symbols[bounds[k] : bounds[k + 1]] for k in range(first, last)]
+
+    def to_lists(self) -> list[list[list[str]]]:
+        """Return every word as nested syllable lists."""
+
+        return [self.word(index) for index in range(len(self))]
+
+
 class Syllabifier(ISyllabifier):
     """Syllabifier using onset maximisation and basic clusters.
 
@@ -83,42 +198,56 @@ class Syllabifier(ISyllabifier):
     def syllabify(self, phonemes: Iterable[str]) -> list[list[str]]:
         """Split ``phonemes`` into a list of syllables."""
 
-        phs = _combine_length(list(phonemes))
-        syllables: list[list[str]] = []
-        onset: list[str] = []
-        i = 0
-        while i < len(phs):
-            ph = phs[i]
-            if _is_vowel(ph):
-                nucleus = ph
-                i += 1
-                cluster: list[str] = []
-                while i < len(phs) and not _is_vowel(phs[i]):
-                    cluster.append(phs[i])
-                    i += 1
-                if i < len(phs):
-                    split = len(cluster)
-                    for size in range(min(3, len(cluster)), 0, -1):
-                        cand = tuple(cluster[-size:])
-                        if cand in _ALLOWED_ONSETS or size == 1:
-                            split = len(cluster) - size
-                            break
-                    coda = cluster[:split]
-                    next_onset = cluster[split:]
-                    syllables.append(onset + [nucleus] + coda)
-                    onset = next_onset
-                else:
-                    syllables.append(onset + [nucleus] + cluster)
-                    onset = []
-            else:
-                onset.append(ph)
-                i += 1
-        if onset:
-            if syllables:
-                syllables[-1].extend(onset)
-            else:
-                syllables.append(onset)
-        return syllables
-
-
-__all__ = ["Syllabifier"]
+        symbols, codes = _encode_combined(phonemes, PHONEME_CODES)
+        bounds: array[int] = array("i", [0])
+        _append_boundaries(codes, PHONEME_CODES.vowel_mask, 0, bounds)
+        return [symbols[bounds[k] : bounds[k + 1]] for k in range(len(bounds) - 1)]
+
+    def syllable_boundaries(self, codes: Sequence[int]) -> array[int]:
+        """Return syllable boundaries for already combined phoneme ``codes``.
+
+        Parameters
+        ----------
+        codes:
+            Codes from :data:`~furlan_g2p.phonology.codes.PHONEME_CODES` with
+            length markers merged into their vowels.
+
+        Returns
+        -------
+        array[int]
+            Offsets ``[0, b1, ..., len(codes)]``; a single ``[0]`` for empty
+            input.
+        """
+
+        bounds: array[int] = array("i", [0])
+        _append_boundaries(codes, PHONEME_CODES.vowel_mask, 0, bounds)
+        return bounds
+
+    def syllabify_many(self, words: Iterable[Iterable[str]]) -> SyllableBatch:
+        """Syllabify several phoneme sequences into one flat batch.
+
+        Examples
+        --------
+        >>> batch = Syllabifier().syllabify_many([["o", "r", "e"], ["k", "u", "ː", "r"]])
+        >>> list(batch.syllable_offsets), list(batch.word_offsets)
+        ([0, 1, 3, 6], [0, 2, 3])
+        >>> batch.word(1)
+        [['k', 'uː', 'r']]
+        """
+
+        symbols: list[str] = []
+        codes: array[int] = array("i")
+        syllable_offsets: array[int] = array("i", [0])
+        word_offsets: array[int] = array("i", [0])
+        for word in words:
+            word_symbols, word_codes = _encode_combined(word, PHONEME_CODES)
+            vowel_mask = PHONEME_CODES.vowel_mask
+            base = len(symbols)
+            symbols.extend(word_symbols)
+            codes.extend(word_codes)
+            count = _append_boundaries(word_codes, vowel_mask, base, syllable_offsets)
+            word_offsets.append(word_offsets[-1] + count)
+        return SyllableBatch(symbols, codes, syllable_offsets, word_offsets)
+
+
+__all__ = ["Syllabifier", "SyllableBatch"]
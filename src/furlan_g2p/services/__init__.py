@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
+from .instrumentation import Histogram, PipelineMetrics
 from .io_service import IOService
 from .pipeline import PipelineService
+from .worker_pool import PipelineWorkerPool, ProcessMemory, process_memory
 
-__all__ = ["PipelineService", "IOService"]
+__all__ = [
+    "PipelineService",
+    "IOService",
+    "PipelineMetrics",
+    "Histogram",
+    "PipelineWorkerPool",
+    "ProcessMemory",
+    "process_memory",
+]
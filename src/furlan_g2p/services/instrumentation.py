@@ -0,0 +1,313 @@
+"""Opt-in timing and counter instrumentation for the pipeline."""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+
+STAGES: tuple[str, ...] = ("normalize", "tokenize", "lexicon", "rules", "syllabify", "stress")
+"""Pipeline stages timed by :class:`PipelineMetrics`."""
+
+COUNTERS: tuple[str, ...] = ("texts", "tokens", "lexicon_hits", "rule_fallbacks", "rule_errors")
+"""Counters always present in :meth:`PipelineMetrics.stats` snapshots."""
+
+# Bucket upper bounds in seconds: 1 µs doubling up to ~17 s, then overflow.
+_BUCKET_BOUNDS: tuple[float, ...] = tuple(1e-6 * 2**i for i in range(25))
+
+MetricsExporter = Callable[[dict[str, object]], None]
+"""Callback receiving a :meth:`PipelineMetrics.stats` snapshot."""
+
+
+class Histogram:
+    """Fixed log-bucket latency histogram.
+
+    Observations cost one ``bisect`` plus a few additions; quantiles are
+    reported as the upper bound of the bucket containing them.
+
+    Examples
+    --------
+    >>> hist = Histogram()
+    >>> hist.observe(0.002)
+    >>> hist.snapshot()["count"]
+    1
+    """
+
+    __slots__ = ("_counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+
+    def observe(self, seconds: float, count: int = 1) -> None:
+        """Record ``count`` observations of a duration in seconds."""
+
+        self._counts[bisect_left(_BUCKET_BOUNDS, seconds)] += count
+        self.count += count
+        self.total += seconds * count
+        if seconds < self.minimum:
+            self.minimum = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def quantile(self, q: float) -> float:
+        """Return an upper-bound estimate of quantile ``q`` in ``[0, 1]``."""
+
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if bucket_count and seen >= target:
+                if index < len(_BUCKET_BOUNDS):
+                    return min(_BUCKET_BOUNDS[index], self.maximum)
+                break
+        return self.maximum
+
+    def snapshot(self) -> dict[str, object]:
+        """Return count, sum, extremes, quantiles and non-empty buckets."""
+
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": [
+                [_BUCKET_BOUNDS[i] if i < len(_BUCKET_BOUNDS) else None, bucket_count]
+                for i, bucket_count in enumerate(self._counts)
+                if bucket_count
+            ],
+        }
+
+
+class PipelineMetrics:
+    """Per-stage timing histograms and token counters for a pipeline.
+
+    Attach an instance to :class:`~furlan_g2p.services.PipelineService` (or a
+    :class:`~furlan_g2p.g2p.phonemizer.G2PPhonemizer`) to enable timing;
+    when no metrics object is attached the stage timings are not recorded.
+    Updates are guarded by a lock so one instance can be shared by
+    threads.
+
+    Parameters
+    ----------
+    exporter:
+        Optional callback receiving :meth:`stats` snapshots, e.g. to push
+        them into an external metrics system.
+    export_interval:
+        When set together with ``exporter``, :meth:`maybe_export` forwards a
+        snapshot at most once per this many seconds.
+
+    Examples
+    --------
+    >>> metrics = PipelineMetrics()
+    >>> metrics.observe("normalize", 0.001)
+    >>> metrics.increment("tokens", 3)
+    >>> metrics.stats()["counters"]["tokens"]
+    3
+    """
+
+    def __init__(
+        self,
+        exporter: MetricsExporter | None = None,
+        export_interval: float | None = None,
+    ) -> None:
+        self.exporter = exporter
+        self.export_interval = export_interval
+        self._lock = threading.Lock()
+        self._histograms: dict[str, Histogram] = {}
+        self._counters: dict[str, int] = {}
+        self._busy_seconds = 0.0
+        self._started = time.perf_counter()
+        self._last_export = self._started
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all histograms and counters."""
+
+        with self._lock:
+            self._histograms = {stage: Histogram() for stage in STAGES}
+            self._counters = dict.fromkeys(COUNTERS, 0)
+            self._busy_seconds = 0.0
+            self._started = time.perf_counter()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record ``seconds`` spent in ``stage`` (new stage names are allowed)."""
+
+        with self._lock:
+            self._observe_many({stage: seconds})
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to counter ``name``."""
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def record_text(
+        self,
+        tokens: int,
+        seconds: float,
+        stages: dict[str, float] | None = None,
+        texts: int = 1,
+    ) -> None:
+        """Record processed text(s) under a single lock acquisition.
+
+        Parameters
+        ----------
+        tokens:
+            Number of tokens in the text.
+        seconds:
+            Total wall time spent on the text.
+        stages:
+            Optional per-stage durations to add to the histograms.
+        texts:
+            Number of texts covered, when recording a whole batch at once.
+            Each stage histogram gets ``texts`` observations of the
+            per-text mean.
+        """
+
+        with self._lock:
+            self._counters["texts"] += texts
+            self._counters["tokens"] += tokens
+            self._busy_seconds += seconds
+            if stages:
+                self._observe_many(stages, texts)
+
+    def record_g2p(
+        self,
+        lexicon_seconds: float,
+        rules_seconds: float,
+        lexicon_hits: int,
+        rule_fallbacks: int,
+        texts: int = 1,
+    ) -> None:
+        """Record one phonemizer call (lexicon/rules time and hit counters).
+
+        ``texts`` is the number of texts the call served; the stage times
+        are observed as that many per-text means.
+        """
+
+        with self._lock:
+            self._observe_many({"lexicon": lexicon_seconds, "rules": rules_seconds}, texts)
+            self._counters["lexicon_hits"] += lexicon_hits
+            self._counters["rule_fallbacks"] += rule_fallbacks
+
+    def record_model(
+        self, seconds: float, batches: int, words: int, hits: int, texts: int = 1
+    ) -> None:
+        """Record the exception-model stage of one phonemizer call.
+
+        Parameters
+        ----------
+        seconds:
+            Time spent in ``predict_batch`` calls.
+        batches:
+            Number of ``predict_batch`` calls; the ``model`` stage is only
+            observed when this is non-zero.
+        words:
+            Distinct lexicon misses sent to the model.
+        hits:
+            Tokens resolved by an accepted prediction.
+        texts:
+            Texts served by the call, as in :meth:`record_g2p`.
+        """
+
+        with self._lock:
+            if batches:
+                self._observe_many({"model": seconds}, texts)
+            for name, amount in (
+                ("model_batches", batches),
+                ("model_words", words),
+                ("model_hits", hits),
+            ):
+                self._counters[name] = self._counters.get(name, 0) + amount
+
+    def record_cache(self, seconds: float, tokens: int, hits: int, texts: int = 1) -> None:
+        """Record the word-cache reads and writes of one phonemizer call.
+
+        Parameters
+        ----------
+        seconds:
+            Time spent reading from and writing to the cache.
+        tokens:
+            Tokens of the call.
+        hits:
+            Tokens answered from the cache.
+        texts:
+            Texts served by the call, as in :meth:`record_g2p`.
+        """
+
+        with self._lock:
+            self._observe_many({"cache": seconds}, texts)
+            for name, amount in (("cache_tokens", tokens), ("cache_hits", hits)):
+                self._counters[name] = self._counters.get(name, 0) + amount
+
+    def _observe_many(self, stages: dict[str, float], texts: int = 1) -> None:
+        count = max(texts, 1)
+        for stage, seconds in stages.items():
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram()
+            histogram.observe(seconds / count, count)
+
+    def stats(self) -> dict[str, object]:
+        """Return a JSON-serializable snapshot of all metrics.
+
+        Returns
+        -------
+        dict[str, object]
+            ``stages`` (histogram snapshots), ``counters``, ``busy_seconds``
+            (time spent inside the pipeline), ``uptime_seconds`` and
+            ``tokens_per_second`` (tokens over busy time).
+
+        Notes
+        -----
+        Stage histograms are per text: a batch of ``n`` texts (a
+        ``process_batch`` call, a CSV chunk, a two-pass vocabulary) adds
+        ``n`` observations of its per-text mean, so single texts and batches
+        share one scale. Quantiles therefore reflect the spread across
+        calls, not within a batch; a stage's ``sum`` is still its total
+        time.
+        """
+
+        with self._lock:
+            busy = self._busy_seconds
+            counters = dict(self._counters)
+            stages = {name: hist.snapshot() for name, hist in self._histograms.items()}
+            uptime = time.perf_counter() - self._started
+        return {
+            "enabled": True,
+            "stages": stages,
+            "counters": counters,
+            "busy_seconds": busy,
+            "uptime_seconds": uptime,
+            "tokens_per_second": counters["tokens"] / busy if busy > 0 else 0.0,
+        }
+
+    def export(self) -> None:
+        """Send a snapshot to the exporter, if one is configured."""
+
+        if self.exporter is None:
+            return
+        self._last_export = time.perf_counter()
+        self.exporter(self.stats())
+
+    def maybe_export(self) -> None:
+        """Export if ``export_interval`` seconds have passed since the last export."""
+
+        if self.exporter is None or self.export_interval is None:
+            return
+        if time.perf_counter() - self._last_export >= self.export_interval:
+            self.export()
+
+
+__all__ = ["COUNTERS", "Histogram", "MetricsExporter", "PipelineMetrics", "STAGES"]
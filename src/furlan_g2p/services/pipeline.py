@@ -3,14 +3,32 @@
 from __future__ import annotations
 
 import csv
+import itertools
+import json
+import tempfile
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Protocol
 
 from ..g2p.lexicon import Lexicon
 from ..g2p.phonemizer import G2PPhonemizer
+from ..g2p.word_cache import WordCache
 from ..lexicon.schema import LexiconConfig
 from ..normalization.normalizer import Normalizer
 from ..phonology.stress import StressAssigner
 from ..phonology.syllabifier import Syllabifier
 from ..tokenization.tokenizer import Tokenizer
+from .instrumentation import MetricsExporter, PipelineMetrics
+
+if TYPE_CHECKING:
+    from ..ml.interfaces import IExceptionModel
+
+# Rows per batch in ``process_csv`` (both modes).
+_CSV_CHUNK_ROWS = 1024
+
+
+class _CsvWriter(Protocol):
+    def writerows(self, rows: Iterable[Iterable[Any]]) -> None: ...
 
 
 class PipelineService:
@@ -24,6 +42,15 @@ class PipelineService:
         Lexicon lookup behavior configuration.
     phonemizer:
         Optional custom phonemizer instance.
+    metrics:
+        Optional :class:`PipelineMetrics` recording per-stage timing and
+        counters. Without it nothing is recorded.
+    exception_model:
+        Optional model for lexicon misses, used by the default phonemizer
+        (ignored when ``phonemizer`` is given).
+    word_cache:
+        Optional persistent :class:`WordCache` for the default phonemizer
+        (ignored when ``phonemizer`` is given).
     """
 
     def __init__(
@@ -31,15 +58,62 @@ class PipelineService:
         default_dialect: str | None = None,
         lexicon_config: LexiconConfig | None = None,
         phonemizer: G2PPhonemizer | None = None,
+        metrics: PipelineMetrics | None = None,
+        exception_model: IExceptionModel | None = None,
+        word_cache: WordCache | None = None,
     ) -> None:
         self.lexicon_config = lexicon_config or LexiconConfig(default_dialect=default_dialect)
         self.default_dialect = default_dialect or self.lexicon_config.default_dialect
 
         self.normalizer = Normalizer()
         self.tokenizer = Tokenizer()
-        self.phonemizer = phonemizer or G2PPhonemizer(lexicon=Lexicon(config=self.lexicon_config))
+        self.phonemizer = phonemizer or G2PPhonemizer(
+            lexicon=Lexicon(config=self.lexicon_config),
+            exception_model=exception_model,
+            word_cache=word_cache,
+        )
         self.syllabifier = Syllabifier()
         self.stress = StressAssigner()
+        self.metrics: PipelineMetrics | None = None
+        if metrics is not None:
+            self.enable_metrics(metrics=metrics)
+
+    def enable_metrics(
+        self,
+        exporter: MetricsExporter | None = None,
+        export_interval: float | None = None,
+        metrics: PipelineMetrics | None = None,
+    ) -> PipelineMetrics:
+        """Turn on instrumentation and return the active metrics object.
+
+        Parameters
+        ----------
+        exporter:
+            Callback receiving :meth:`stats` snapshots.
+        export_interval:
+            Minimum seconds between automatic exports after each text.
+        metrics:
+            Existing metrics object to share; a new one is created otherwise.
+        """
+
+        self.metrics = metrics or PipelineMetrics(
+            exporter=exporter, export_interval=export_interval
+        )
+        self.phonemizer.metrics = self.metrics
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        """Detach instrumentation; stage timings and counters are no longer recorded."""
+
+        self.metrics = None
+        self.phonemizer.metrics = None
+
+    def stats(self) -> dict[str, object]:
+        """Return a metrics snapshot, or ``{"enabled": False}`` when disabled."""
+
+        if self.metrics is None:
+            return {"enabled": False}
+        return self.metrics.stats()
 
     def process_text(
         self,
@@ -48,24 +122,67 @@ class PipelineService:
     ) -> tuple[str, list[str]]:
         """Return ``(normalized_text, phoneme_sequence_as_list)``.
 
+        Same as :meth:`process_batch` with a single text.
+
         Examples
         --------
         >>> PipelineService().process_text("Cjase")
         ('cjase', ['ˈc', 'a', 'z', 'e'])
         """
 
+        return self.process_batch([text], dialect=dialect)[0]
+
+    def process_batch(
+        self,
+        texts: Iterable[str],
+        dialect: str | None = None,
+    ) -> list[tuple[str, list[str]]]:
+        """Process several texts, sharing one lexicon and model pass.
+
+        Results match :meth:`process_text` per text; the batch form lets the
+        phonemizer send every lexicon miss of the batch to the exception
+        model together.
+
+        Examples
+        --------
+        >>> PipelineService().process_batch(["Cjase", "sôl"])[0]
+        ('cjase', ['ˈc', 'a', 'z', 'e'])
+        """
+
         active_dialect = dialect or self.default_dialect
+        metrics = self.metrics
+        clock = time.perf_counter
+        started = clock()
+        norms = [self.normalizer.normalize(text) for text in texts]
+        after_normalize = clock()
+        token_lists: list[list[str]] = []
+        for norm in norms:
+            tokens: list[str] = []
+            for sentence in self.tokenizer.split_sentences(norm):
+                tokens.extend(self.tokenizer.split_words(sentence))
+            token_lists.append(tokens)
+        after_tokenize = clock()
+        phonemes = self.phonemizer.to_phonemes_batch(token_lists, dialect=active_dialect)
+        after_g2p = clock()
+        batch = self.syllabifier.syllabify_many(phonemes)
+        after_syllabify = clock()
+        flat = self.stress.flatten_stressed(batch)
+        finished = clock()
 
-        norm = self.normalizer.normalize(text)
-        sentences = self.tokenizer.split_sentences(norm)
-        tokens: list[str] = []
-        for sentence in sentences:
-            tokens.extend(self.tokenizer.split_words(sentence))
-        phonemes = self.phonemizer.to_phonemes(tokens, dialect=active_dialect)
-        syllables = self.syllabifier.syllabify(phonemes)
-        stressed = self.stress.assign_stress(syllables)
-        flat = [phoneme for syllable in stressed for phoneme in syllable]
-        return norm, flat
+        if metrics is not None:
+            metrics.record_text(
+                sum(len(tokens) for tokens in token_lists),
+                finished - started,
+                {
+                    "normalize": after_normalize - started,
+                    "tokenize": after_tokenize - after_normalize,
+                    "syllabify": after_syllabify - after_g2p,
+                    "stress": finished - after_syllabify,
+                },
+                texts=len(norms),
+            )
+            metrics.maybe_export()
+        return list(zip(norms, flat, strict=True))
 
     def process_csv(
         self,
@@ -74,6 +191,7 @@ class PipelineService:
         delimiter: str = "|",
         dialect: str | None = None,
         dialect_column: int | None = None,
+        two_pass: bool = False,
     ) -> None:
         """Phonemize an LJSpeech-like metadata CSV file.
 
@@ -89,29 +207,170 @@ class PipelineService:
             Optional fallback dialect applied to every row.
         dialect_column:
             Optional zero-based column index containing per-row dialect tags.
+        two_pass:
+            Resolve the vocabulary first (see :meth:`_process_csv_two_pass`):
+            same output, but G2P work scales with the number of distinct
+            words instead of the number of tokens.
+
+        By default rows are processed in chunks through :meth:`process_batch`
+        (one call per dialect within a chunk), so the exception model sees
+        the lexicon misses of many rows at once.
+
+        Universal-entry fallbacks are counted rather than logged per token;
+        a per-dialect/per-source summary is logged once the file is done.
+        In two-pass mode fallbacks and lexicon/rule counters count distinct
+        words per dialect rather than tokens.
         """
 
+        fallbacks = self.phonemizer.fallbacks
+        fallbacks_before = fallbacks.counts()
         with (
             open(input_csv_path, encoding="utf-8") as src,
             open(output_csv_path, "w", encoding="utf-8", newline="") as dst,
         ):
             reader = csv.reader(src, delimiter=delimiter)
             writer = csv.writer(dst, delimiter=delimiter)
+            if two_pass:
+                self._process_csv_two_pass(reader, writer, dialect, dialect_column)
+            else:
+                chunk: list[list[str]] = []
+                for row in itertools.chain(reader, [None]):
+                    if row is not None:
+                        if len(row) < 2:
+                            continue
+                        chunk.append(row)
+                        if len(chunk) < _CSV_CHUNK_ROWS:
+                            continue
+                    if chunk:
+                        self._process_csv_chunk(chunk, writer, dialect, dialect_column)
+                    chunk = []
+        fallbacks.log_summary(since=fallbacks_before)
+
+    def _process_csv_chunk(
+        self,
+        rows: list[list[str]],
+        writer: _CsvWriter,
+        dialect: str | None,
+        dialect_column: int | None,
+    ) -> None:
+        """Process rows with one :meth:`process_batch` per dialect and write them in order."""
+
+        by_dialect: dict[str | None, list[int]] = {}
+        for index, row in enumerate(rows):
+            by_dialect.setdefault(_row_dialect(row, dialect, dialect_column), []).append(index)
+        results: list[tuple[str, list[str]]] = [("", [])] * len(rows)
+        for row_dialect, indices in by_dialect.items():
+            batch = self.process_batch([rows[index][1] for index in indices], dialect=row_dialect)
+            for index, result in zip(indices, batch, strict=True):
+                results[index] = result
+        writer.writerows(
+            [row[0], norm, " ".join(phonemes)]
+            for row, (norm, phonemes) in zip(rows, results, strict=True)
+        )
+
+    def _process_csv_two_pass(
+        self,
+        reader: Iterable[list[str]],
+        writer: _CsvWriter,
+        dialect: str | None,
+        dialect_column: int | None,
+    ) -> None:
+        """Vocabulary-first ``process_csv``.
+
+        Pass one normalizes and tokenizes every row, spools
+        ``(id, dialect, normalized, tokens)`` to a temporary file and
+        collects the distinct words per dialect. Each vocabulary is then
+        phonemized in one :meth:`G2PPhonemizer.phonemize_words` call
+        (lexicon -> model -> rules, bulk). Pass two replays the spool,
+        assembles each row from the resolved table and runs syllabification
+        and stress over chunks of rows.
+        """
+
+        metrics = self.metrics
+        clock = time.perf_counter
+        started = clock()
+        normalize_seconds = tokenize_seconds = syllabify_seconds = stress_seconds = 0.0
+        rows = token_count = 0
+        vocabularies: dict[str | None, dict[str, None]] = {}
+        dialect_rows: dict[str | None, int] = {}
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
             for row in reader:
                 if len(row) < 2:
                     continue
+                row_dialect = _row_dialect(row, dialect, dialect_column) or self.default_dialect
+                start = clock()
+                norm = self.normalizer.normalize(row[1])
+                after_normalize = clock()
+                tokens: list[str] = []
+                for sentence in self.tokenizer.split_sentences(norm):
+                    tokens.extend(self.tokenizer.split_words(sentence))
+                normalize_seconds += after_normalize - start
+                tokenize_seconds += clock() - after_normalize
+                vocabularies.setdefault(row_dialect, {}).update(dict.fromkeys(tokens))
+                dialect_rows[row_dialect] = dialect_rows.get(row_dialect, 0) + 1
+                spool.write(json.dumps([row[0], row_dialect, norm, tokens], ensure_ascii=False))
+                spool.write("\n")
+                rows += 1
+                token_count += len(tokens)
+
+            resolved: dict[str | None, dict[str, list[str]]] = {}
+            for vocabulary_dialect, vocabulary in vocabularies.items():
+                words = list(vocabulary)
+                segments = self.phonemizer.phonemize_words(
+                    words, dialect=vocabulary_dialect, texts=dialect_rows[vocabulary_dialect]
+                )
+                resolved[vocabulary_dialect] = dict(zip(words, segments, strict=True))
+
+            spool.seek(0)
+            chunk: list[tuple[str, str, list[str]]] = []
+            for line in itertools.chain(spool, [None]):
+                if line is not None:
+                    row_id, row_dialect, norm, tokens = json.loads(line)
+                    table = resolved[row_dialect]
+                    phonemes = [phone for token in tokens for phone in table[token]]
+                    chunk.append((row_id, norm, phonemes))
+                    if len(chunk) < _CSV_CHUNK_ROWS:
+                        continue
+                if not chunk:
+                    break
+                start = clock()
+                batch = self.syllabifier.syllabify_many([phonemes for _, _, phonemes in chunk])
+                after_syllabify = clock()
+                flat = self.stress.flatten_stressed(batch)
+                syllabify_seconds += after_syllabify - start
+                stress_seconds += clock() - after_syllabify
+                writer.writerows(
+                    [row_id, norm, " ".join(stressed)]
+                    for (row_id, norm, _), stressed in zip(chunk, flat, strict=True)
+                )
+                chunk = []
+
+        if metrics is not None:
+            metrics.record_text(
+                token_count,
+                clock() - started,
+                {
+                    "normalize": normalize_seconds,
+                    "tokenize": tokenize_seconds,
+                    "syllabify": syllabify_seconds,
+                    "stress": stress_seconds,
+                },
+                texts=rows,
+            )
+            metrics.maybe_export()
+
+
+def _row_dialect(row: list[str], dialect: str | None, dialect_column: int | None) -> str | None:
+    """Return the row's dialect tag, or ``dialect`` when the column is absent or empty."""
 
-                row_dialect = dialect
-                if (
-                    dialect_column is not None
-                    and dialect_column >= 0
-                    and len(row) > dialect_column
-                    and row[dialect_column].strip()
-                ):
-                    row_dialect = row[dialect_column].strip()
-
-                norm, phonemes = self.process_text(row[1], dialect=row_dialect)
-                writer.writerow([row[0], norm, " ".join(phonemes)])
+    if (
+        dialect_column is not None
+        and dialect_column >= 0
+        and len(row) > dialect_column
+        and row[dialect_column].strip()
+    ):
+        return row[dialect_column].strip()
+    return dialect
 
 
 __all__ = ["PipelineService"]
@@ -0,0 +1,252 @@
+"""Fork-based process pool sharing one warm pipeline copy-on-write."""
+
+from __future__ import annotations
+
+import gc
+import multiprocessing
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .pipeline import PipelineService
+
+# Pipeline inherited by each forked worker (set by ``_init_worker``).
+_WORKER_STATE: dict[str, PipelineService] = {}
+
+_Result = tuple[str, list[str]]
+
+
+@dataclass(frozen=True)
+class ProcessMemory:
+    """Memory of one process, in bytes, from ``/proc/<pid>/smaps_rollup``.
+
+    Parameters
+    ----------
+    pid:
+        Process id.
+    rss:
+        Resident set size, including pages shared with other processes.
+    pss:
+        Proportional set size: shared pages divided among their sharers.
+    uss:
+        Unique set size: pages private to this process (what it really
+        costs; copy-on-write pages dirtied after fork land here).
+    """
+
+    pid: int
+    rss: int
+    pss: int
+    uss: int
+
+
+def process_memory(pid: int) -> ProcessMemory | None:
+    """Return the memory of process ``pid``.
+
+    Parameters
+    ----------
+    pid:
+        Process id.
+
+    Returns
+    -------
+    ProcessMemory | None
+        ``None`` when ``/proc/<pid>/smaps_rollup`` is unavailable (not Linux,
+        or the process has exited).
+    """
+
+    try:
+        text = Path(f"/proc/{pid}/smaps_rollup").read_text(encoding="ascii")
+    except OSError:
+        return None
+    fields: dict[str, int] = {}
+    for line in text.splitlines():
+        name, _, value = line.partition(":")
+        parts = value.split()
+        if len(parts) == 2 and parts[1] == "kB":
+            fields[name] = int(parts[0]) * 1024
+    return ProcessMemory(
+        pid=pid,
+        rss=fields.get("Rss", 0),
+        pss=fields.get("Pss", 0),
+        uss=fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    )
+
+
+def _init_worker(service: PipelineService) -> None:
+    """Keep the inherited pipeline (passed without pickling under ``fork``)."""
+
+    _WORKER_STATE["service"] = service
+
+
+def _process_chunk(chunk: tuple[list[str], str | None]) -> tuple[int, list[_Result]]:
+    """Process one chunk of texts in a worker and report the worker's pid."""
+
+    texts, dialect = chunk
+    return os.getpid(), _WORKER_STATE["service"].process_batch(texts, dialect=dialect)
+
+
+class PipelineWorkerPool:
+    """Process pool whose workers share one pre-built pipeline.
+
+    The pipeline (lexicon, rules, optional exception model) is built once
+    in the parent, warmed with ``warm_texts`` so lazily built state exists
+    before forking, and then moved out of the garbage collector's reach
+    with :func:`gc.freeze`. Workers are forked from this state: they
+    inherit the lexicon instead of loading it, and since the collector no
+    longer writes to the frozen objects' headers, their pages stay shared
+    copy-on-write. Only pages touched by reference counting on the lookup
+    path become private to a worker. :meth:`memory` reports per-worker RSS,
+    PSS and USS to verify the sharing.
+
+    Requires the ``fork`` start method (Linux, macOS). Fork before starting
+    background threads (e.g. :class:`ReloadableLexicon` polling or a
+    ``SubprocessExceptionModel``): threads do not survive ``fork``.
+
+    Parameters
+    ----------
+    service:
+        Pipeline to share; a default :class:`PipelineService` is built when
+        omitted.
+    workers:
+        Number of worker processes (default: one per CPU).
+    chunk_size:
+        Texts per task; each task runs :meth:`PipelineService.process_batch`.
+    warm_texts:
+        Texts processed in the parent before forking.
+    freeze:
+        Call :func:`gc.freeze` before forking (undone by :meth:`close`).
+        Skipped when the process already has frozen objects, whose owner
+        is then left to unfreeze them.
+
+    Raises
+    ------
+    RuntimeError
+        If the platform has no ``fork`` start method.
+    ValueError
+        If ``workers`` or ``chunk_size`` is not positive.
+
+    Examples
+    --------
+    >>> with PipelineWorkerPool(PipelineService(), workers=4) as pool:  # doctest: +SKIP
+    ...     results = pool.map(texts)
+    ...     pool.memory()
+    """
+
+    def __init__(
+        self,
+        service: PipelineService | None = None,
+        workers: int | None = None,
+        chunk_size: int = 64,
+        warm_texts: Iterable[str] = ("Cjase",),
+        freeze: bool = True,
+    ) -> None:
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("PipelineWorkerPool requires the 'fork' start method")
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.service = service or PipelineService()
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.service.process_batch(list(warm_texts))
+        self._frozen = freeze and gc.get_freeze_count() == 0
+        if self._frozen:
+            gc.collect()
+            gc.freeze()
+        self._pids: set[int] = set()
+        self._executor: ProcessPoolExecutor | None = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self.service,),
+        )
+
+    def map(self, texts: Iterable[str], dialect: str | None = None) -> list[_Result]:
+        """Process ``texts`` in the workers.
+
+        Parameters
+        ----------
+        texts:
+            Texts to process.
+        dialect:
+            Optional dialect for every text.
+
+        Returns
+        -------
+        list[tuple[str, list[str]]]
+            ``(normalized_text, phonemes)`` per text, in input order, as
+            returned by :meth:`PipelineService.process_text`.
+
+        Raises
+        ------
+        RuntimeError
+            If the pool was closed.
+        """
+
+        if self._executor is None:
+            raise RuntimeError("PipelineWorkerPool is closed")
+        results: list[_Result] = []
+        for pid, chunk in self._executor.map(_process_chunk, self._chunks(texts, dialect)):
+            self._pids.add(pid)
+            results.extend(chunk)
+        return results
+
+    def memory(self) -> dict[str, object]:
+        """Return the memory of the parent and of every worker that ran a task.
+
+        Returns
+        -------
+        dict[str, object]
+            ``parent`` and ``workers`` (lists of :class:`ProcessMemory` as
+            dicts, exited workers omitted) plus ``workers_uss`` and
+            ``workers_rss`` totals in bytes. Empty lists where ``/proc`` is
+            unavailable.
+        """
+
+        parent = process_memory(os.getpid())
+        workers = [
+            memory
+            for memory in (process_memory(pid) for pid in sorted(self._pids))
+            if memory is not None
+        ]
+        return {
+            "parent": None if parent is None else vars(parent),
+            "workers": [vars(memory) for memory in workers],
+            "workers_rss": sum(memory.rss for memory in workers),
+            "workers_uss": sum(memory.uss for memory in workers),
+        }
+
+    def close(self) -> None:
+        """Shut the workers down and undo this pool's :func:`gc.freeze`."""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._frozen:
+            gc.unfreeze()
+            self._frozen = False
+
+    def __enter__(self) -> PipelineWorkerPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _chunks(
+        self, texts: Iterable[str], dialect: str | None
+    ) -> Iterator[tuple[list[str], str | None]]:
+        chunk: list[str] = []
+        for text in texts:
+            chunk.append(text)
+            if len(chunk) == self.chunk_size:
+                yield chunk, dialect
+                chunk = []
+        if chunk:
+            yield chunk, dialect
+
+
+__all__ = ["PipelineWorkerPool", "ProcessMemory", "process_memory"]
@@ -10,6 +10,17 @@ from click.testing import CliRunner
 from furlan_g2p.lexicon import LexiconEntry
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Point persistent caches (word cache, lexicon snapshots) at a per-test directory."""
+
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("FURLAN_G2P_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def cli_runner() -> CliRunner:
     """Return a Click CLI runner."""
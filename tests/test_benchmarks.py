@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_benchmark_runner_writes_json(tmp_path: Path) -> None:
+    out = tmp_path / "bench.json"
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.run", "--size", "40", "--repeat", "1"]
+        + ["--output", str(out)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    report = json.loads(out.read_text(encoding="utf-8"))
+    names = {result["name"] for result in report["results"]}
+    assert {"normalizer.normalize", "lexicon.lookup", "evaluator.evaluate"} <= names
+    assert report["size"] == 40
+    assert all(result["items"] > 0 for result in report["results"])
+
+
+def test_benchmark_runner_stage_filter() -> None:
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.run", "--size", "20", "--repeat", "1"]
+        + ["--stage", "syllabifier"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    report = json.loads(proc.stdout)
+    assert [result["name"] for result in report["results"]] == ["syllabifier.syllabify_many"]
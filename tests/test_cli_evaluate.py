@@ -128,3 +128,49 @@ def test_coverage_command_empty_wordlist_exits_nonzero(
 
     assert result.exit_code != 0
     assert "Wordlist is empty" in result.output
+
+
+def test_evaluate_parallel_jobs_match_serial(
+    sample_gold_set_file: Path,
+    cli_runner: CliRunner,
+) -> None:
+    args = ["evaluate", str(sample_gold_set_file), "--format", "json", "--verbose"]
+    serial = cli_runner.invoke(cli, args)
+    parallel = cli_runner.invoke(cli, [*args, "--jobs", "2"])
+
+    assert serial.exit_code == 0
+    assert parallel.exit_code == 0
+    assert json.loads(parallel.output) == json.loads(serial.output)
+
+
+def test_coverage_parallel_jobs_preserve_order(tmp_path: Path, cli_runner: CliRunner) -> None:
+    wordlist_file = tmp_path / "wordlist.txt"
+    words = ["cjase", "aghe", "123", "gjat", "xyz@", "fradi"] * 5
+    wordlist_file.write_text("\n".join(words) + "\n", encoding="utf-8")
+    serial_output = tmp_path / "serial.json"
+    parallel_output = tmp_path / "parallel.json"
+
+    serial = cli_runner.invoke(
+        cli,
+        ["coverage", str(wordlist_file), "--format", "json", "-o", str(serial_output)],
+    )
+    parallel = cli_runner.invoke(
+        cli,
+        [
+            "coverage",
+            str(wordlist_file),
+            "--format",
+            "json",
+            "-o",
+            str(parallel_output),
+            "--jobs",
+            "3",
+        ],
+    )
+
+    assert serial.exit_code == 0
+    assert parallel.exit_code == 0
+    assert parallel.output == serial.output
+    details = json.loads(parallel_output.read_text(encoding="utf-8"))["details"]
+    assert [item["word"] for item in details] == words
+    assert details == json.loads(serial_output.read_text(encoding="utf-8"))["details"]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import pstats
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from furlan_g2p.cli.app import cli
+from furlan_g2p.cli.profiling import _stage_for_path, run_profile
+from furlan_g2p.services.pipeline import PipelineService
+
+
+def test_stage_for_path() -> None:
+    assert _stage_for_path("/x/src/furlan_g2p/g2p/rules.py") == "g2p"
+    assert _stage_for_path("/x/furlan_g2p/phonology/stress.py") == "phonology"
+    assert _stage_for_path("/x/furlan_g2p/services/pipeline.py") == "other"
+    assert _stage_for_path("/usr/lib/python3.11/re/__init__.py") == "external"
+    assert _stage_for_path("~") == "external"
+
+
+def test_run_profile_aggregates_stages() -> None:
+    report, _stats = run_profile(PipelineService(), ["Cjase 12.", "Il gjat al è biel."] * 5)
+    assert report.texts == 10
+    assert report.phonemes > 0
+    assert {"normalization", "tokenization", "g2p", "phonology"} <= set(report.stage_seconds)
+    assert report.peak_memory is None
+
+
+def test_profile_command_writes_pstats_and_report(tmp_path: Path) -> None:
+    metadata = tmp_path / "metadata.csv"
+    metadata.write_text("u1|Cjase 12.|x\nu2|Il gjat al è biel.|x\n", encoding="utf-8")
+    pstats_path = tmp_path / "run.pstats"
+    report_path = tmp_path / "report.txt"
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "profile",
+            str(metadata),
+            "--pstats",
+            str(pstats_path),
+            "--report",
+            str(report_path),
+            "--memory",
+            "--top",
+            "5",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Texts: 2" in result.output
+    assert "Time by stage" in result.output
+    assert "Peak traced memory" in result.output
+    assert pstats.Stats(str(pstats_path)).total_calls > 0  # type: ignore[attr-defined]
+    assert "Top functions:" in report_path.read_text(encoding="utf-8")
+
+
+def test_profile_command_rejects_empty_input(tmp_path: Path) -> None:
+    empty = tmp_path / "empty.txt"
+    empty.write_text("\n", encoding="utf-8")
+    result = CliRunner().invoke(cli, ["profile", str(empty), "--pstats", str(tmp_path / "p")])
+    assert result.exit_code != 0
+    assert "no texts" in result.output
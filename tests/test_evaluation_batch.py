@@ -0,0 +1,84 @@
+"""Tests for the batch evaluation engine."""
+
+from __future__ import annotations
+
+import importlib.util
+import random
+
+import pytest
+
+from furlan_g2p.evaluation import BatchEvaluator, Evaluator
+
+NUMPY_MODES = [
+    False,
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(
+            importlib.util.find_spec("numpy") is None, reason="NumPy not installed"
+        ),
+    ),
+]
+
+
+def _random_pairs(count: int, seed: int) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    rng = random.Random(seed)
+    symbols = ["a", "e", "i", "k", "c", "z", "t͡ʃ", "ɡ", "g", "ˈ", "ː", "ã", " ", "."]
+    predictions: list[tuple[str, str]] = []
+    gold: list[tuple[str, str]] = []
+    for index in range(count):
+        ref = "".join(rng.choice(symbols) for _ in range(rng.randint(0, 9)))
+        if rng.random() < 0.3:
+            pred = ref
+        else:
+            pred = "".join(rng.choice(symbols) for _ in range(rng.randint(0, 9)))
+        predictions.append((f"w{index}", pred))
+        gold.append((f"w{index}", ref))
+    return predictions, gold
+
+
+@pytest.mark.parametrize("use_numpy", NUMPY_MODES)
+def test_batch_evaluate_matches_reference(use_numpy: bool) -> None:
+    predictions, gold = _random_pairs(400, seed=7)
+    expected = Evaluator().evaluate(predictions, gold)
+    result = BatchEvaluator(use_numpy=use_numpy).evaluate(predictions, gold)
+
+    assert result.word_count == expected.word_count
+    assert result.correct_count == expected.correct_count
+    assert result.wer == pytest.approx(expected.wer)
+    assert result.per == pytest.approx(expected.per)
+    assert result.stress_accuracy == pytest.approx(expected.stress_accuracy)
+    assert result.details == expected.details
+
+
+@pytest.mark.parametrize("use_numpy", NUMPY_MODES)
+def test_batch_single_metrics_match_reference(use_numpy: bool) -> None:
+    predictions, gold = _random_pairs(200, seed=11)
+    pred = [ipa for _word, ipa in predictions]
+    ref = [ipa for _word, ipa in gold]
+    engine = BatchEvaluator(use_numpy=use_numpy)
+    evaluator = Evaluator()
+
+    assert engine.word_error_rate(pred, ref) == pytest.approx(evaluator.word_error_rate(pred, ref))
+    assert engine.phoneme_error_rate(pred, ref) == pytest.approx(
+        evaluator.phoneme_error_rate(pred, ref)
+    )
+    assert engine.stress_accuracy(pred, ref) == pytest.approx(evaluator.stress_accuracy(pred, ref))
+
+
+def test_batch_evaluator_edge_cases() -> None:
+    engine = BatchEvaluator()
+    assert engine.evaluate([], []).word_count == 0
+    assert engine.phoneme_error_rate([""], [""]) == 0.0
+    with pytest.raises(ValueError, match="Length mismatch"):
+        engine.evaluate([("a", "a")], [])
+    with pytest.raises(ValueError, match="Length mismatch"):
+        engine.stress_accuracy(["a"], [])
+
+
+def test_batch_evaluate_with_alignment() -> None:
+    result = BatchEvaluator().evaluate(
+        [("cjase", "ˈcaze")], [("cjase", "ˈkaze")], with_alignment=True
+    )
+    alignment = result.details[0].alignment
+    assert alignment is not None
+    assert ("substitute", "c", "k") in alignment
@@ -0,0 +1,77 @@
+"""Tests for bit-parallel edit distance and phoneme alignment."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+from hypothesis import given as _given  # type: ignore[import-not-found,unused-ignore]
+from hypothesis import strategies as st  # type: ignore[import-not-found,unused-ignore]
+
+from furlan_g2p.evaluation.metrics import (
+    Evaluator,
+    _levenshtein_alignment,
+    _levenshtein_distance,
+    _myers_distance,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def given(*args: Any, **kwargs: Any) -> Callable[[F], F]:
+    return cast(Callable[[F], F], _given(*args, **kwargs))
+
+
+TOKENS = st.lists(st.sampled_from(["a", "e", "k", "tʃ", "ˈ", "z"]), max_size=20)
+
+
+def _full_table_distance(seq1: list[str], seq2: list[str]) -> int:
+    dp = [
+        [i + j if i == 0 or j == 0 else 0 for j in range(len(seq2) + 1)]
+        for i in range(len(seq1) + 1)
+    ]
+    for i in range(1, len(seq1) + 1):
+        for j in range(1, len(seq2) + 1):
+            cost = 0 if seq1[i - 1] == seq2[j - 1] else 1
+            dp[i][j] = min(dp[i - 1][j] + 1, dp[i][j - 1] + 1, dp[i - 1][j - 1] + cost)
+    return dp[-1][-1]
+
+
+@given(TOKENS, TOKENS)
+def test_levenshtein_distance_matches_full_table(seq1: list[str], seq2: list[str]) -> None:
+    expected = _full_table_distance(seq1, seq2)
+    assert _levenshtein_distance(seq1, seq2) == expected
+    if seq1:
+        assert _myers_distance(seq1, seq2) == expected
+
+
+@given(TOKENS, TOKENS)
+def test_alignment_cost_equals_distance(seq1: list[str], seq2: list[str]) -> None:
+    steps = _levenshtein_alignment(seq1, seq2)
+    assert sum(1 for op, _pred, _gold in steps if op != "match") == _levenshtein_distance(
+        seq1, seq2
+    )
+    assert [pred for _op, pred, _gold in steps if pred is not None] == seq1
+    assert [gold for _op, _pred, gold in steps if gold is not None] == seq2
+
+
+def test_levenshtein_distance_long_sequences() -> None:
+    seq1 = list(range(1500))
+    seq2 = [*range(10, 1500), 1, 2, 3]
+    assert _levenshtein_distance(seq1, seq2) == 13
+
+
+def test_levenshtein_distance_accepts_integer_codes() -> None:
+    assert _levenshtein_distance([1, 2, 3], [1, 3]) == 1
+
+
+def test_evaluate_with_alignment_attaches_steps() -> None:
+    result = Evaluator().evaluate([("cjase", "ˈcaze")], [("cjase", "ˈkaze")], with_alignment=True)
+    assert result.details[0].alignment == [
+        ("match", "ˈ", "ˈ"),
+        ("substitute", "c", "k"),
+        ("match", "a", "a"),
+        ("match", "z", "z"),
+        ("match", "e", "e"),
+    ]
+    assert Evaluator().evaluate([("a", "a")], [("a", "a")]).details[0].alignment is None
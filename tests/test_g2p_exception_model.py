@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from furlan_g2p.g2p.phonemizer import G2PPhonemizer
+from furlan_g2p.g2p.rules import PhonemeRules
+from furlan_g2p.lexicon import DialectAwareLexicon, LexiconEntry
+from furlan_g2p.ml.interfaces import ExceptionPrediction, IExceptionModel
+from furlan_g2p.ml.null_model import NullExceptionModel
+from furlan_g2p.services import PipelineMetrics, PipelineService
+
+
+class _TableModel(IExceptionModel):
+    """Predicts from a fixed ``word -> (ipa, confidence)`` table and records calls."""
+
+    def __init__(self, table: dict[str, tuple[str, float]]) -> None:
+        self.table = table
+        self.calls: list[list[str]] = []
+
+    def predict(self, word: str, dialect: str | None = None) -> ExceptionPrediction | None:
+        return self.predict_batch([word], dialect)[0]
+
+    def predict_batch(
+        self, words: list[str], dialect: str | None = None
+    ) -> list[ExceptionPrediction | None]:
+        self.calls.append(list(words))
+        results: list[ExceptionPrediction | None] = []
+        for word in words:
+            hit = self.table.get(word)
+            results.append(None if hit is None else ExceptionPrediction(hit[0], hit[1], "table"))
+        return results
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_model_info(self) -> dict[str, str | bool | int]:
+        return {"name": "table", "available": True}
+
+
+def _lexicon() -> DialectAwareLexicon:
+    return DialectAwareLexicon([LexiconEntry(lemma="cjase", ipa="ˈcaze")])
+
+
+def test_misses_are_predicted_in_one_batch_with_threshold_fallback() -> None:
+    model = _TableModel({"sûr": ("ˈsuːr", 0.9), "bêç": ("ˈbɛtʃ", 0.2)})
+    phonemizer = G2PPhonemizer(lexicon=_lexicon(), exception_model=model, model_threshold=0.5)
+
+    result = phonemizer.to_phonemes_batch([["cjase", "sûr"], ["bêç", "sûr", "cjase"]])
+
+    assert model.calls == [["sûr", "bêç"]]
+    rules = PhonemeRules()
+    assert result == [
+        ["c", "a", "z", "e", "s", "u", "ː", "r"],
+        [*rules.apply("bêç"), "s", "u", "ː", "r", "c", "a", "z", "e"],
+    ]
+
+
+def test_model_batches_are_capped() -> None:
+    model = _TableModel({})
+    words = ["pan", "pes", "pit", "pus", "pos"]
+    phonemizer = G2PPhonemizer(lexicon=_lexicon(), exception_model=model, model_batch_size=2)
+
+    phonemizer.to_phonemes(["cjase", *words, *words])
+
+    assert model.calls == [words[:2], words[2:4], words[4:]]
+    with pytest.raises(ValueError, match="model_batch_size"):
+        G2PPhonemizer(model_batch_size=0)
+
+
+def test_null_model_matches_plain_phonemizer() -> None:
+    tokens = ["cjase", "sûr", "bêç"]
+    plain = G2PPhonemizer(lexicon=_lexicon())
+    with_model = G2PPhonemizer(lexicon=_lexicon(), exception_model=NullExceptionModel())
+
+    assert with_model.to_phonemes(tokens) == plain.to_phonemes(tokens)
+    assert with_model.to_phonemes_batch([tokens, tokens[:1]]) == [
+        plain.to_phonemes(tokens),
+        plain.to_phonemes(tokens[:1]),
+    ]
+
+
+def test_pipeline_batch_reports_stage_counts() -> None:
+    model = _TableModel({"sûr": ("ˈsuːr", 0.9), "bêç": ("ˈbɛtʃ", 0.2)})
+    metrics = PipelineMetrics()
+    service = PipelineService(
+        phonemizer=G2PPhonemizer(lexicon=_lexicon(), exception_model=model), metrics=metrics
+    )
+
+    results = service.process_batch(["Cjase sûr", "bêç sûr"])
+
+    assert results == [service.process_text("Cjase sûr"), service.process_text("bêç sûr")]
+    assert model.calls[0] == ["sûr", "bêç"]
+    metrics.reset()
+    service.process_batch(["Cjase sûr", "bêç sûr"])
+    stats = metrics.stats()
+    assert stats["counters"] == {
+        "texts": 2,
+        "tokens": 4,
+        "lexicon_hits": 1,
+        "rule_fallbacks": 1,
+        "rule_errors": 0,
+        "model_batches": 1,
+        "model_words": 2,
+        "model_hits": 2,
+    }
+    stages = stats["stages"]
+    assert isinstance(stages, dict)
+    assert stages["model"]["count"] == 2
+
+
+def test_process_csv_sends_misses_of_many_rows_together(tmp_path: Path) -> None:
+    model = _TableModel({"sûr": ("ˈsuːr", 0.9)})
+    service = PipelineService(phonemizer=G2PPhonemizer(lexicon=_lexicon(), exception_model=model))
+    metadata = tmp_path / "metadata.csv"
+    rows = ["u1|Cjase sûr", "u2|bêç||western", "u3|sûr pan", "short", "u4|pan sûr||western"]
+    metadata.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    out = tmp_path / "out.csv"
+
+    service.process_csv(str(metadata), str(out), dialect_column=3)
+
+    assert model.calls == [["sûr", "pan"], ["bêç", "pan", "sûr"]]
+    expected = [
+        ("u1", "Cjase sûr", None),
+        ("u2", "bêç", "western"),
+        ("u3", "sûr pan", None),
+        ("u4", "pan sûr", "western"),
+    ]
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines == [
+        "|".join([row_id, *_joined(service.process_text(text, dialect=dialect))])
+        for row_id, text, dialect in expected
+    ]
+
+
+def _joined(result: tuple[str, list[str]]) -> list[str]:
+    norm, phonemes = result
+    return [norm, " ".join(phonemes)]
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from furlan_g2p.cli.app import cli
+from furlan_g2p.g2p import G2PPhonemizer, PhonemeRules, WordCache
+from furlan_g2p.lexicon import DialectAwareLexicon, LexiconConfig, LexiconEntry
+from furlan_g2p.ml.null_model import NullExceptionModel
+from furlan_g2p.services import PipelineMetrics
+
+
+class _CountingRules(PhonemeRules):
+    def __init__(self) -> None:
+        super().__init__()
+        self.words: list[str] = []
+
+    def apply(self, word: str, dialect: str | None = None) -> list[str]:
+        self.words.append(word)
+        return super().apply(word, dialect=dialect)
+
+
+def _entries() -> list[LexiconEntry]:
+    return [
+        LexiconEntry(lemma="cjase", ipa="ˈcaze"),
+        LexiconEntry(lemma="aghe", ipa="ˈaɡe", dialect="western"),
+    ]
+
+
+def test_second_run_is_answered_from_the_cache(tmp_path: Path) -> None:
+    tokens = ["cjase", "sûr", "aghe", "sûr"]
+    path = tmp_path / "words.sqlite"
+    first_rules = _CountingRules()
+    first = G2PPhonemizer(
+        lexicon=DialectAwareLexicon(_entries()), rules=first_rules, word_cache=WordCache(path)
+    )
+    expected = G2PPhonemizer(lexicon=DialectAwareLexicon(_entries())).to_phonemes(tokens)
+
+    assert first.to_phonemes(tokens) == expected
+    assert first_rules.words == ["sûr"]
+
+    rules = _CountingRules()
+    metrics = PipelineMetrics()
+    second = G2PPhonemizer(
+        lexicon=DialectAwareLexicon(_entries()),
+        rules=rules,
+        metrics=metrics,
+        word_cache=WordCache(path),
+    )
+    assert second.to_phonemes(tokens) == expected
+    assert rules.words == []
+    counters = metrics.stats()["counters"]
+    assert isinstance(counters, dict)
+    assert (counters["cache_tokens"], counters["cache_hits"]) == (4, 4)
+    assert second.word_cache is not None
+    assert second.word_cache.stats()["entries"] == 3
+
+
+def test_lexicon_and_dialect_changes_miss(tmp_path: Path) -> None:
+    path = tmp_path / "words.sqlite"
+    G2PPhonemizer(lexicon=DialectAwareLexicon(_entries()), word_cache=WordCache(path)).to_phonemes(
+        ["sûr"]
+    )
+
+    rules = _CountingRules()
+    changed = DialectAwareLexicon([*_entries(), LexiconEntry(lemma="bêç", ipa="ˈbɛtʃ")])
+    phonemizer = G2PPhonemizer(lexicon=changed, rules=rules, word_cache=WordCache(path))
+    phonemizer.to_phonemes(["sûr"])
+    phonemizer.to_phonemes(["sûr"])
+    phonemizer.to_phonemes(["sûr"], dialect="western")
+
+    assert rules.words == ["sûr", "sûr"]
+    assert WordCache(path).stats()["contexts"] == 2
+
+
+def test_content_hash_ignores_order_and_storage() -> None:
+    entries = _entries()
+    compact = DialectAwareLexicon(entries[::-1], config=LexiconConfig(storage="compact"))
+    plain = DialectAwareLexicon(entries)
+
+    assert plain.content_hash() == compact.content_hash()
+    assert plain.content_hash() != DialectAwareLexicon(entries[:1]).content_hash()
+    assert (
+        plain.content_hash()
+        != DialectAwareLexicon(entries, config=LexiconConfig(case_sensitive=True)).content_hash()
+    )
+
+
+def test_rule_output_standing_in_for_an_unavailable_model_is_not_stored(tmp_path: Path) -> None:
+    cache = WordCache(tmp_path / "words.sqlite")
+    phonemizer = G2PPhonemizer(
+        lexicon=DialectAwareLexicon(_entries()),
+        exception_model=NullExceptionModel(),
+        word_cache=cache,
+    )
+
+    phonemizer.to_phonemes(["cjase", "sûr"])
+
+    assert cache.get_many(["cjase", "sûr"], None, phonemizer.cache_context()) == {
+        "cjase": ["c", "a", "z", "e"]
+    }
+
+
+def test_size_limit_evicts_least_recently_used(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Refresh recency on every read instead of at most once a minute.
+    monkeypatch.setattr("furlan_g2p.g2p.word_cache._TOUCH_INTERVAL_NS", 0)
+    cache = WordCache(tmp_path / "words.sqlite", max_entries=10)
+    for index in range(10):
+        cache.put_many([(f"w{index}", ["w"])], None, "ctx")
+    cache.get_many(["w0"], None, "ctx")
+    cache.put_many([("new", ["n"])], None, "ctx")
+
+    assert cache.stats()["entries"] == 9
+    assert sorted(cache.get_many(["w0", "new", "w1"], None, "ctx")) == ["new", "w0"]
+
+
+def test_recent_reads_do_not_rewrite_recency(tmp_path: Path) -> None:
+    path = tmp_path / "words.sqlite"
+    cache = WordCache(path)
+    cache.put_many([("cjase", ["c", "a", "z", "e"])], None, "ctx")
+    with sqlite3.connect(path) as connection:
+        (written,) = connection.execute("SELECT last_used FROM words").fetchone()
+
+    assert cache.get_many(["cjase"], None, "ctx") == {"cjase": ["c", "a", "z", "e"]}
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT last_used FROM words").fetchone() == (written,)
+
+
+def test_cache_read_error_propagates_with_metrics(tmp_path: Path) -> None:
+    class _BrokenCache(WordCache):
+        def get_many(
+            self, words: Iterable[str], dialect: str | None, context: str
+        ) -> dict[str, list[str]]:
+            raise sqlite3.OperationalError("database is locked")
+
+    phonemizer = G2PPhonemizer(
+        lexicon=DialectAwareLexicon(_entries()),
+        metrics=PipelineMetrics(),
+        word_cache=_BrokenCache(tmp_path / "words.sqlite"),
+    )
+    with pytest.raises(sqlite3.OperationalError, match="locked"):
+        phonemizer.to_phonemes(["cjase"])
+
+
+def test_cache_cli_warm_stats_clear(tmp_path: Path) -> None:
+    metadata = tmp_path / "metadata.csv"
+    metadata.write_text("u1|Cjase sûr\nu2|sûr bêç\n", encoding="utf-8")
+    cache_dir = str(tmp_path / "cache")
+    runner = CliRunner()
+
+    warmed = runner.invoke(
+        cli, ["cache", "warm", str(metadata), "--column", "1", "--cache-dir", cache_dir]
+    )
+    assert warmed.exit_code == 0, warmed.output
+    assert "3 words (0 already cached, 0 skipped)" in warmed.output
+
+    again = runner.invoke(
+        cli, ["cache", "warm", str(metadata), "--column", "1", "--cache-dir", cache_dir]
+    )
+    assert "3 words (3 already cached, 0 skipped)" in again.output
+
+    stats = runner.invoke(cli, ["cache", "stats", "--cache-dir", cache_dir, "--json"])
+    assert json.loads(stats.output)["entries"] == 3
+
+    result = runner.invoke(cli, ["g2p", "--word-cache", "--cache-dir", cache_dir, "Cjase"])
+    assert result.exit_code == 0, result.output
+    assert result.output.strip() == "ˈc a z e"
+
+    cleared = runner.invoke(cli, ["cache", "clear", "--cache-dir", cache_dir])
+    assert "Removed 3 cached words" in cleared.output
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from furlan_g2p.lexicon import (
+    BloomFilter,
+    DialectAwareLexicon,
+    DictLexiconStore,
+    LexiconConfig,
+    LexiconEntry,
+    write_sqlite,
+)
+
+
+class _CountingStore(DictLexiconStore):
+    def __init__(self, entries: list[LexiconEntry]) -> None:
+        super().__init__(entries)
+        self.probes = 0
+
+    def candidates(self, lemma: str) -> list[LexiconEntry]:
+        self.probes += 1
+        return super().candidates(lemma)
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_error() -> None:
+    keys = [f"lemma{i}" for i in range(5000)]
+    bloom = BloomFilter.from_keys(keys, error_rate=0.01)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"other{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.03
+    assert 1 not in bloom
+
+
+def test_bloom_filter_round_trips_bytes() -> None:
+    bloom = BloomFilter.from_keys(["cjase", "aghe", "sôl"])
+    restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+    assert restored.to_bytes() == bloom.to_bytes()
+    assert len(restored) == 3
+    assert "sôl" in restored
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(b"FGBF")
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(bloom.to_bytes()[:-8])
+
+
+def test_lexicon_filter_skips_store_for_misses() -> None:
+    entries = [
+        LexiconEntry(lemma="cjase", ipa="ˈcaze"),
+        LexiconEntry(lemma="cjase", ipa="ˈcaːze", dialect="western"),
+    ]
+    store = _CountingStore(entries)
+    lexicon = DialectAwareLexicon.from_store(store, LexiconConfig(bloom_filter=True))
+    assert lexicon.lemma_filter is not None
+
+    misses = [f"zz{i}" for i in range(200)]
+    assert lexicon.lookup_many(misses) == [None] * 200
+    assert all(lexicon.lookup(word) is None for word in misses)
+    assert store.probes < 20
+    assert lexicon.lookup_ipa("Cjase", dialect="western") == "ˈcaːze"
+    assert lexicon.lookup_ipa_many(["cjase"]) == ["ˈcaze"]
+
+
+def test_in_memory_filter_is_opt_in() -> None:
+    entries = [LexiconEntry(lemma="cjase", ipa="ˈcaze")]
+
+    assert DialectAwareLexicon(entries).lemma_filter is None
+    assert DialectAwareLexicon(entries, LexiconConfig(bloom_filter=True)).lemma_filter
+
+
+def test_sqlite_lexicon_ships_filter(tmp_path: Path) -> None:
+    path = tmp_path / "lexicon.sqlite"
+    write_sqlite([LexiconEntry(lemma="cjase", ipa="ˈcaze")], path)
+
+    lexicon = DialectAwareLexicon.from_path(path)
+    assert lexicon.lemma_filter is not None
+    assert "cjase" in lexicon.lemma_filter
+    assert lexicon.lookup("mai") is None
+    disabled = DialectAwareLexicon.from_path(path, LexiconConfig(bloom_filter=False))
+    assert disabled.lemma_filter is None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from furlan_g2p.cli.app import cli
+from furlan_g2p.g2p.phonemizer import G2PPhonemizer
+from furlan_g2p.lexicon import DialectAwareLexicon, FallbackTracker, LexiconEntry
+from furlan_g2p.services.pipeline import PipelineService
+
+
+def _lexicon() -> DialectAwareLexicon:
+    return DialectAwareLexicon(
+        [
+            LexiconEntry(lemma="cjase", ipa="ˈcaze", source="seed"),
+            LexiconEntry(lemma="aghe", ipa="ˈaɡe", source="manual"),
+            LexiconEntry(lemma="aghe", ipa="ˈaːɡe", dialect="western", source="manual"),
+        ]
+    )
+
+
+def test_tracker_counts_and_summary() -> None:
+    tracker = FallbackTracker(logging.getLogger("test.fallback"), log_interval=None)
+    tracker.record("cjase", "western", "seed")
+    tracker.record("cjase", "western", "seed")
+    before = tracker.counts()
+    tracker.record("aghe", "carnic", "manual")
+
+    assert tracker.total == 3
+    assert tracker.report() == {
+        "total": 3,
+        "by_dialect": {"carnic": 1, "western": 2},
+        "by_source": {"manual": 1, "seed": 2},
+    }
+    assert tracker.summary(since=before) == "Universal fallbacks: 1 (carnic: 1; sources: manual=1)"
+    tracker.merge({("central", "seed"): 4})
+    assert tracker.total == 7
+    tracker.reset()
+    assert tracker.summary() == "Universal fallbacks: 0"
+
+
+def test_tracker_rate_limits_sample_logs(caplog: pytest.LogCaptureFixture) -> None:
+    tracker = FallbackTracker(logging.getLogger("test.fallback"), log_interval=3600.0)
+    with caplog.at_level(logging.INFO, logger="test.fallback"):
+        for _ in range(500):
+            tracker.record("cjase", "western", "seed")
+    assert tracker.total == 500
+    assert len(caplog.records) == 1
+
+
+def test_lookup_counts_fallbacks_without_per_token_logs(caplog: pytest.LogCaptureFixture) -> None:
+    lexicon = _lexicon()
+    with caplog.at_level(logging.INFO, logger="furlan_g2p.lexicon.lookup"):
+        for _ in range(50):
+            assert lexicon.lookup_ipa("cjase", dialect="west") == "ˈcaze"
+            entry = lexicon.lookup("aghe", dialect="western")
+            assert entry is not None and entry.dialect == "western"
+    assert lexicon.fallbacks.counts() == {("western", "seed"): 50}
+    assert len(caplog.records) <= 1
+
+
+def test_phonemizer_and_process_csv_report_summary(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    phonemizer = G2PPhonemizer(lexicon=_lexicon())
+    phonemizer.to_phonemes(["cjase", "aghe", "gjat"], dialect="western")
+    assert phonemizer.fallbacks.report()["by_source"] == {"seed": 1}
+
+    inp = tmp_path / "meta.csv"
+    inp.write_text("u1|Cjase aghe\nu2|cjase\n", encoding="utf-8")
+    service = PipelineService(phonemizer=phonemizer)
+    with caplog.at_level(logging.INFO, logger="furlan_g2p.lexicon.lookup"):
+        service.process_csv(str(inp), str(tmp_path / "out.csv"), dialect="carnic")
+    assert "Universal fallbacks: 3 (carnic: 3; sources: manual=1, seed=2)" in caplog.text
+
+
+def test_evaluate_reports_fallbacks(tmp_path: Path) -> None:
+    lexicon = tmp_path / "lexicon.tsv"
+    lexicon.write_text("lemma\tipa\ncjase\tˈcaze\naghe\tˈaɡe\n", encoding="utf-8")
+    gold = tmp_path / "gold.tsv"
+    gold.write_text("cjase\tˈcaze\tcentral\naghe\tˈaɡe\twestern\n", encoding="utf-8")
+
+    result = CliRunner().invoke(
+        cli, ["evaluate", str(gold), "--lexicon", str(lexicon), "--format", "json"]
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.output)
+    assert payload["universal_fallbacks"]["total"] == 2
+    assert payload["universal_fallbacks"]["by_dialect"] == {"central": 1, "western": 1}
+
+
+def test_phonemizer_fallback_is_counted_once() -> None:
+    lexicon = _lexicon()
+    phonemizer = G2PPhonemizer(lexicon=lexicon)
+    phonemizer.to_phonemes(["cjase", "aghe"], dialect="carnic")
+
+    assert phonemizer.fallbacks is lexicon.fallbacks
+    assert lexicon.fallbacks.total == 2
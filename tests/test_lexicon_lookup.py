@@ -115,3 +115,33 @@ def test_from_path_supports_jsonl_and_legacy_tsv(tmp_path: Path) -> None:
     tsv_lex = DialectAwareLexicon.from_path(legacy_tsv)
     assert tsv_lex.lookup_ipa("aghe") == "ˈage"
     assert tsv_lex.get_alternatives("aghe") == ["ˈaʒe"]
+
+
+def test_lookup_many_matches_single_lookups() -> None:
+    entries = [
+        LexiconEntry(lemma="cjase", ipa="ˈcaze", source="seed"),
+        LexiconEntry(lemma="cjase", ipa="ˈca:ze", dialect="western", source="manual"),
+        LexiconEntry(lemma="aghe", ipa="ˈage", source="seed"),
+    ]
+    words = ["Cjase", "aghe", "", "mai", "aghe", " cjase "]
+    single = DialectAwareLexicon(entries)
+    bulk = DialectAwareLexicon(entries)
+
+    for dialect in (None, "west", "carnic"):
+        expected = [single.lookup(word, dialect=dialect) for word in words]
+        assert bulk.lookup_many(words, dialect=dialect) == expected
+        assert bulk.lookup_ipa_many(words, dialect=dialect) == [
+            entry.ipa if entry else None for entry in expected
+        ]
+
+    # Fallbacks are counted per occurrence (both bulk calls ran per dialect).
+    assert bulk.fallbacks.counts() == {("western", "seed"): 4, ("carnic", "seed"): 8}
+
+
+def test_lookup_cache_is_per_instance() -> None:
+    first = DialectAwareLexicon([LexiconEntry(lemma="cjase", ipa="ˈcaze")])
+    second = DialectAwareLexicon([LexiconEntry(lemma="cjase", ipa="ˈcaze")])
+
+    first.lookup("cjase")
+    assert first._lookup_cached.cache_info().currsize == 1
+    assert second._lookup_cached.cache_info().currsize == 0
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+from furlan_g2p.g2p.phonemizer import G2PPhonemizer
+from furlan_g2p.lexicon import DialectAwareLexicon, LexiconConfig, ReloadableLexicon
+
+
+def _write(path: Path, rows: list[tuple[str, str]], bump_ns: int = 0) -> None:
+    lines = ["lemma\tipa\tdialect\tsource\tconfidence\tfrequency\talternatives"]
+    lines.extend(f"{lemma}\t{ipa}\t\tmanual\t1.0\t\t" for lemma, ipa in rows)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    if bump_ns:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump_ns))
+
+
+def test_check_swaps_in_edited_lexicon(tmp_path: Path) -> None:
+    path = tmp_path / "lexicon.tsv"
+    _write(path, [("cjase", "ˈcaze")])
+    swapped: list[DialectAwareLexicon] = []
+    lexicon = ReloadableLexicon(path, on_reload=[swapped.append])
+    assert lexicon.lookup_ipa("cjase") == "ˈcaze"
+    assert not lexicon.check()
+
+    _write(path, [("cjase", "ˈkaze"), ("aghe", "ˈage")], bump_ns=1_000_000)
+    assert lexicon.check()
+
+    assert lexicon.lookup_ipa("cjase") == "ˈkaze"
+    assert lexicon.lookup_ipa_many(["aghe", "mai"]) == ["ˈage", None]
+    assert swapped == [lexicon.current]
+    assert lexicon.stats()["generation"] == 1
+
+
+def test_broken_file_keeps_current_lexicon(tmp_path: Path) -> None:
+    path = tmp_path / "lexicon.jsonl"
+    path.write_text('{"lemma": "cjase", "ipa": "ˈcaze"}\n', encoding="utf-8")
+    lexicon = ReloadableLexicon(path)
+
+    path.write_text('{"lemma": "cjase", "ipa": \n', encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+
+    assert not lexicon.check()
+    assert lexicon.lookup_ipa("cjase") == "ˈcaze"
+    assert not lexicon.check()  # not retried until the file changes again
+
+
+def test_background_reload_never_exposes_partial_lexicon(tmp_path: Path) -> None:
+    path = tmp_path / "lexicon.tsv"
+    rows = [(f"peraule{i}", "ˈpaːre") for i in range(300)]
+    _write(path, rows)
+    lexicon = ReloadableLexicon(
+        path, config=LexiconConfig(default_dialect="central"), poll_interval=0.01
+    ).start()
+    phonemizer = G2PPhonemizer(lexicon=lexicon)
+    failures: list[object] = []
+    done = threading.Event()
+
+    def read() -> None:
+        while not done.is_set():
+            if None in lexicon.lookup_ipa_many([lemma for lemma, _ in rows[::25]]):
+                failures.append("missing")
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        _write(path, [*rows, ("gnûf", "ˈɲuf")], bump_ns=1_000_000)
+        deadline = time.monotonic() + 5.0
+        while lexicon.generation == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        done.set()
+        reader.join()
+        lexicon.stop()
+
+    assert lexicon.generation == 1
+    assert failures == []
+    assert phonemizer.to_phonemes(["gnûf"]) == ["ɲ", "u", "f"]
+
+
+def test_failing_listener_does_not_stop_polling(tmp_path: Path) -> None:
+    path = tmp_path / "lexicon.tsv"
+    _write(path, [("cjase", "ˈcaze")])
+    swapped: list[DialectAwareLexicon] = []
+
+    def broken(_: DialectAwareLexicon) -> None:
+        raise RuntimeError("listener failed")
+
+    lexicon = ReloadableLexicon(path, on_reload=[broken, swapped.append], poll_interval=0.01)
+    lexicon.start()
+    try:
+        for count, bump in ((2, 1_000_000), (3, 2_000_000)):
+            _write(path, [(f"peraule{i}", "ˈpaːre") for i in range(count)], bump_ns=bump)
+            deadline = time.monotonic() + 5.0
+            while len(lexicon) != count and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert lexicon._thread is not None and lexicon._thread.is_alive()
+    finally:
+        lexicon.stop()
+
+    assert lexicon.generation == 2
+    assert len(lexicon) == 3
+    assert len(swapped) == 2
+    assert swapped[-1] is lexicon.current
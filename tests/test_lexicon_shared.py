@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import multiprocessing
+import subprocess
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+from furlan_g2p.lexicon import (
+    DialectAwareLexicon,
+    LexiconConfig,
+    LexiconEntry,
+    SharedLexiconStore,
+)
+
+
+def _lexicon() -> DialectAwareLexicon:
+    return DialectAwareLexicon(
+        [
+            LexiconEntry(lemma="Cjase", ipa="ˈcaze", alternatives=["ˈcjaze", "ˈkaze"]),
+            LexiconEntry(lemma="cjase", ipa="ˈcaːze", dialect="western", confidence=0.9),
+            LexiconEntry(lemma="aghe", ipa="ˈage", dialect="carnic", frequency=3),
+            LexiconEntry(lemma="çuç", ipa="ˈtʃutʃ", source="manual"),
+        ],
+        config=LexiconConfig(snapshot=False),
+    )
+
+
+@pytest.fixture
+def published() -> Iterator[tuple[DialectAwareLexicon, SharedLexiconStore]]:
+    lexicon = _lexicon()
+    store = lexicon.publish_shared()
+    yield lexicon, store
+    store.unlink()
+
+
+def test_attached_lexicon_matches_source(
+    published: tuple[DialectAwareLexicon, SharedLexiconStore],
+) -> None:
+    lexicon, store = published
+    shared = DialectAwareLexicon.from_shared(store.name)
+
+    assert len(shared) == len(lexicon) == 4
+    assert shared.store.lemma_count() == 3
+    assert sorted(shared.store.iter_lemmas()) == sorted(lexicon.store.iter_lemmas())
+    assert sorted(shared.iter_entries(), key=repr) == sorted(lexicon.iter_entries(), key=repr)
+    assert shared.content_hash() == lexicon.content_hash()
+    for word in ("Cjase", "aghe", "çuç", "missing"):
+        for dialect in (None, "western", "carnic"):
+            assert shared.lookup(word, dialect) == lexicon.lookup(word, dialect)
+    assert shared.get_alternatives("cjase") == ["ˈcjaze", "ˈkaze"]
+    shared.store.close()  # type: ignore[attr-defined]
+
+
+def test_spawned_worker_attaches_by_pickle(
+    published: tuple[DialectAwareLexicon, SharedLexiconStore],
+) -> None:
+    _, store = published
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        found = pool.apply(SharedLexiconStore.candidates, (store, "aghe"))
+    assert found == store.candidates("aghe")
+
+
+def test_segment_outlives_reader_process(
+    published: tuple[DialectAwareLexicon, SharedLexiconStore],
+) -> None:
+    _, store = published
+    code = (
+        "import sys\n"
+        "from furlan_g2p.lexicon import DialectAwareLexicon\n"
+        "lexicon = DialectAwareLexicon.from_shared(sys.argv[1])\n"
+        "print(lexicon.lookup_ipa('cjase', 'western'))\n"
+    )
+    for _ in range(2):
+        result = subprocess.run(
+            [sys.executable, "-c", code, store.name],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "ˈcaːze"
+    assert SharedLexiconStore.attach(store.name).candidates("çuç")[0].source == "manual"
+
+
+def test_attached_store_reads_the_published_bloom_filter(
+    published: tuple[DialectAwareLexicon, SharedLexiconStore],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _, store = published
+
+    def fail(*_: object) -> None:
+        raise AssertionError("lemmas hashed again")
+
+    monkeypatch.setattr("furlan_g2p.lexicon.bloom.BloomFilter.from_keys", fail)
+    shared = DialectAwareLexicon.from_shared(
+        store.name, LexiconConfig(bloom_filter=True, snapshot=False)
+    )
+
+    bloom = shared.lemma_filter
+    assert bloom is not None and bloom is shared.store.bloom_filter()
+    assert len(bloom) == 3
+    assert all(lemma in bloom for lemma in store.iter_lemmas())
+    assert shared.lookup("missing") is None
+    with pytest.raises(TypeError):
+        bloom.add("missing")
+    shared.store.close()  # type: ignore[attr-defined]
+
+
+def test_attach_rejects_case_mismatch(
+    published: tuple[DialectAwareLexicon, SharedLexiconStore],
+) -> None:
+    _, store = published
+    with pytest.raises(ValueError, match="case_sensitive"):
+        DialectAwareLexicon.from_shared(store.name, LexiconConfig(case_sensitive=True))
+
+
+def test_attach_after_unlink_fails() -> None:
+    store = SharedLexiconStore.publish([LexiconEntry(lemma="cjase", ipa="ˈcaze")])
+    name = store.name
+    store.unlink()
+    with pytest.raises(FileNotFoundError):
+        SharedLexiconStore.attach(name)
+
+
+def test_empty_lexicon_publishes() -> None:
+    store = SharedLexiconStore.publish([])
+    try:
+        attached = SharedLexiconStore.attach(store.name)
+        assert len(attached) == 0
+        assert attached.candidates("cjase") == []
+        assert list(attached) == []
+    finally:
+        store.unlink()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from furlan_g2p.cli.app import cli
+from furlan_g2p.g2p.lexicon import Lexicon
+from furlan_g2p.lexicon import DialectAwareLexicon, LexiconConfig, LexiconEntry, write_jsonl
+
+
+def _write(path: Path) -> None:
+    write_jsonl(
+        [
+            LexiconEntry(lemma="Cjase", ipa="'caze", alternatives=["ˈcaze", "ˈcjaze"]),
+            LexiconEntry(lemma="cjase", ipa="ˈca:ze", dialect="western", confidence=0.9),
+            LexiconEntry(lemma="aghe", ipa="ˈaɡe", frequency=3),
+        ],
+        path,
+    )
+
+
+def _snapshots(directory: Path) -> list[Path]:
+    return sorted(directory.glob("*.snapshot"))
+
+
+def test_second_load_reads_the_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "lexicon.jsonl"
+    _write(source)
+    config = LexiconConfig(snapshot_dir=str(tmp_path / "snapshots"))
+    built = DialectAwareLexicon.from_path(source, config=config)
+    assert len(_snapshots(tmp_path / "snapshots")) == 1
+
+    def fail(*_: object) -> None:
+        raise AssertionError("source parsed again")
+
+    monkeypatch.setattr("furlan_g2p.lexicon.lookup.read_jsonl", fail)
+    monkeypatch.setattr("furlan_g2p.lexicon.lookup.canonicalize_ipa", fail)
+    loaded = DialectAwareLexicon.from_path(source, config=config)
+
+    assert list(loaded.iter_entries()) == list(built.iter_entries())
+    assert loaded.lookup_ipa("CJASE", dialect="western") == "ˈca:ze"
+    assert loaded.get_alternatives("cjase") == ["ˈcjaze"]
+
+
+def test_snapshot_carries_the_bloom_filter(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "lexicon.jsonl"
+    _write(source)
+    directory = str(tmp_path / "snapshots")
+    DialectAwareLexicon.from_path(source, config=LexiconConfig(snapshot_dir=directory))
+
+    def fail(*_: object) -> None:
+        raise AssertionError("lemmas hashed again")
+
+    monkeypatch.setattr("furlan_g2p.lexicon.bloom.BloomFilter.from_keys", fail)
+    loaded = DialectAwareLexicon.from_path(
+        source, config=LexiconConfig(snapshot_dir=directory, bloom_filter=True)
+    )
+
+    assert loaded.lemma_filter is not None
+    assert "cjase" in loaded.lemma_filter
+    assert loaded.lookup("sûr") is None
+    plain = DialectAwareLexicon.from_path(source, config=LexiconConfig(snapshot_dir=directory))
+    assert plain.lemma_filter is None
+
+
+def test_changed_file_or_case_setting_gets_a_new_snapshot(tmp_path: Path) -> None:
+    source = tmp_path / "lexicon.jsonl"
+    _write(source)
+    directory = tmp_path / "snapshots"
+    DialectAwareLexicon.from_path(source, config=LexiconConfig(snapshot_dir=str(directory)))
+    (original,) = _snapshots(directory)
+    DialectAwareLexicon.from_path(
+        source, config=LexiconConfig(snapshot_dir=str(directory), case_sensitive=True)
+    )
+    with source.open("a", encoding="utf-8") as handle:
+        handle.write('{"lemma": "sûr", "ipa": "ˈsuːr"}\n')
+    lexicon = DialectAwareLexicon.from_path(
+        source, config=LexiconConfig(snapshot_dir=str(directory))
+    )
+
+    assert lexicon.lookup_ipa("sûr") == "ˈsuːr"
+    # The edited file's snapshot replaces the outdated one of the same setting.
+    assert len(_snapshots(directory)) == 2
+    assert not original.exists()
+
+
+def test_unreadable_snapshot_is_rebuilt(tmp_path: Path) -> None:
+    source = tmp_path / "lexicon.jsonl"
+    _write(source)
+    config = LexiconConfig(snapshot_dir=str(tmp_path / "snapshots"))
+    DialectAwareLexicon.from_path(source, config=config)
+    (snapshot,) = _snapshots(tmp_path / "snapshots")
+    snapshot.write_bytes(snapshot.read_bytes()[:20])
+
+    assert DialectAwareLexicon.from_path(source, config=config).lookup_ipa("aghe") == "ˈage"
+    assert DialectAwareLexicon.from_path(source, config=config).lookup_ipa("aghe") == "ˈage"
+
+
+def test_snapshots_can_be_disabled(
+    tmp_path: Path, isolated_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "lexicon.jsonl"
+    _write(source)
+
+    with monkeypatch.context() as patch:
+        # Without snapshots the source is not read a second time for hashing.
+        patch.setattr(Path, "read_bytes", lambda self: pytest.fail("read for hashing"))
+        Lexicon.load(source, config=LexiconConfig(snapshot=False))
+    assert not (isolated_cache_dir / "lexicon").exists()
+
+    seed = Lexicon.load_seed()
+    assert seed.lookup_ipa("cjase") == Lexicon.load_seed().lookup_ipa("cjase")
+    Lexicon.load(source)
+    assert len(_snapshots(isolated_cache_dir / "lexicon")) == 2
+
+
+def test_cache_cli_reports_and_clears_snapshots(tmp_path: Path, isolated_cache_dir: Path) -> None:
+    source = tmp_path / "lexicon.jsonl"
+    _write(source)
+    Lexicon.load(source)
+    runner = CliRunner()
+
+    stats = runner.invoke(cli, ["cache", "stats"])
+    assert "Lexicon snapshots: 1 (" in stats.output
+
+    cleared = runner.invoke(cli, ["cache", "clear"])
+    assert "Removed 1 lexicon snapshots" in cleared.output
+    assert _snapshots(isolated_cache_dir / "lexicon") == []
+
+
+def test_importing_the_cli_writes_no_cache(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    env = {**os.environ, "FURLAN_G2P_CACHE_DIR": str(cache_dir)}
+    subprocess.run([sys.executable, "-c", "import furlan_g2p.cli.app"], env=env, check=True)
+
+    assert not cache_dir.exists()
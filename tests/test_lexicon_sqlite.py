@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks.synthetic import LexiconProfile, iter_lexicon_entries
+from furlan_g2p.cli.app import cli
+from furlan_g2p.lexicon import (
+    DialectAwareLexicon,
+    LexiconBuilder,
+    LexiconConfig,
+    LexiconEntry,
+    SqliteLexiconStore,
+    write_sqlite,
+)
+
+_DIALECTS = (None, "central", "western", "carnic")
+
+
+def _entries() -> list[LexiconEntry]:
+    profile = LexiconProfile(alternative_weights=(0.6, 0.3, 0.1))
+    entries = list(iter_lexicon_entries(300, seed=3, profile=profile))
+    entries.extend(
+        [
+            LexiconEntry(lemma="Sôl", ipa="ˈsɔːl", dialect="carnic", confidence=0.4),
+            LexiconEntry(lemma="sôl", ipa="ˈsol", dialect="western", confidence=0.9),
+        ]
+    )
+    return entries
+
+
+def _build(tmp_path: Path) -> Path:
+    builder = LexiconBuilder()
+    for entry in _entries():
+        builder.merge_entry(entry)
+    path = tmp_path / "lexicon.sqlite"
+    builder.export(path, format="sqlite")
+    return path
+
+
+@pytest.mark.parametrize("default_dialect", [None, "carnic"])
+def test_sqlite_lexicon_matches_in_memory_lexicon(tmp_path: Path, default_dialect: str) -> None:
+    config = LexiconConfig(default_dialect=default_dialect, return_alternatives=True)
+    memory = DialectAwareLexicon(_entries(), config=config)
+    on_disk = DialectAwareLexicon.from_path(_build(tmp_path), config=config)
+    assert isinstance(on_disk.store, SqliteLexiconStore)
+
+    words = [entry.lemma for entry in _entries()] + ["SÔL", "missing", ""]
+    for dialect in _DIALECTS:
+        expected = [memory.lookup(word, dialect=dialect) for word in words]
+        assert [on_disk.lookup(word, dialect=dialect) for word in words] == expected
+        assert on_disk.lookup_many(words, dialect=dialect) == expected
+        assert memory.lookup_many(words, dialect=dialect) == expected
+        for word in words[:50]:
+            assert on_disk.get_alternatives(word, dialect) == memory.get_alternatives(word, dialect)
+
+    assert on_disk.stats() == memory.stats()
+    assert on_disk.fallbacks.counts() == memory.fallbacks.counts()
+
+
+def test_sqlite_store_serves_threads(tmp_path: Path) -> None:
+    path = tmp_path / "lexicon.db"
+    entries = DialectAwareLexicon(_entries()).iter_entries()
+    assert write_sqlite(entries, path) == len(DialectAwareLexicon(_entries()))
+    store = SqliteLexiconStore(path)
+    lemmas = sorted({entry.lemma.lower() for entry in _entries()})
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(store.candidates, lemmas))
+
+    assert all(results)
+    assert len(store._connections) > 1
+    store.close()
+
+
+def test_sqlite_store_rejects_incompatible_files(tmp_path: Path) -> None:
+    path = tmp_path / "lexicon.sqlite"
+    write_sqlite([LexiconEntry(lemma="cjase", ipa="ˈcaze")], path)
+    with pytest.raises(ValueError, match="case_sensitive"):
+        SqliteLexiconStore(path, case_sensitive=True)
+
+    bogus = tmp_path / "bogus.db"
+    bogus.write_text("not a database", encoding="utf-8")
+    with pytest.raises(ValueError, match="Not an SQLite lexicon"):
+        SqliteLexiconStore(bogus)
+
+
+def test_cli_builds_sqlite_lexicon(tmp_path: Path, cli_runner: CliRunner) -> None:
+    source = tmp_path / "sample.tsv"
+    source.write_text("lemma\tipa\ncjase\tˈcaze\nTest\tˈtest\n", encoding="utf-8")
+    built = tmp_path / "lexicon.sqlite"
+
+    result = cli_runner.invoke(
+        cli, ["lexicon", "build", str(source), "--output", str(built), "--format", "sqlite"]
+    )
+    assert result.exit_code == 0, result.output
+
+    info = cli_runner.invoke(cli, ["lexicon", "info", str(built), "--json"])
+    assert info.exit_code == 0, info.output
+    assert json.loads(info.output)["total_entries"] == 2
+    assert DialectAwareLexicon.from_path(built).lookup_ipa("TEST") == "ˈtest"
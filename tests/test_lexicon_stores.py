@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+from benchmarks.synthetic import LexiconProfile, iter_lexicon_entries
+from furlan_g2p.lexicon import (
+    CompactLexiconStore,
+    DialectAwareLexicon,
+    LexiconConfig,
+    LexiconEntry,
+)
+
+_DIALECTS = (None, "central", "western", "carnic")
+
+
+def _entries() -> list[LexiconEntry]:
+    profile = LexiconProfile(alternative_weights=(0.5, 0.3, 0.2))
+    entries = list(iter_lexicon_entries(400, seed=7, profile=profile))
+    entries.extend(
+        [
+            LexiconEntry(lemma="Sôl", ipa="ˈsɔːl", dialect="carnic", confidence=0.4),
+            LexiconEntry(lemma="sôl", ipa="ˈsol", dialect="western", confidence=0.9),
+            LexiconEntry(lemma="sôl", ipa="ˈsul", dialect="western", source="manual"),
+            LexiconEntry(lemma="vin", ipa="ˈvin", frequency=None, alternatives=["ˈviŋ"]),
+        ]
+    )
+    return entries
+
+
+@pytest.mark.parametrize("default_dialect", [None, "western"])
+@pytest.mark.parametrize("fallback", [True, False])
+def test_compact_storage_matches_dict_storage(default_dialect: str | None, fallback: bool) -> None:
+    entries = _entries()
+    lexicons = [
+        DialectAwareLexicon(
+            entries,
+            LexiconConfig(
+                default_dialect=default_dialect,
+                fallback_to_universal=fallback,
+                return_alternatives=True,
+                storage=storage,
+            ),
+        )
+        for storage in ("dict", "compact")
+    ]
+    dict_lexicon, compact_lexicon = lexicons
+    assert isinstance(compact_lexicon.store, CompactLexiconStore)
+
+    for word in {entry.lemma for entry in entries} | {"missing"}:
+        for dialect in _DIALECTS:
+            assert compact_lexicon.lookup(word, dialect) == dict_lexicon.lookup(word, dialect)
+            assert compact_lexicon.get_alternatives(word, dialect) == (
+                dict_lexicon.get_alternatives(word, dialect)
+            )
+
+    assert compact_lexicon.stats() == dict_lexicon.stats()
+    assert len(compact_lexicon) == len(dict_lexicon)
+    assert list(compact_lexicon.iter_entries()) == list(dict_lexicon.iter_entries())
+    assert compact_lexicon.fallbacks.counts() == dict_lexicon.fallbacks.counts()
+
+
+def test_compact_storage_uses_less_memory() -> None:
+    entries = list(iter_lexicon_entries(3000, seed=1))
+    sizes = {}
+    for storage in ("dict", "compact"):
+        tracemalloc.start()
+        lexicon = DialectAwareLexicon(entries, LexiconConfig(storage=storage))
+        sizes[storage] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert len(lexicon) == 3000
+
+    assert sizes["compact"] * 2 < sizes["dict"]
+
+
+def test_from_store_wraps_prebuilt_store() -> None:
+    store = CompactLexiconStore([LexiconEntry(lemma="cjase", ipa="ˈcaze")])
+    lexicon = DialectAwareLexicon.from_store(store, LexiconConfig(default_dialect="central"))
+
+    assert lexicon.lookup_ipa("cjase") == "ˈcaze"
+    assert lexicon.store is store
+
+
+def test_unknown_storage_is_rejected() -> None:
+    with pytest.raises(ValueError, match="storage"):
+        LexiconConfig(storage="mmap")
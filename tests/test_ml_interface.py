@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-import builtins
 import importlib
+import importlib.util
+import os
+import subprocess
+import sys
+from importlib.machinery import ModuleSpec
+from pathlib import Path
 
 import pytest
 
@@ -51,24 +56,43 @@ def test_ml_available_flag_and_require_ml_behavior() -> None:
 
 def test_module_import_without_optional_ml_dependencies(monkeypatch: pytest.MonkeyPatch) -> None:
     module = importlib.import_module("furlan_g2p.ml")
-    original_import = builtins.__import__
-
-    def fake_import(
-        name: str,
-        globals_: dict[str, object] | None = None,
-        locals_: dict[str, object] | None = None,
-        fromlist: tuple[str, ...] | None = None,
-        level: int = 0,
-    ) -> object:
+    original_find_spec = importlib.util.find_spec
+
+    def fake_find_spec(name: str, package: str | None = None) -> ModuleSpec | None:
         if name in {"torch", "transformers"}:
-            raise ImportError(f"forced missing dependency: {name}")
-        return original_import(name, globals_, locals_, fromlist, level)
+            return None
+        return original_find_spec(name, package)
 
     with monkeypatch.context() as patch_ctx:
-        patch_ctx.setattr(builtins, "__import__", fake_import)
+        patch_ctx.setattr(importlib.util, "find_spec", fake_find_spec)
         reloaded = importlib.reload(module)
         assert reloaded.ML_AVAILABLE is False
         with pytest.raises(ImportError, match="ML dependencies not installed"):
             reloaded.require_ml()
 
     importlib.reload(module)
+
+
+def test_ml_dependencies_are_imported_lazily(tmp_path: Path) -> None:
+    # Stand-ins for torch/transformers that record when they are imported.
+    for name in ("torch", "transformers"):
+        (tmp_path / f"{name}.py").write_text(
+            "import os\n"
+            f"open(os.path.join(os.path.dirname(__file__), '{name}.imported'), 'w').close()\n",
+            encoding="utf-8",
+        )
+    script = (
+        "import sys\n"
+        "import furlan_g2p.ml as ml\n"
+        "assert ml.ML_AVAILABLE\n"
+        "assert 'torch' not in sys.modules and 'transformers' not in sys.modules\n"
+        "assert sorted(ml.require_ml()) == ['torch', 'transformers']\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmp_path), *sys.path])}
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / "torch.imported").exists()
+    assert (tmp_path / "transformers.imported").exists()
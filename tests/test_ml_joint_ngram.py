@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks.synthetic import iter_lexicon_entries
+from furlan_g2p.cli.app import cli
+from furlan_g2p.g2p.phonemizer import G2PPhonemizer
+from furlan_g2p.lexicon import LexiconEntry, write_jsonl
+from furlan_g2p.ml import JointNgramModel
+from furlan_g2p.ml.joint_ngram import split_phonemes
+
+
+@pytest.fixture(scope="module")
+def corpus() -> tuple[list[LexiconEntry], list[LexiconEntry]]:
+    entries = [entry for entry in iter_lexicon_entries(900, seed=11) if entry.dialect is None]
+    return entries[:500], entries[500:]
+
+
+@pytest.fixture(scope="module")
+def model(corpus: tuple[list[LexiconEntry], list[LexiconEntry]]) -> JointNgramModel:
+    return JointNgramModel.train(corpus[0], order=3, iterations=3)
+
+
+def test_split_phonemes_keeps_affricates_and_length() -> None:
+    assert split_phonemes("ˈtʃaːr") == ("tʃ", "aː", "r")
+    assert split_phonemes("dʒeˌladz") == ("dʒ", "e", "l", "a", "dz")
+
+
+def test_predicts_held_out_words(
+    model: JointNgramModel, corpus: tuple[list[LexiconEntry], list[LexiconEntry]]
+) -> None:
+    held_out = corpus[1]
+    predictions = model.predict_batch([entry.lemma for entry in held_out])
+
+    correct = sum(
+        prediction is not None and split_phonemes(prediction.ipa) == split_phonemes(entry.ipa)
+        for entry, prediction in zip(held_out, predictions, strict=True)
+    )
+    assert correct / len(held_out) > 0.8
+    best = next(prediction for prediction in predictions if prediction is not None)
+    assert best.source == "joint-ngram"
+    assert 0.0 < best.confidence <= 1.0
+    assert all(confidence <= best.confidence for _, confidence in best.alternatives)
+
+
+def test_unseen_letters_give_no_prediction(model: JointNgramModel) -> None:
+    assert model.predict("ωμέγα") is None
+    assert model.is_available() is True
+
+
+def test_serialization_round_trip(model: JointNgramModel, tmp_path: Path) -> None:
+    path = tmp_path / "model.fgjm"
+    model.save(path)
+    loaded = JointNgramModel.load(path)
+
+    words = ["cjase", "furlan", "gnove", "sfuei"]
+    assert loaded.predict_batch(words) == model.predict_batch(words)
+    assert loaded.get_model_info() == model.get_model_info()
+    with pytest.raises(ValueError, match="joint n-gram"):
+        JointNgramModel.from_bytes(b"FGJM\x01" + bytes(8))
+
+
+def test_plugs_into_phonemizer(model: JointNgramModel) -> None:
+    phonemizer = G2PPhonemizer(exception_model=model, model_threshold=0.0)
+    prediction = model.predict("furlan")
+    assert prediction is not None
+
+    assert "".join(phonemizer.to_phonemes(["furlan"])) == prediction.ipa
+
+
+def test_cli_train_model_and_g2p(
+    corpus: tuple[list[LexiconEntry], list[LexiconEntry]], tmp_path: Path
+) -> None:
+    lexicon = tmp_path / "lexicon.jsonl"
+    write_jsonl(corpus[0][:200], lexicon)
+    model_path = tmp_path / "model.fgjm"
+    runner = CliRunner()
+
+    trained = runner.invoke(
+        cli, ["lexicon", "train-model", str(lexicon), str(model_path), "--order", "2"]
+    )
+    assert trained.exit_code == 0, trained.output
+    assert "Trained order-2 model on 200 words" in trained.output
+
+    result = runner.invoke(cli, ["g2p", "--model", str(model_path), "furlan"])
+    assert result.exit_code == 0, result.output
+    assert result.output.strip()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from furlan_g2p.cli.app import cli
+from furlan_g2p.lexicon import LexiconEntry, write_jsonl
+from furlan_g2p.ml import CachedExceptionModel, ExceptionPrediction, IExceptionModel
+
+
+class _CountingModel(IExceptionModel):
+    def __init__(self, version: str = "1") -> None:
+        self.version = version
+        self.calls: list[tuple[list[str], str | None]] = []
+
+    def predict(self, word: str, dialect: str | None = None) -> ExceptionPrediction | None:
+        return self.predict_batch([word], dialect)[0]
+
+    def predict_batch(
+        self, words: list[str], dialect: str | None = None
+    ) -> list[ExceptionPrediction | None]:
+        self.calls.append((list(words), dialect))
+        return [
+            (
+                None
+                if word.startswith("x")
+                else ExceptionPrediction(word.upper(), 0.75, "counting", [(word, 0.25)])
+            )
+            for word in words
+        ]
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_model_info(self) -> dict[str, str | bool | int]:
+        return {"name": "counting", "version": self.version, "available": True}
+
+
+def test_batches_read_through_and_persist(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "predictions.sqlite"
+    model = _CountingModel()
+    cached = CachedExceptionModel(model, path)
+
+    first = cached.predict_batch(["pan", "xyz", "pan"], dialect="western")
+    second = cached.predict_batch(["pan", "xyz", "vin"], dialect="western")
+    cached.predict("pan")
+
+    assert model.calls == [(["pan", "xyz"], "western"), (["vin"], "western"), (["pan"], None)]
+    assert first == [ExceptionPrediction("PAN", 0.75, "counting", [("pan", 0.25)]), None] + [
+        ExceptionPrediction("PAN", 0.75, "counting", [("pan", 0.25)])
+    ]
+    assert second[:2] == first[:2]
+    assert cached.stats()["entries"] == 4
+    cached.close()
+
+    reopened_model = _CountingModel()
+    reopened = CachedExceptionModel(reopened_model, path)
+    assert reopened.predict_batch(["pan", "vin", "xyz"], dialect="western") == second[:1] + [
+        ExceptionPrediction("VIN", 0.75, "counting", [("vin", 0.25)]),
+        None,
+    ]
+    assert reopened_model.calls == []
+    assert reopened.stats()["hits"] == 3
+
+
+def test_model_version_change_invalidates(tmp_path: Path) -> None:
+    path = tmp_path / "predictions.sqlite"
+    CachedExceptionModel(_CountingModel("1"), path).predict_batch(["pan"])
+
+    newer = _CountingModel("2")
+    cached = CachedExceptionModel(newer, path)
+    cached.predict_batch(["pan"])
+
+    assert newer.calls == [(["pan"], None)]
+    assert cached.get_model_info()["version"] == "2"
+
+
+def test_size_limit_evicts_least_recently_used(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Refresh recency on every read instead of at most once a minute.
+    monkeypatch.setattr("furlan_g2p.ml.prediction_cache._TOUCH_INTERVAL_NS", 0)
+    model = _CountingModel()
+    cached = CachedExceptionModel(model, tmp_path / "predictions.sqlite", max_entries=10)
+
+    cached.predict_batch([f"w{index}" for index in range(10)])
+    cached.predict_batch(["w0"])
+    cached.predict_batch(["new"])
+
+    assert cached.stats()["entries"] == 9
+    model.calls.clear()
+    cached.predict_batch(["w0", "new", "w1"])
+    assert model.calls == [(["w1"], None)]
+    with pytest.raises(ValueError, match="max_entries"):
+        CachedExceptionModel(model, tmp_path / "other.sqlite", max_entries=0)
+
+
+def test_none_from_unavailable_model_is_not_cached(tmp_path: Path) -> None:
+    class _Flaky(_CountingModel):
+        available = False
+
+        def predict_batch(
+            self, words: list[str], dialect: str | None = None
+        ) -> list[ExceptionPrediction | None]:
+            predictions = super().predict_batch(words, dialect)
+            return predictions if self.available else [None] * len(words)
+
+        def is_available(self) -> bool:
+            return self.available
+
+    model = _Flaky()
+    cached = CachedExceptionModel(model, tmp_path / "predictions.sqlite")
+    assert cached.predict_batch(["pan", "xyz"]) == [None, None]
+    assert cached.stats()["entries"] == 0
+
+    model.available = True
+    assert cached.predict_batch(["pan", "xyz"])[0] == ExceptionPrediction(
+        "PAN", 0.75, "counting", [("pan", 0.25)]
+    )
+    assert cached.predict_batch(["xyz"]) == [None]
+    assert model.calls == [(["pan", "xyz"], None), (["pan", "xyz"], None)]
+    assert cached.stats()["hits"] == 1
+
+
+def test_cli_model_cache(tmp_path: Path) -> None:
+    lexicon = tmp_path / "lexicon.jsonl"
+    write_jsonl(
+        [LexiconEntry(lemma="pan", ipa="pan"), LexiconEntry(lemma="vin", ipa="vin")], lexicon
+    )
+    model_path = tmp_path / "model.fgjm"
+    cache_path = tmp_path / "predictions.sqlite"
+    runner = CliRunner()
+    assert (
+        runner.invoke(cli, ["lexicon", "train-model", str(lexicon), str(model_path)]).exit_code == 0
+    )
+
+    args = ["g2p", "--model", str(model_path), "--model-cache", str(cache_path), "pin"]
+    first = runner.invoke(cli, args)
+    second = runner.invoke(cli, args)
+
+    assert first.exit_code == 0, first.output
+    assert second.output == first.output
+    assert cache_path.exists()
+
+
+def test_cli_model_cache_requires_model(tmp_path: Path) -> None:
+    cache_path = tmp_path / "predictions.sqlite"
+    result = CliRunner().invoke(cli, ["g2p", "--model-cache", str(cache_path), "pin"])
+
+    assert result.exit_code == 2
+    assert "--model-cache requires --model" in result.output
+    assert not cache_path.exists()
+
+
+def test_async_model_stays_async(tmp_path: Path) -> None:
+    class _DeferredModel(_CountingModel):
+        asynchronous = True
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.pending: list[tuple[Future[list[ExceptionPrediction | None]], list[str]]] = []
+
+        def predict_batch_async(
+            self, words: list[str], dialect: str | None = None
+        ) -> Future[list[ExceptionPrediction | None]]:
+            future: Future[list[ExceptionPrediction | None]] = Future()
+            self.pending.append((future, list(words)))
+            return future
+
+    model = _DeferredModel()
+    cached = CachedExceptionModel(model, tmp_path / "predictions.sqlite")
+    assert cached.asynchronous is True
+
+    result = cached.predict_batch_async(["pan", "vin"])
+    assert not result.done()
+    future, words = model.pending.pop()
+    future.set_result(_CountingModel().predict_batch(words))
+
+    assert [prediction and prediction.ipa for prediction in result.result()] == ["PAN", "VIN"]
+    assert cached.predict_batch_async(["vin"]).done()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import signal
+from pathlib import Path
+
+import pytest
+
+from furlan_g2p.g2p.phonemizer import G2PPhonemizer
+from furlan_g2p.lexicon import LexiconEntry
+from furlan_g2p.ml import (
+    CachedExceptionModel,
+    ExceptionPrediction,
+    IExceptionModel,
+    JointNgramModel,
+    SubprocessExceptionModel,
+)
+
+_ENTRIES = [
+    LexiconEntry(lemma=lemma, ipa=ipa)
+    for lemma, ipa in [
+        ("pan", "pan"),
+        ("vin", "vin"),
+        ("man", "man"),
+        ("pin", "pin"),
+        ("mar", "mar"),
+        ("par", "par"),
+    ]
+]
+
+
+class _ExitingModel(IExceptionModel):
+    """Kills its process on the first prediction."""
+
+    def predict(self, word: str, dialect: str | None = None) -> ExceptionPrediction | None:
+        return None
+
+    def predict_batch(
+        self, words: list[str], dialect: str | None = None
+    ) -> list[ExceptionPrediction | None]:
+        os._exit(3)
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_model_info(self) -> dict[str, str | bool | int]:
+        return {"name": "exiting", "available": True}
+
+
+def _failing_factory() -> IExceptionModel:
+    raise OSError("no weights")
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("model") / "model.fgjm"
+    JointNgramModel.train(_ENTRIES, order=2).save(path)
+    return path
+
+
+def test_worker_matches_in_process_model(model_path: Path) -> None:
+    local = JointNgramModel.load(model_path)
+    words = ["pan", "vir", "mip", "ωμέγα"]
+
+    with SubprocessExceptionModel(JointNgramModel.load, model_path) as remote:
+        assert remote.pid not in (None, os.getpid())
+        assert remote.get_model_info() == local.get_model_info()
+        futures = [remote.predict_batch_async(words[:2]), remote.predict_batch_async(words[2:])]
+        assert [future.result(timeout=30) for future in futures] == [
+            local.predict_batch(words[:2]),
+            local.predict_batch(words[2:]),
+        ]
+        assert remote.predict("pan") == local.predict("pan")
+
+        phonemizer = G2PPhonemizer(exception_model=remote, model_threshold=0.0)
+        expected = G2PPhonemizer(exception_model=local, model_threshold=0.0)
+        assert phonemizer.to_phonemes_batch([["pan", "mip"], ["vir"]]) == (
+            expected.to_phonemes_batch([["pan", "mip"], ["vir"]])
+        )
+    assert remote.is_available() is False
+
+
+def test_dead_worker_fails_requests_and_phonemizer_uses_rules() -> None:
+    remote = SubprocessExceptionModel(_ExitingModel)
+    assert remote.is_available() is True
+
+    with pytest.raises(RuntimeError, match="unavailable"):
+        remote.predict_batch(["pan", "vin"])
+    with pytest.raises(RuntimeError, match="unavailable"):
+        remote.predict_batch_async(["pan"]).result(timeout=30)
+    assert remote.is_available() is False
+
+    phonemizer = G2PPhonemizer(exception_model=remote, model_threshold=0.0)
+    assert phonemizer.to_phonemes(["sûr"]) == G2PPhonemizer().to_phonemes(["sûr"])
+    remote.close()
+
+
+def test_killed_worker_does_not_poison_the_prediction_cache(
+    model_path: Path, tmp_path: Path
+) -> None:
+    cache_path = tmp_path / "predictions.sqlite"
+    expected = JointNgramModel.load(model_path).predict_batch(["pan"])
+    assert expected != [None]
+
+    remote = SubprocessExceptionModel(JointNgramModel.load, model_path)
+    cached = CachedExceptionModel(remote, cache_path)
+    assert remote.pid is not None
+    os.kill(remote.pid, signal.SIGKILL)
+    with pytest.raises(RuntimeError, match="unavailable"):
+        cached.predict_batch(["pan"])
+    assert cached.stats()["entries"] == 0
+    remote.close()
+
+    with SubprocessExceptionModel(JointNgramModel.load, model_path) as restarted:
+        recached = CachedExceptionModel(restarted, cache_path)
+        assert recached.predict_batch(["pan"]) == expected
+        assert recached.stats()["misses"] == 1
+        assert recached.stats()["entries"] == 1
+
+
+def test_load_failure_is_reported() -> None:
+    with pytest.raises(RuntimeError, match="no weights"):
+        SubprocessExceptionModel(_failing_factory)
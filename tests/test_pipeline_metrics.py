@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from furlan_g2p.g2p.phonemizer import G2PPhonemizer
+from furlan_g2p.lexicon import DialectAwareLexicon, LexiconEntry
+from furlan_g2p.services import Histogram, PipelineMetrics, PipelineService
+from furlan_g2p.services.instrumentation import STAGES
+
+
+def _lexicon() -> DialectAwareLexicon:
+    return DialectAwareLexicon([LexiconEntry(lemma="cjase", ipa="ˈcaze")])
+
+
+def test_metrics_disabled_by_default() -> None:
+    service = PipelineService()
+    assert service.metrics is None
+    assert service.phonemizer.metrics is None
+    assert service.stats() == {"enabled": False}
+
+
+def test_process_text_records_stages_and_counters() -> None:
+    service = PipelineService(phonemizer=G2PPhonemizer(lexicon=_lexicon()))
+    metrics = service.enable_metrics()
+    expected = PipelineService(phonemizer=G2PPhonemizer(lexicon=_lexicon())).process_text(
+        "Cjase e bêç"
+    )
+
+    assert service.process_text("Cjase e bêç") == expected
+    stats = service.stats()
+    counters = stats["counters"]
+    assert isinstance(counters, dict)
+    assert counters["texts"] == 1
+    assert counters["tokens"] == 3
+    assert counters["lexicon_hits"] == 1
+    assert counters["rule_fallbacks"] == 2
+    stages = stats["stages"]
+    assert isinstance(stages, dict)
+    assert set(STAGES) <= set(stages)
+    assert all(stages[stage]["count"] == 1 for stage in STAGES)
+    assert isinstance(stats["tokens_per_second"], float)
+    assert stats["tokens_per_second"] > 0
+    json.dumps(stats)
+
+    metrics.reset()
+    assert metrics.stats()["counters"] == {
+        "texts": 0,
+        "tokens": 0,
+        "lexicon_hits": 0,
+        "rule_fallbacks": 0,
+        "rule_errors": 0,
+    }
+    service.disable_metrics()
+    assert service.stats() == {"enabled": False}
+
+
+def test_batches_observe_per_text_means() -> None:
+    service = PipelineService(phonemizer=G2PPhonemizer(lexicon=_lexicon()))
+    metrics = service.enable_metrics()
+    service.process_batch(["Cjase", "bêç", "Cjase e bêç"])
+    service.process_text("cjase")
+
+    stages = metrics.stats()["stages"]
+    assert isinstance(stages, dict)
+    assert all(stages[stage]["count"] == 4 for stage in STAGES)
+
+
+def test_histogram_observe_many_at_once() -> None:
+    hist = Histogram()
+    hist.observe(0.001, 3)
+    snapshot = hist.snapshot()
+    assert snapshot["count"] == 3
+    assert snapshot["sum"] == pytest.approx(0.003)
+    assert snapshot["mean"] == pytest.approx(0.001)
+
+
+def test_rule_errors_are_counted_and_reraised() -> None:
+    metrics = PipelineMetrics()
+    phonemizer = G2PPhonemizer(lexicon=_lexicon(), metrics=metrics)
+    with pytest.raises(ValueError):
+        phonemizer.to_phonemes(["cjase", "ω"])
+    counters = metrics.stats()["counters"]
+    assert isinstance(counters, dict)
+    assert counters["rule_errors"] == 1
+    assert counters["lexicon_hits"] == 1
+    assert counters["rule_fallbacks"] == 0
+
+
+def test_exporter_receives_snapshots() -> None:
+    snapshots: list[dict[str, object]] = []
+    service = PipelineService(metrics=PipelineMetrics(exporter=snapshots.append, export_interval=0))
+    service.process_text("cjase")
+    service.process_text("aghe")
+    assert len(snapshots) == 2
+    assert service.metrics is not None
+    service.metrics.export()
+    assert len(snapshots) == 3
+
+
+def test_histogram_quantiles() -> None:
+    hist = Histogram()
+    for value in [1e-5] * 9 + [1.0]:
+        hist.observe(value)
+    snapshot = hist.snapshot()
+    assert snapshot["count"] == 10
+    assert snapshot["p50"] == pytest.approx(1.6e-5)
+    assert snapshot["p99"] == pytest.approx(1.0)
+    assert snapshot["max"] == 1.0
+    assert Histogram().snapshot()["p50"] == 0.0
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from benchmarks.synthetic import write_metadata
+from furlan_g2p.cli.app import cli
+from furlan_g2p.g2p.phonemizer import G2PPhonemizer
+from furlan_g2p.lexicon import DialectAwareLexicon, LexiconEntry
+from furlan_g2p.services import PipelineService
+
+
+def _service() -> PipelineService:
+    lexicon = DialectAwareLexicon(
+        [
+            LexiconEntry(lemma="cjase", ipa="ˈcaze"),
+            LexiconEntry(lemma="cjase", ipa="ˈcazɛ", dialect="western"),
+        ]
+    )
+    return PipelineService(phonemizer=G2PPhonemizer(lexicon=lexicon))
+
+
+def test_two_pass_matches_streaming_output(tmp_path: Path) -> None:
+    metadata = tmp_path / "metadata.csv"
+    write_metadata(metadata, 60, seed=3, vocabulary_size=80, dialect_column=True)
+    with metadata.open("a", encoding="utf-8") as handle:
+        handle.write("x1|Cjase cjase, 12 cjase.||western\nx2|Cjase.\nshort\n")
+    service = _service()
+
+    streaming, two_pass = tmp_path / "streaming.csv", tmp_path / "two_pass.csv"
+    service.process_csv(str(metadata), str(streaming), dialect_column=3)
+    service.process_csv(str(metadata), str(two_pass), dialect_column=3, two_pass=True)
+
+    assert two_pass.read_text(encoding="utf-8") == streaming.read_text(encoding="utf-8")
+    assert len(two_pass.read_text(encoding="utf-8").splitlines()) == 62
+
+
+def test_two_pass_phonemizes_each_word_once(tmp_path: Path) -> None:
+    metadata = tmp_path / "metadata.csv"
+    metadata.write_text("u1|Cjase sûr\nu2|sûr cjase sûr\n", encoding="utf-8")
+    service = _service()
+    metrics = service.enable_metrics()
+
+    service.process_csv(str(metadata), str(tmp_path / "out.csv"), two_pass=True)
+
+    counters = metrics.stats()["counters"]
+    assert isinstance(counters, dict)
+    assert counters["texts"] == 2
+    assert counters["tokens"] == 5
+    assert counters["lexicon_hits"] == 1
+    assert counters["rule_fallbacks"] == 1
+
+
+def test_cli_two_pass(tmp_path: Path) -> None:
+    metadata = tmp_path / "metadata.csv"
+    metadata.write_text("u1|Cjase\n", encoding="utf-8")
+    out = tmp_path / "out.csv"
+
+    result = CliRunner().invoke(
+        cli, ["phonemize-csv", "--in", str(metadata), "--out", str(out), "--two-pass"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert out.read_text(encoding="utf-8").splitlines() == ["u1|cjase|ˈc a z e"]
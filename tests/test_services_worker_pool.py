@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import gc
+import os
+import sys
+
+import pytest
+
+from furlan_g2p.services import PipelineService, PipelineWorkerPool, process_memory
+
+pytestmark = pytest.mark.skipif(sys.platform != "linux", reason="needs fork and /proc")
+
+
+def test_workers_match_sequential_processing() -> None:
+    service = PipelineService()
+    texts = ["Cjase", "sôl e aghe", "Cjase sûr", "bêç", "gjat"] * 3
+
+    with PipelineWorkerPool(service, workers=2, chunk_size=4) as pool:
+        assert gc.get_freeze_count() > 0
+        results = pool.map(texts)
+        assert pool.map([]) == []
+
+    assert results == [service.process_text(text) for text in texts]
+    assert gc.get_freeze_count() == 0
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.map(texts)
+
+
+def test_memory_report_covers_parent_and_workers() -> None:
+    with PipelineWorkerPool(workers=2, chunk_size=1) as pool:
+        pool.map(["Cjase"] * 8)
+        report = pool.memory()
+
+    parent = report["parent"]
+    workers = report["workers"]
+    assert isinstance(parent, dict) and parent["pid"] == os.getpid()
+    assert isinstance(workers, list) and 1 <= len(workers) <= 2
+    assert all(0 < worker["uss"] <= worker["pss"] <= worker["rss"] for worker in workers)
+    assert report["workers_uss"] == sum(worker["uss"] for worker in workers)
+
+
+def test_process_memory_of_missing_process() -> None:
+    assert process_memory(2**22 + 12345) is None
+
+
+def test_pool_requires_workers() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        PipelineWorkerPool(workers=0)
+
+
+def test_pool_leaves_an_existing_freeze_alone() -> None:
+    gc.freeze()
+    try:
+        frozen = gc.get_freeze_count()
+        with PipelineWorkerPool(workers=1) as pool:
+            assert pool.map(["cjase"]) == [PipelineService().process_text("cjase")]
+        assert gc.get_freeze_count() == frozen
+    finally:
+        gc.unfreeze()
@@ -0,0 +1,72 @@
+"""Tests for batched stress assignment."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+from hypothesis import given as _given  # type: ignore[import-not-found,unused-ignore]
+from hypothesis import strategies as st  # type: ignore[import-not-found,unused-ignore]
+
+from furlan_g2p.phonology.stress import StressAssigner
+from furlan_g2p.phonology.syllabifier import Syllabifier
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def given(*args: Any, **kwargs: Any) -> Callable[[F], F]:
+    return cast(Callable[[F], F], _given(*args, **kwargs))
+
+
+SYMBOLS = ["a", "e", "iː", "o", "uː", "ɛ", "p", "t", "k", "r", "l", "s", "ˈt", "ˈa"]
+
+
+def _reference_assign(syllables: list[list[str]]) -> list[list[str]]:
+    """Original list-based heuristic kept as an oracle."""
+
+    out = [list(s) for s in syllables]
+    if any(syl and syl[0].startswith("ˈ") for syl in out):
+        return out
+    long_idx = None
+    for idx, syl in enumerate(out):
+        if any("ː" in ph for ph in syl):
+            long_idx = idx
+    if long_idx is None:
+        long_idx = 0 if len(out) == 1 else len(out) - 2
+    out[long_idx][0] = "ˈ" + out[long_idx][0]
+    return out
+
+
+@given(st.lists(st.lists(st.sampled_from(SYMBOLS), min_size=1, max_size=4), min_size=1))
+def test_assign_stress_matches_reference(syllables: list[list[str]]) -> None:
+    assert StressAssigner().assign_stress(syllables) == _reference_assign(syllables)
+
+
+def test_assign_stress_does_not_mutate_input() -> None:
+    syllables = [["p", "a"], ["t", "iː"]]
+    StressAssigner().assign_stress(syllables)
+    assert syllables == [["p", "a"], ["t", "iː"]]
+
+
+def test_assign_stress_batch_positions() -> None:
+    words = [
+        ["o", "r", "e", "l", "e"],
+        ["p", "a", "t", "i", "ː"],
+        ["k", "a"],
+        [],
+        ["ˈr", "e", "l", "e"],
+    ]
+    batch = Syllabifier().syllabify_many(words)
+    assert list(StressAssigner().assign_stress_batch(batch)) == [1, 1, 0, -1, 0]
+
+
+@given(st.lists(st.lists(st.sampled_from(SYMBOLS), max_size=8), max_size=5))
+def test_flatten_stressed_matches_list_api(words: list[list[str]]) -> None:
+    syl = Syllabifier()
+    stress = StressAssigner()
+    batch = syl.syllabify_many(words)
+    expected = [
+        [ph for syllable in stress.assign_stress(syl.syllabify(word)) for ph in syllable]
+        for word in words
+    ]
+    assert stress.flatten_stressed(batch) == expected
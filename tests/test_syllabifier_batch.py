@@ -0,0 +1,107 @@
+"""Tests for the offset-based syllabification fast path."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+
+from hypothesis import given as _given  # type: ignore[import-not-found,unused-ignore]
+from hypothesis import strategies as st  # type: ignore[import-not-found,unused-ignore]
+
+from furlan_g2p.phonology.codes import PHONEME_CODES, PhonemeCodes
+from furlan_g2p.phonology.syllabifier import _ALLOWED_ONSETS, Syllabifier
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def given(*args: Any, **kwargs: Any) -> Callable[[F], F]:
+    return cast(Callable[[F], F], _given(*args, **kwargs))
+
+
+SYMBOLS = ["a", "e", "i", "o", "u", "ɛ", "ɔ", "ː", "p", "b", "t", "d", "k", "g", "s", "r", "l"]
+SYMBOLS += ["f", "n", "tʃ", "ˈa", "ʒ"]
+
+
+def _reference_syllabify(phonemes: list[str]) -> list[list[str]]:
+    """Original list-based algorithm kept as an oracle."""
+
+    phs: list[str] = []
+    i = 0
+    while i < len(phonemes):
+        ph = phonemes[i]
+        if ph[0] in "aeiouɛɔ" and i + 1 < len(phonemes) and phonemes[i + 1] == "ː":
+            phs.append(ph + "ː")
+            i += 2
+        else:
+            phs.append(ph)
+            i += 1
+    syllables: list[list[str]] = []
+    onset: list[str] = []
+    i = 0
+    while i < len(phs):
+        ph = phs[i]
+        if ph[0] in "aeiouɛɔ":
+            i += 1
+            cluster: list[str] = []
+            while i < len(phs) and phs[i][0] not in "aeiouɛɔ":
+                cluster.append(phs[i])
+                i += 1
+            if i < len(phs):
+                split = len(cluster)
+                for size in range(min(3, len(cluster)), 0, -1):
+                    if tuple(cluster[-size:]) in _ALLOWED_ONSETS or size == 1:
+                        split = len(cluster) - size
+                        break
+                syllables.append(onset + [ph] + cluster[:split])
+                onset = cluster[split:]
+            else:
+                syllables.append(onset + [ph] + cluster)
+                onset = []
+        else:
+            onset.append(ph)
+            i += 1
+    if onset:
+        if syllables:
+            syllables[-1].extend(onset)
+        else:
+            syllables.append(onset)
+    return syllables
+
+
+@given(st.lists(st.sampled_from(SYMBOLS), max_size=12))
+def test_syllabify_matches_reference(phonemes: list[str]) -> None:
+    assert Syllabifier().syllabify(phonemes) == _reference_syllabify(phonemes)
+
+
+@given(st.lists(st.lists(st.sampled_from(SYMBOLS), max_size=8), max_size=6))
+def test_syllabify_many_matches_per_word(words: list[list[str]]) -> None:
+    syl = Syllabifier()
+    batch = syl.syllabify_many(words)
+    assert len(batch) == len(words)
+    assert batch.to_lists() == [syl.syllabify(word) for word in words]
+
+
+def test_syllabify_many_offsets_layout() -> None:
+    batch = Syllabifier().syllabify_many([["s", "t", "r", "i", "ɛ"], [], ["k", "u", "ː", "r"]])
+    assert batch.symbols == ["s", "t", "r", "i", "ɛ", "k", "uː", "r"]
+    assert list(batch.syllable_offsets) == [0, 4, 5, 8]
+    assert list(batch.word_offsets) == [0, 2, 2, 3]
+    assert [PHONEME_CODES.symbol(code) for code in batch.codes] == batch.symbols
+
+
+def test_syllable_boundaries_on_codes() -> None:
+    codes = [PHONEME_CODES.code(ph) for ph in ["a", "s", "t", "r", "a"]]
+    assert list(Syllabifier().syllable_boundaries(codes)) == [0, 1, 5]
+    assert list(Syllabifier().syllable_boundaries([])) == [0]
+
+
+def test_phoneme_codes_masks() -> None:
+    table = PhonemeCodes()
+    long_a = table.code("aː")
+    stressed = table.code("ˈt")
+    assert table.code("aː") == long_a
+    assert table.is_vowel(long_a)
+    assert table.long_mask >> long_a & 1
+    assert table.stressed_mask >> stressed & 1
+    assert not table.is_vowel(stressed)
+    assert len(table) == 2
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+from benchmarks.synthetic import (
+    LexiconProfile,
+    iter_lexicon_entries,
+    synthetic_sentences,
+    vocabulary,
+    write_lexicon,
+    write_metadata,
+    write_wordlist,
+    zipf_tokens,
+)
+from furlan_g2p.lexicon import DialectAwareLexicon, read_jsonl, read_tsv
+from furlan_g2p.services.pipeline import PipelineService
+
+
+def test_generation_is_deterministic() -> None:
+    assert synthetic_sentences(20, seed=3) == synthetic_sentences(20, seed=3)
+    assert synthetic_sentences(20, seed=3) != synthetic_sentences(20, seed=4)
+    assert list(iter_lexicon_entries(50, seed=1)) == list(iter_lexicon_entries(50, seed=1))
+
+
+def test_vocabulary_is_distinct_and_zipfian() -> None:
+    words = vocabulary(500, seed=2)
+    assert len(set(words)) == 500
+    counts = Counter(zipf_tokens(20_000, words, seed=2))
+    assert counts[words[0]] > counts[words[10]] > counts[words[400]]
+
+
+def test_lexicon_entries_follow_profile() -> None:
+    profile = LexiconProfile(dialect_rates={"western": 1.0}, alternative_weights=(0.0, 1.0))
+    entries = list(iter_lexicon_entries(40, seed=0, profile=profile))
+
+    assert len(entries) == 40
+    assert [entry.dialect for entry in entries[:4]] == [None, "western", None, "western"]
+    assert entries[0].lemma == entries[1].lemma
+    assert entries[0].ipa != entries[1].ipa
+    assert all(entry.ipa.count("ˈ") == 1 for entry in entries)
+    assert sum(1 for entry in entries if entry.alternatives) > 30
+    assert len({(entry.lemma, entry.dialect) for entry in entries}) == 40
+
+
+def test_written_lexica_round_trip(tmp_path: Path) -> None:
+    tsv_path = tmp_path / "lex.tsv"
+    jsonl_path = tmp_path / "lex.jsonl"
+    assert write_lexicon(tsv_path, 300, seed=5, format="tsv") == 300
+    assert write_lexicon(jsonl_path, 300, seed=5, format="jsonl") == 300
+
+    tsv_entries = read_tsv(tsv_path)
+    assert tsv_entries == read_jsonl(jsonl_path)
+    assert tsv_entries == list(iter_lexicon_entries(300, seed=5))
+
+    lexicon = DialectAwareLexicon.from_path(tsv_path)
+    assert lexicon.lookup_ipa(tsv_entries[0].lemma) == tsv_entries[0].ipa
+
+
+def test_metadata_is_processable(tmp_path: Path) -> None:
+    metadata = tmp_path / "metadata.csv"
+    words = tmp_path / "words.txt"
+    write_metadata(metadata, 25, seed=1, vocabulary_size=200, dialect_column=True)
+    write_wordlist(words, 10, seed=1, with_counts=True)
+
+    rows = metadata.read_text(encoding="utf-8").splitlines()
+    assert len(rows) == 25
+    assert all(len(row.split("|")) == 4 for row in rows)
+
+    out = tmp_path / "out.csv"
+    PipelineService().process_csv(str(metadata), str(out), dialect_column=3)
+    assert len(out.read_text(encoding="utf-8").splitlines()) == 25
+    assert len(words.read_text(encoding="utf-8").splitlines()[0].split("\t")) == 2